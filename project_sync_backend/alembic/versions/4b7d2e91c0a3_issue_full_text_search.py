@@ -0,0 +1,35 @@
+"""Issue full-text search: generated tsvector column with GIN index
+
+Revision ID: 4b7d2e91c0a3
+Revises: 8ff6bfc159fe
+Create Date: 2026-10-19 09:12:41.503127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7d2e91c0a3'
+down_revision: Union[str, None] = '8ff6bfc159fe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "ALTER TABLE issues ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+        ") STORED"
+    )
+    op.create_index('ix_issues_search_vector', 'issues', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issues_search_vector', table_name='issues')
+    op.drop_column('issues', 'search_vector')
@@ -0,0 +1,50 @@
+"""Issue events: append-only log of issue transitions
+
+Revision ID: 5e8d14b0a6f2
+Revises: c3a91f5e7d20
+Create Date: 2026-10-19 13:27:52.874310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8d14b0a6f2'
+down_revision: Union[str, None] = 'c3a91f5e7d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('issue_events',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('issue_id', sa.Uuid(), nullable=False),
+        sa.Column('project_id', sa.Uuid(), nullable=False),
+        sa.Column('event_type', sa.Enum('CREATED', 'ASSIGNED', 'STATUS_CHANGED', name='issueeventtype'), nullable=False),
+        # issuestatus already exists (created with the issues table)
+        sa.Column('from_status', postgresql.ENUM(name='issuestatus', create_type=False), nullable=True),
+        sa.Column('to_status', postgresql.ENUM(name='issuestatus', create_type=False), nullable=True),
+        sa.Column('actor_id', sa.Uuid(), nullable=False),
+        sa.Column('assignee_id', sa.Uuid(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('issue_events', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_issue_events_issue_id'), ['issue_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_issue_events_project_id'), ['project_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_issue_events_created_at'), ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('issue_events', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_issue_events_created_at'))
+        batch_op.drop_index(batch_op.f('ix_issue_events_project_id'))
+        batch_op.drop_index(batch_op.f('ix_issue_events_issue_id'))
+    op.drop_table('issue_events')
+    sa.Enum(name='issueeventtype').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,50 @@
+"""Dashboard rollups: daily issue counts and time-in-status per project
+
+Revision ID: 9a2c6e4f1b87
+Revises: 5e8d14b0a6f2
+Create Date: 2026-10-19 15:02:36.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a2c6e4f1b87'
+down_revision: Union[str, None] = '5e8d14b0a6f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('issue_daily_rollups',
+        sa.Column('project_id', sa.Uuid(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('opened', sa.Integer(), nullable=False),
+        sa.Column('assigned', sa.Integer(), nullable=False),
+        sa.Column('completed', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('project_id', 'day')
+    )
+    op.create_table('status_duration_rollups',
+        sa.Column('project_id', sa.Uuid(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='issuestatus', create_type=False), nullable=False),
+        sa.Column('total_seconds', sa.Float(), nullable=False),
+        sa.Column('transitions', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('project_id', 'day', 'status')
+    )
+    # Cross-project trend queries filter on day alone
+    op.create_index('ix_issue_daily_rollups_day', 'issue_daily_rollups', ['day'], unique=False)
+    op.create_index('ix_status_duration_rollups_day', 'status_duration_rollups', ['day'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_status_duration_rollups_day', table_name='status_duration_rollups')
+    op.drop_index('ix_issue_daily_rollups_day', table_name='issue_daily_rollups')
+    op.drop_table('status_duration_rollups')
+    op.drop_table('issue_daily_rollups')
@@ -0,0 +1,28 @@
+"""Board index on issue_list_view (project_id, status, created_at, id)
+
+Revision ID: a6e09d3c7b15
+Revises: f4c2a8d61e93
+Create Date: 2026-10-19 21:10:52.660184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6e09d3c7b15'
+down_revision: Union[str, None] = 'f4c2a8d61e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_issue_list_view_board', 'issue_list_view', ['project_id', 'status', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issue_list_view_board', table_name='issue_list_view')
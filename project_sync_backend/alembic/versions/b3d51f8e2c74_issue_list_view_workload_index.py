@@ -0,0 +1,28 @@
+"""Workload index on issue_list_view (assigned_to_id, status, created_at)
+
+Revision ID: b3d51f8e2c74
+Revises: a6e09d3c7b15
+Create Date: 2026-10-19 21:48:26.307915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d51f8e2c74'
+down_revision: Union[str, None] = 'a6e09d3c7b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_issue_list_view_workload', 'issue_list_view', ['assigned_to_id', 'status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issue_list_view_workload', table_name='issue_list_view')
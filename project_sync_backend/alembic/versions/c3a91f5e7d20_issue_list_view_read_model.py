@@ -0,0 +1,69 @@
+"""Issue list read model: denormalized issue_list_view table
+
+Revision ID: c3a91f5e7d20
+Revises: 4b7d2e91c0a3
+Create Date: 2026-10-19 11:04:17.226931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a91f5e7d20'
+down_revision: Union[str, None] = '4b7d2e91c0a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The enum types already exist (created with the issues table)
+    op.create_table('issue_list_view',
+        sa.Column('title', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column('description', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column('priority', postgresql.ENUM(name='issuepriority', create_type=False), nullable=False),
+        sa.Column('issue_type', postgresql.ENUM(name='issuetype', create_type=False), nullable=False),
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='issuestatus', create_type=False), nullable=False),
+        sa.Column('project_id', sa.Uuid(), nullable=False),
+        sa.Column('assigned_to_id', sa.Uuid(), nullable=True),
+        sa.Column('created_by_id', sa.Uuid(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('project_title', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+        sa.Column('assignee_name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True),
+        sa.Column('creator_name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('issue_list_view', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_issue_list_view_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_issue_list_view_project_id'), ['project_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_issue_list_view_assigned_to_id'), ['assigned_to_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_issue_list_view_created_by_id'), ['created_by_id'], unique=False)
+
+    op.execute(
+        "INSERT INTO issue_list_view ("
+        "title, description, priority, issue_type, id, status, project_id, assigned_to_id, "
+        "created_by_id, created_at, updated_at, project_title, assignee_name, creator_name) "
+        "SELECT i.title, i.description, i.priority, i.issue_type, i.id, i.status, i.project_id, "
+        "i.assigned_to_id, i.created_by_id, i.created_at, i.updated_at, p.title, a.username, c.username "
+        "FROM issues i "
+        "LEFT JOIN projects p ON p.id = i.project_id "
+        "LEFT JOIN users a ON a.id = i.assigned_to_id "
+        "LEFT JOIN users c ON c.id = i.created_by_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('issue_list_view', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_issue_list_view_created_by_id'))
+        batch_op.drop_index(batch_op.f('ix_issue_list_view_assigned_to_id'))
+        batch_op.drop_index(batch_op.f('ix_issue_list_view_project_id'))
+        batch_op.drop_index(batch_op.f('ix_issue_list_view_status'))
+    op.drop_table('issue_list_view')
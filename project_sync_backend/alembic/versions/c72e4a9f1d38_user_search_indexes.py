@@ -0,0 +1,42 @@
+"""User search: pg_trgm and prefix indexes on lower(username) / lower(email)
+
+Revision ID: c72e4a9f1d38
+Revises: b3d51f8e2c74
+Create Date: 2026-10-19 22:31:05.871442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c72e4a9f1d38'
+down_revision: Union[str, None] = 'b3d51f8e2c74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        # text_pattern_ops serves LIKE 'prefix%' regardless of collation
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_username_prefix ON users (lower(username) text_pattern_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_email_prefix ON users (lower(email) text_pattern_ops)")
+        # Trigram indexes serve LIKE '%substring%'
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_username_trgm ON users USING gin (lower(username) gin_trgm_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING gin (lower(email) gin_trgm_ops)")
+    elif dialect == "sqlite":
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_username_lower ON users (lower(username))")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email))")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # pg_trgm is left installed; other objects may depend on it
+    for name in ("ix_users_username_prefix", "ix_users_email_prefix", "ix_users_username_trgm",
+                 "ix_users_email_trgm", "ix_users_username_lower", "ix_users_email_lower"):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,58 @@
+"""Issues archive: table for completed issues moved out of issues
+
+Revision ID: d7f3b8a2e514
+Revises: 9a2c6e4f1b87
+Create Date: 2026-10-19 16:40:09.551732
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f3b8a2e514'
+down_revision: Union[str, None] = '9a2c6e4f1b87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('issues_archive',
+        sa.Column('title', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column('description', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column('priority', postgresql.ENUM(name='issuepriority', create_type=False), nullable=False),
+        sa.Column('issue_type', postgresql.ENUM(name='issuetype', create_type=False), nullable=False),
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='issuestatus', create_type=False), nullable=False),
+        sa.Column('project_id', sa.Uuid(), nullable=False),
+        sa.Column('assigned_to_id', sa.Uuid(), nullable=True),
+        sa.Column('created_by_id', sa.Uuid(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('project_title', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+        sa.Column('assignee_name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True),
+        sa.Column('creator_name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('issues_archive', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_issues_archive_project_id'), ['project_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_issues_archive_assigned_to_id'), ['assigned_to_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_issues_archive_created_by_id'), ['created_by_id'], unique=False)
+    # Lets the archive job find its next batch without scanning every issue
+    op.execute("CREATE INDEX ix_issues_completed_updated_at ON issues (updated_at) WHERE status = 'COMPLETED'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_issues_completed_updated_at")
+    with op.batch_alter_table('issues_archive', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_issues_archive_created_by_id'))
+        batch_op.drop_index(batch_op.f('ix_issues_archive_assigned_to_id'))
+        batch_op.drop_index(batch_op.f('ix_issues_archive_project_id'))
+    op.drop_table('issues_archive')
@@ -0,0 +1,43 @@
+"""Idempotency keys: stored responses for retried POST requests
+
+Revision ID: e1b49c7a3d65
+Revises: d7f3b8a2e514
+Create Date: 2026-10-19 18:15:44.092817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b49c7a3d65'
+down_revision: Union[str, None] = 'd7f3b8a2e514'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('idempotency_keys',
+        sa.Column('key_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        sa.Column('scope', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+        sa.Column('request_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=False),
+        sa.Column('response_body', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('key_hash')
+    )
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_idempotency_keys_expires_at'), ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_idempotency_keys_expires_at'))
+    op.drop_table('idempotency_keys')
@@ -0,0 +1,89 @@
+"""Optional hash partitioning of issues by project_id
+
+Revision ID: f4c2a8d61e93
+Revises: e1b49c7a3d65
+Create Date: 2026-10-19 20:02:37.418650
+
+Opt-in, PostgreSQL only: the layout is only created when the number of
+partitions is passed explicitly, and the downgrade needs the same option:
+
+    alembic -x issue_partitions=8 upgrade head
+    alembic -x issue_partitions=8 downgrade e1b49c7a3d65
+
+Without it both directions change nothing. The upgrade copies issues
+while holding a lock on the table; large installations can move over
+online with the partition-issues command instead (prepare, backfill,
+swap, and unpartition to go back).
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c2a8d61e93'
+down_revision: Union[str, None] = 'e1b49c7a3d65'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Writable columns of issues at this revision (search_vector is generated)
+COLUMNS = (
+    "title, description, priority, issue_type, id, status, project_id, "
+    "assigned_to_id, created_by_id, created_at, updated_at"
+)
+
+
+def _partitions():
+    """Partition count from ``-x issue_partitions=N``, or 0 when not opted in"""
+    partitions = int(context.get_x_argument(as_dictionary=True).get("issue_partitions", 0))
+    if partitions and op.get_bind().dialect.name != "postgresql":
+        raise ValueError("issue_partitions is only supported on PostgreSQL")
+    return partitions
+
+
+def _issues_partitioned():
+    return op.get_bind().exec_driver_sql(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = 'issues' AND c.relnamespace = current_schema()::regnamespace)"
+    ).scalar()
+
+
+def _replace_issues(new_table, primary_key):
+    """Copy issues into ``new_table``, put it in place and recreate the keys and indexes of this revision"""
+    op.execute(f"INSERT INTO {new_table} ({COLUMNS}) SELECT {COLUMNS} FROM issues")
+    op.execute("DROP TABLE issues")
+    op.execute(f"ALTER TABLE {new_table} RENAME TO issues")
+    op.execute(f"ALTER TABLE issues ADD CONSTRAINT issues_pkey PRIMARY KEY ({primary_key})")
+    op.execute("ALTER TABLE issues ADD CONSTRAINT issues_assigned_to_id_fkey FOREIGN KEY (assigned_to_id) REFERENCES users (id)")
+    op.execute("ALTER TABLE issues ADD CONSTRAINT issues_created_by_id_fkey FOREIGN KEY (created_by_id) REFERENCES users (id)")
+    op.execute("ALTER TABLE issues ADD CONSTRAINT issues_project_id_fkey FOREIGN KEY (project_id) REFERENCES projects (id)")
+    op.execute("CREATE INDEX ix_issues_search_vector ON issues USING gin (search_vector)")
+    op.execute("CREATE INDEX ix_issues_completed_updated_at ON issues (updated_at) WHERE status = 'COMPLETED'")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    partitions = _partitions()
+    if not partitions or _issues_partitioned():
+        return
+    op.execute("LOCK TABLE issues IN ACCESS EXCLUSIVE MODE")
+    op.execute(
+        "CREATE TABLE issues_hashed (LIKE issues INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS) "
+        "PARTITION BY HASH (project_id)"
+    )
+    for remainder in range(partitions):
+        op.execute(
+            f"CREATE TABLE issues_p{remainder} PARTITION OF issues_hashed "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        )
+    # Unique constraints on a partitioned table must include the partition key
+    _replace_issues("issues_hashed", "id, project_id")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _partitions() or not _issues_partitioned():
+        return
+    op.execute("LOCK TABLE issues IN ACCESS EXCLUSIVE MODE")
+    op.execute("CREATE TABLE issues_plain (LIKE issues INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS)")
+    _replace_issues("issues_plain", "id")
@@ -1,42 +1,85 @@
-from fastapi import Depends, HTTPException, status
+from typing import Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session, select
 from jose import JWTError, jwt
-from project_sync_backend.app.db.database import get_session
+from project_sync_backend.app.db.database import get_session, get_routed_read_session, session_router
 from project_sync_backend.app.models.user import User, UserRole, TokenData
 from project_sync_backend.app.core.config import settings
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: Session = Depends(get_session)
-):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+def decode_token_subject(token: str) -> Optional[str]:
+    """Return the email a token was issued for, or None if it is invalid"""
     try:
-        payload = jwt.decode(credentials.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email)
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except JWTError:
-        raise credentials_exception
-    
+        return None
+    return payload.get("sub")
+
+def get_token_subject(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    email = decode_token_subject(credentials.credentials)
+    if email is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return email
+
+def _lookup_user(session: Session, email: str) -> User:
+    token_data = TokenData(email=email)
     statement = select(User).where(User.email == token_data.email)
     user = session.exec(statement).first()
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
+def get_current_user(
+    request: Request,
+    email: str = Depends(get_token_subject),
+    session: Session = Depends(get_session)
+):
+    user = _lookup_user(session, email)
+    # Writes pin the user's following reads to the primary (read-your-writes)
+    is_write = request.method not in SAFE_METHODS
+    if is_write:
+        session_router.note_write(email)
+    yield user
+    if is_write:
+        session_router.note_write(email)
+
 def get_current_pm(current_user: User = Depends(get_current_user)):
     if current_user.role != UserRole.PM:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only Project Managers can perform this action"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+def get_read_session(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)):
+    """Session for GET handlers: the read replica, or the primary if the caller wrote recently"""
+    email = decode_token_subject(credentials.credentials) if credentials else None
+    yield from get_routed_read_session(email)
+
+def get_current_reader(
+    email: str = Depends(get_token_subject),
+    session: Session = Depends(get_read_session)
+):
+    """Like get_current_user, but resolved on the routed read session"""
+    return _lookup_user(session, email)
+
+def get_current_pm_reader(current_user: User = Depends(get_current_reader)):
+    if current_user.role != UserRole.PM:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only Project Managers can perform this action"
+        )
+    return current_user
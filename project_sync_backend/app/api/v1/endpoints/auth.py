@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func
 from sqlmodel import Session, select
 from passlib.context import CryptContext
 from jose import jwt
 from datetime import datetime, timedelta
 from project_sync_backend.app.db.database import get_session
+from project_sync_backend.app.db.pipeline import run_pipelined
+from project_sync_backend.app.services.user_search import search_users, user_search_cache
 from project_sync_backend.app.models.user import User, UserRole, UserCreate, UserResponse, UserLogin, Token
 from project_sync_backend.app.core.config import settings
-from project_sync_backend.app.api.dependencies import get_current_user,get_current_pm,get_session
+from project_sync_backend.app.api.dependencies import get_current_user,get_current_pm,get_session,get_read_session,get_current_pm_reader
 
 router = APIRouter()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -29,32 +32,30 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
 
 @router.post("/register", response_model=UserResponse)
 def register_user(user: UserCreate, session: Session = Depends(get_session)):
+    # The checks below are independent: one round trip on psycopg 3 (pipeline mode)
+    email_taken, username_taken, pm_exists, [(user_count,)] = run_pipelined(session, [
+        select(User.id).where(User.email == user.email).limit(1),
+        select(User.id).where(User.username == user.username).limit(1),
+        #check if PM already exists 
+        select(User.id).where(User.role == UserRole.PM).limit(1),
+        # Check if this is the first user (make them PM)
+        select(func.count()).select_from(User),
+    ])
+    
     # Check if user already exists
-    statement = select(User).where(User.email == user.email)
-    db_user = session.exec(statement).first()
-    if db_user:
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Check if username already exists
-    statement = select(User).where(User.username == user.username)
-    db_user = session.exec(statement).first()
-    if db_user:
+    if username_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
     
-    # Check if this is the first user (make them PM)
-    statement = select(User)
-    users = session.exec(statement).all()
-    user_count = len(users)
-    #check if PM already exists 
-    pm_exists = session.query(User).filter(User.role == UserRole.PM).first()
-    user_count = session.query(User).count()
-    
     # If no users exist, assign PM role automatically
     if user_count == 0:
         role = UserRole.PM
@@ -82,6 +83,8 @@ def register_user(user: UserCreate, session: Session = Depends(get_session)):
     session.add(db_user)
     session.commit()
     session.refresh(db_user)
+    # Cached search results would miss the new user until they expire
+    user_search_cache.clear()
     return db_user
 
 @router.post("/login", response_model=Token)
@@ -109,10 +112,20 @@ def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 @router.get("/users", response_model=list[UserResponse])
 def get_all_users(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_pm)
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_pm_reader)
 ):
     """Get all users - PM only"""
     statement = select(User).where(User.is_active == True)
     users = session.exec(statement).all()
-    return users
\ No newline at end of file
+    return users
+
+@router.get("/users/search", response_model=list[UserResponse])
+def search_users_endpoint(
+    q: str = Query(..., min_length=1, max_length=100, description="Start (or, from 3 characters, part) of a username or email"),
+    limit: int = Query(default=settings.USER_SEARCH_MAX_RESULTS, ge=1, le=50),
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_pm_reader)
+):
+    """Find active users for the assignee picker - PM only"""
+    return search_users(session, q, limit)
\ No newline at end of file
@@ -1,36 +1,72 @@
-from fastapi import APIRouter, Depends
+from datetime import date, datetime, timedelta
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from project_sync_backend.app.db.database import get_session
+from sqlalchemy import desc, func, select
+from project_sync_backend.app.db.pipeline import run_pipelined
+from project_sync_backend.app.api.dependencies import get_read_session, get_current_reader
+from project_sync_backend.app.services.rollups import issue_trends, time_in_status
+from project_sync_backend.app.services.change_markers import issue_scope_marker, project_scope_marker
+from project_sync_backend.app.core.etag import make_etag, conditional_response
 from project_sync_backend.app.models.projects import Project
-from project_sync_backend.app.models.issue import Issue, IssueStatus, IssuePriority
+from project_sync_backend.app.models.issue import Issue, IssueArchive, IssueStatus, IssuePriority
+from project_sync_backend.app.models.user import User
 
 router = APIRouter()
 
 @router.get("/dashboard/stats")
-def get_dashboard_stats(session: Session = Depends(get_session)):
-    total_projects = session.query(Project).count()
-    total_issues = session.query(Issue).count()
-    open_issues = session.query(Issue).filter(Issue.status == IssueStatus.OPEN).count()
-    completed_issues = session.query(Issue).filter(Issue.status == IssueStatus.COMPLETED).count()
-    high_priority_issues = session.query(Issue).filter(Issue.priority == IssuePriority.HIGH).count()
-    recent_issues = session.query(Issue).order_by(desc(Issue.created_at)).limit(5).all()
-    recent_projects = session.query(Project).order_by(desc(Project.created_at)).limit(5).all()
+def get_dashboard_stats(request: Request, response: Response, session: Session = Depends(get_read_session)):
+    etag = make_etag("dashboard", issue_scope_marker(session), project_scope_marker(session))
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    # Independent queries: one round trip on psycopg 3 (pipeline mode)
+    (
+        [(total_projects,)],
+        # Archived issues are completed issues moved out of the issues table
+        [(archived_issues,)],
+        [(total_issues,)],
+        [(open_issues,)],
+        [(completed_issues,)],
+        [(high_priority_issues,)],
+        [(archived_high_priority_issues,)],
+        recent_issues,
+        recent_projects,
+    ) = run_pipelined(session, [
+        select(func.count()).select_from(Project),
+        select(func.count()).select_from(IssueArchive),
+        select(func.count()).select_from(Issue),
+        select(func.count()).select_from(Issue).where(Issue.status == IssueStatus.OPEN),
+        select(func.count()).select_from(Issue).where(Issue.status == IssueStatus.COMPLETED),
+        select(func.count()).select_from(Issue).where(Issue.priority == IssuePriority.HIGH),
+        select(func.count()).select_from(IssueArchive).where(IssueArchive.priority == IssuePriority.HIGH),
+        select(Issue.id, Issue.title, Issue.status, Issue.priority, Issue.created_at)
+        .order_by(desc(Issue.created_at)).limit(5),
+        select(Project.id, Project.created_at).order_by(desc(Project.created_at)).limit(5),
+    ])
+    total_issues += archived_issues
+    completed_issues += archived_issues
+    high_priority_issues += archived_high_priority_issues
 
     def issue_to_dict(issue):
+        issue_id, title, issue_status, priority, created_at = issue
         return {
-            "id": issue.id,
-            "title": getattr(issue, "title", None),
-            "status": getattr(issue, "status", None),
-            "priority": getattr(issue, "priority", None),
-            "created_at": getattr(issue, "created_at", None)
+            "id": issue_id,
+            "title": title,
+            "status": issue_status,
+            "priority": priority,
+            "created_at": created_at
         }
 
     def project_to_dict(project):
+        project_id, created_at = project
+        # Projects have a title, not a name; the key is kept for existing clients
         return {
-            "id": project.id,
-            "name": getattr(project, "name", None),
-            "created_at": getattr(project, "created_at", None)
+            "id": project_id,
+            "name": None,
+            "created_at": created_at
         }
 
     return {
@@ -42,3 +78,49 @@ def get_dashboard_stats(session: Session = Depends(get_session)):
         "recentIssues": [issue_to_dict(i) for i in recent_issues],
         "recentProjects": [project_to_dict(p) for p in recent_projects]
     }
+
+
+def _rollup_range(start: Optional[date], end: Optional[date], default_days: int = 90):
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=default_days - 1)
+    if start > end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start must not be after end")
+    if (end - start).days > 731:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Date range is limited to two years")
+    return start, end
+
+@router.get("/dashboard/trends")
+def get_dashboard_trends(
+    interval: str = Query(default="day", pattern="^(day|week)$"),
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    project_id: Optional[UUID] = None,
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_reader)
+):
+    """Issues opened, assigned and completed per day or week, served from the daily rollups"""
+    start, end = _rollup_range(start, end)
+    return {
+        "interval": interval,
+        "start": start,
+        "end": end,
+        "projectId": project_id,
+        "series": issue_trends(session, start, end, interval, project_id),
+    }
+
+@router.get("/dashboard/time-in-status")
+def get_time_in_status(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    project_id: Optional[UUID] = None,
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_reader)
+):
+    """Average time issues spent in each status before moving on"""
+    start, end = _rollup_range(start, end)
+    return {
+        "start": start,
+        "end": end,
+        "projectId": project_id,
+        "statuses": time_in_status(session, start, end, project_id),
+    }
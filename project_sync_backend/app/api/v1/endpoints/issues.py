@@ -1,172 +1,158 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import union_all
 from sqlmodel import Session, select
-from typing import List
-from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
 from project_sync_backend.app.db.database import get_session
-from project_sync_backend.app.models.issue import Issue, IssueStatus, IssueCreate, IssueResponse, IssueAssign, IssueStatusUpdate, IssueWithDetails
-from project_sync_backend.app.models.user import User, UserRole
-from project_sync_backend.app.models.projects import Project
-from project_sync_backend.app.api.dependencies import get_current_user, get_current_pm
+from project_sync_backend.app.models.issue import Issue, IssueListView, IssueArchive, IssueStatus, IssueCreate, IssueResponse, IssueAssign, IssueStatusUpdate, IssueWithDetails, IssueSearchResult, IssueSearchPage, IssueBatch
+from project_sync_backend.app.models.user import User
+from project_sync_backend.app.services.search import search_issues
+from project_sync_backend.app.services.read_model import visible_to, issue_list_row
+from project_sync_backend.app.services.mutations import apply_create_issue, apply_assign_issue, apply_issue_status
+from project_sync_backend.app.services.idempotency import start_idempotent, commit_idempotent
+from project_sync_backend.app.services.group_commit import issue_create_batcher
+from project_sync_backend.app.services.change_markers import issue_scope_marker, project_scope_marker
+from project_sync_backend.app.core.batch import parse_ids, keyed_results
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.etag import make_etag, conditional_response
+from project_sync_backend.app.core.fieldsets import parse_fields
+from project_sync_backend.app.api.dependencies import get_current_user, get_current_pm, get_read_session, get_current_reader, get_current_pm_reader
 
 router = APIRouter()
 
+ISSUE_LIST_FIELDS = list(IssueWithDetails.model_fields)
+
+def _issue_list_statement(field_names, criteria=lambda model: [], include_archived=False):
+    """SELECT of the given IssueWithDetails fields from the denormalized issue_list_view.
+
+    ``criteria(model)`` returns the filters for a table; with
+    ``include_archived`` the same SELECT over issues_archive is UNION ALLed on.
+    """
+    def list_select(model):
+        return select(*[getattr(model, name).label(name) for name in field_names]).where(*criteria(model))
+    if include_archived:
+        return union_all(list_select(IssueListView), list_select(IssueArchive))
+    return list_select(IssueListView)
+
+
 @router.post("/", response_model=IssueResponse)
 def create_issue(
     issue: IssueCreate,
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key", max_length=255),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    # Verify project exists
-    project_statement = select(Project).where(Project.id == issue.project_id)
-    project = session.exec(project_statement).first()
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
+    if settings.GROUP_COMMIT_ENABLED and not idempotency_key:
+        # Shares one INSERT and commit with concurrent creations. The batch
+        # writes on its own connection, so give this one back while waiting.
+        session.close()
+        return issue_create_batcher.create(current_user.id, issue)
     
-    db_issue = Issue(
-        title=issue.title,
-        description=issue.description,
-        priority=issue.priority,
-        issue_type=issue.issue_type,
-        project_id=issue.project_id,
-        created_by_id=current_user.id,
-        status=IssueStatus.OPEN  # Always starts as OPEN
-    )
-    session.add(db_issue)
-    session.commit()
+    # A retried request gets the original response back instead of a duplicate
+    idempotent = start_idempotent(session, current_user.id, "create_issue", idempotency_key, issue)
+    if idempotent and idempotent.replay:
+        return idempotent.replay
+    
+    db_issue = apply_create_issue(session, current_user, issue)
+    replay = commit_idempotent(session, idempotent, IssueResponse.model_validate(db_issue))
+    if replay:
+        return replay
     session.refresh(db_issue)
     return db_issue
 
 @router.get("/", response_model=List[IssueWithDetails])
 def get_issues(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(default=None, description="Comma separated subset of IssueWithDetails fields"),
+    include_archived: bool = Query(default=False, description="Also list completed issues moved to the archive"),
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_reader)
 ):
-    if current_user.role == UserRole.PM:
-        # PM can see all issues
-        statement = select(Issue)
-    else:
-        # Others see only their assigned issues
-        statement = select(Issue).where(Issue.assigned_to_id == current_user.id)
+    field_names = parse_fields(fields, ISSUE_LIST_FIELDS)
+    
+    # Project titles are part of each row, so project changes count too.
+    # Archiving deletes from issues, so the issue marker covers the archive as well.
+    etag = make_etag("issues", current_user.id, fields, include_archived,
+                     issue_scope_marker(session, *visible_to(Issue, current_user)), project_scope_marker(session))
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
     
-    issues = session.exec(statement).all()
+    statement = _issue_list_statement(
+        field_names or ISSUE_LIST_FIELDS,
+        lambda model: visible_to(model, current_user),
+        include_archived=include_archived
+    )
+    rows = [issue_list_row(row) for row in session.exec(statement).mappings()]
     
-    result = []
-    for issue in issues:
-        # Get project info
-        project_statement = select(Project).where(Project.id == issue.project_id)
-        project = session.exec(project_statement).first()
-        
-        # Get assignee info
-        assignee = None
-        if issue.assigned_to_id:
-            assignee_statement = select(User).where(User.id == issue.assigned_to_id)
-            assignee = session.exec(assignee_statement).first()
-        
-        # Get creator info
-        creator_statement = select(User).where(User.id == issue.created_by_id)
-        creator = session.exec(creator_statement).first()
-        
-        issue_detail = IssueWithDetails(
+    if field_names:
+        return JSONResponse(content=jsonable_encoder(rows), headers=dict(response.headers))
+    return [IssueWithDetails(**row) for row in rows]
+
+@router.get("/search", response_model=IssueSearchPage)
+def search(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0, le=10000),
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_reader)
+):
+    """Full-text search over issue titles and descriptions, with prefix matching"""
+    rows, has_more = search_issues(session, current_user, q, limit, offset)
+    items = [
+        IssueSearchResult(
             **issue.model_dump(),
-            project_title=project.title if project else "Unknown",
-            assignee_name=assignee.username if assignee else None,
-            creator_name=creator.username if creator else "Unknown"
+            project_title=project_title or "Unknown",
+            assignee_name=assignee_name,
+            creator_name=creator_name or "Unknown",
+            rank=rank
         )
-        result.append(issue_detail)
-    
-    return result
+        for issue, project_title, assignee_name, creator_name, rank in rows
+    ]
+    return IssueSearchPage(items=items, limit=limit, offset=offset, has_more=has_more)
+
+@router.get("/batch", response_model=IssueBatch)
+def get_issues_batch(
+    ids: str = Query(..., description="Comma separated issue ids"),
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_reader)
+):
+    """Look up many issues by id (archived ones included), scoped like the issue list"""
+    issue_ids = parse_ids(ids)
+    statement = _issue_list_statement(
+        ISSUE_LIST_FIELDS,
+        lambda model: [model.id.in_(issue_ids), *visible_to(model, current_user)],
+        include_archived=True
+    )
+    found = {
+        row["id"]: IssueWithDetails(**issue_list_row(row))
+        for row in session.exec(statement).mappings()
+    }
+    return keyed_results(issue_ids, found)
 
 @router.put("/{issue_id}/assign", response_model=IssueResponse)
 def assign_issue(
-    issue_id: str,
+    issue_id: UUID,
     assignment: IssueAssign,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_pm)
 ):
-    # Get issue
-    issue_statement = select(Issue).where(Issue.id == issue_id)
-    issue = session.exec(issue_statement).first()
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found"
-        )
-    
-    # Verify assignee exists
-    assignee_statement = select(User).where(User.id == assignment.assigned_to_id)
-    assignee = session.exec(assignee_statement).first()
-    if not assignee:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    issue.assigned_to_id = assignment.assigned_to_id
-    issue.status = IssueStatus.ASSIGNED
-    issue.updated_at = datetime.utcnow()
-    
+    issue = apply_assign_issue(session, current_user, issue_id, assignment)
     session.commit()
     session.refresh(issue)
     return issue
 
 @router.put("/{issue_id}/status", response_model=IssueResponse)
 def update_issue_status(
-    issue_id: str,
+    issue_id: UUID,
     status_update: IssueStatusUpdate,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    issue_statement = select(Issue).where(Issue.id == issue_id)
-    issue = session.exec(issue_statement).first()
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found"
-        )
-    
-    # Permission checks
-    if current_user.role != UserRole.PM:
-        # Non-PM users can only update their assigned issues
-        if issue.assigned_to_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You can only update issues assigned to you"
-            )
-        
-        # Non-PM users cannot mark as COMPLETED
-        if status_update.status == IssueStatus.COMPLETED:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only Project Manager can mark issues as completed"
-            )
-        
-        # Non-PM users cannot work on OPEN issues
-        if issue.status == IssueStatus.OPEN:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="This issue must be assigned by PM before you can work on it"
-            )
-    
-    # Status transition validation for non-PM users
-    if current_user.role != UserRole.PM:
-        valid_transitions = {
-            IssueStatus.ASSIGNED: [IssueStatus.IN_PROGRESS],
-            IssueStatus.IN_PROGRESS: [IssueStatus.REVIEW, IssueStatus.ASSIGNED],
-            IssueStatus.REVIEW: [IssueStatus.IN_PROGRESS],  # Can go back to in progress
-        }
-        
-        if issue.status not in valid_transitions or status_update.status not in valid_transitions[issue.status]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status transition from {issue.status} to {status_update.status}"
-            )
-    
-    issue.status = status_update.status
-    issue.updated_at = datetime.utcnow()
-    
+    issue = apply_issue_status(session, current_user, issue_id, status_update)
     session.commit()
     session.refresh(issue)
     return issue
@@ -174,68 +160,24 @@ def update_issue_status(
 
 @router.get("/my-issues", response_model=List[IssueWithDetails])
 def get_my_issues(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    include_archived: bool = Query(default=False, description="Also list completed issues moved to the archive"),
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_reader)
 ):
-    statement = select(Issue).where(Issue.created_by_id == current_user.id)
-    issues = session.exec(statement).all()
-    
-    result = []
-    for issue in issues:
-        # Get project info
-        project = session.exec(
-            select(Project).where(Project.id == issue.project_id)
-        ).first()
-        
-        # Get assignee info (if assigned)
-        assignee_name = None
-        if issue.assigned_to_id:
-            assignee = session.exec(
-                select(User).where(User.id == issue.assigned_to_id)
-            ).first()
-            assignee_name = assignee.username if assignee else None
-
-        # Get creator info
-        creator = session.exec(
-            select(User).where(User.id == issue.created_by_id)
-        ).first()
-        
-        issue_detail = IssueWithDetails(
-            **issue.model_dump(),
-            project_title=project.title if project else "Unknown",
-            assignee_name=assignee_name,
-            creator_name=creator.username if creator else "Unknown"
-        )
-        result.append(issue_detail)
-    
-    return result
+    statement = _issue_list_statement(
+        ISSUE_LIST_FIELDS,
+        lambda model: [model.created_by_id == current_user.id],
+        include_archived=include_archived
+    )
+    return [IssueWithDetails(**issue_list_row(row)) for row in session.exec(statement).mappings()]
 
 
 @router.get("/open-issues", response_model=List[IssueWithDetails])
 def get_open_issues(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_pm)
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_pm_reader)
 ):
     """Get all open (unassigned) issues - PM only"""
-    statement = select(Issue).where(Issue.status == IssueStatus.OPEN)
-    issues = session.exec(statement).all()
-    
-    result = []
-    for issue in issues:
-        # Get project info
-        project_statement = select(Project).where(Project.id == issue.project_id)
-        project = session.exec(project_statement).first()
-        
-        # Get creator info
-        creator_statement = select(User).where(User.id == issue.created_by_id)
-        creator = session.exec(creator_statement).first()
-        
-        issue_detail = IssueWithDetails(
-            **issue.model_dump(),
-            project_title=project.title if project else "Unknown",
-            assignee_name=None,
-            creator_name=creator.username if creator else "Unknown"
-        )
-        result.append(issue_detail)
-    
-    return result
\ No newline at end of file
+    # Archived issues are all COMPLETED, so the archive never has open ones
+    statement = _issue_list_statement(ISSUE_LIST_FIELDS, lambda model: [model.status == IssueStatus.OPEN])
+    return [IssueWithDetails(**issue_list_row(row)) for row in session.exec(statement).mappings()]
@@ -1,102 +1,208 @@
-# Add missing import for datetime
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import case, func
 from sqlmodel import Session, select
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 from project_sync_backend.app.db.database import get_session
-from project_sync_backend.app.models.projects import Project, ProjectCreate, ProjectResponse, ProjectWithIssues
-from project_sync_backend.app.models.issue import Issue
+from project_sync_backend.app.models.projects import Project, ProjectCreate, ProjectResponse, ProjectWithIssues, ProjectBatch
+from project_sync_backend.app.models.issue import Issue, IssueArchive, IssueListView, IssueStatus, ProjectBoard
 from project_sync_backend.app.models.user import User
-from project_sync_backend.app.api.dependencies import get_current_user, get_current_pm
+from project_sync_backend.app.services.mutations import apply_update_project
+from project_sync_backend.app.services.board import load_board
+from project_sync_backend.app.services.read_model import visible_to
+from project_sync_backend.app.services.idempotency import start_idempotent, commit_idempotent
+from project_sync_backend.app.services.change_markers import issue_scope_marker, project_scope_marker
+from project_sync_backend.app.services.response_cache import project_response_cache, reads_primary
+from project_sync_backend.app.core.batch import parse_ids, keyed_results
+from project_sync_backend.app.core.cursors import decode_cursor
+from project_sync_backend.app.core.etag import make_etag, conditional_response
+from project_sync_backend.app.core.fieldsets import parse_fields
+from project_sync_backend.app.api.dependencies import get_current_pm, get_read_session, get_current_reader
 
 router = APIRouter()
 
+PROJECT_LIST_FIELDS = list(ProjectWithIssues.model_fields)
+PROJECT_COUNT_FIELDS = ("issues_count", "open_issues", "completed_issues")
+
+def _project_list_statement(field_names):
+    """SELECT of the given ProjectWithIssues fields; issue counts come from grouped subqueries
+    over issues and issues_archive (archived issues are all completed)"""
+    columns = {name: getattr(Project, name) for name in ProjectResponse.model_fields}
+    columns["project_manager_name"] = User.username
+    statement = select(*[
+        columns[name].label(name) for name in field_names if name not in PROJECT_COUNT_FIELDS
+    ]).select_from(Project)
+    if "project_manager_name" in field_names:
+        statement = statement.join(User, User.id == Project.pm_id, isouter=True)
+    if any(name in PROJECT_COUNT_FIELDS for name in field_names):
+        counts = (
+            select(
+                Issue.project_id,
+                func.count(Issue.id).label("issues_count"),
+                func.sum(case((Issue.status != IssueStatus.COMPLETED, 1), else_=0)).label("open_issues"),
+                func.sum(case((Issue.status == IssueStatus.COMPLETED, 1), else_=0)).label("completed_issues"),
+            )
+            .group_by(Issue.project_id)
+            .subquery()
+        )
+        archived = (
+            select(IssueArchive.project_id, func.count(IssueArchive.id).label("archived"))
+            .group_by(IssueArchive.project_id)
+            .subquery()
+        )
+        archived_count = func.coalesce(archived.c.archived, 0)
+        totals = {
+            "issues_count": func.coalesce(counts.c.issues_count, 0) + archived_count,
+            "open_issues": func.coalesce(counts.c.open_issues, 0),
+            "completed_issues": func.coalesce(counts.c.completed_issues, 0) + archived_count,
+        }
+        statement = (
+            statement
+            .join(counts, counts.c.project_id == Project.id, isouter=True)
+            .join(archived, archived.c.project_id == Project.id, isouter=True)
+            .add_columns(*[totals[name].label(name) for name in PROJECT_COUNT_FIELDS if name in field_names])
+        )
+    return statement
+
+def _project_list_row(row):
+    row = dict(row)
+    if "project_manager_name" in row and row["project_manager_name"] is None:
+        row["project_manager_name"] = "Unknown"
+    return row
+
 @router.post("/", response_model=ProjectResponse)
 def create_project(
     project: ProjectCreate, 
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key", max_length=255),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_pm)
 ):
+    # A retried request gets the original response back instead of a duplicate
+    idempotent = start_idempotent(session, current_user.id, "create_project", idempotency_key, project)
+    if idempotent and idempotent.replay:
+        return idempotent.replay
+    
     db_project = Project(
         title=project.title,
         description=project.description,
         pm_id=current_user.id
     )
     session.add(db_project)
-    session.commit()
+    replay = commit_idempotent(session, idempotent, ProjectResponse.model_validate(db_project))
+    if replay:
+        return replay
     session.refresh(db_project)
     return db_project
 
 @router.get("/", response_model=List[ProjectWithIssues])
 def get_projects(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(default=None, description="Comma separated subset of ProjectWithIssues fields"),
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_reader)
 ):
-    statement = select(Project).where(Project.is_active == True)
-    projects = session.exec(statement).all()
+    field_names = parse_fields(fields, PROJECT_LIST_FIELDS)
     
-    result = []
-    for project in projects:
-        # Get project manager info
-        pm_statement = select(User).where(User.id == project.pm_id)
-        pm = session.exec(pm_statement).first()
-        
-        # Get issues count
-        issues_statement = select(Issue).where(Issue.project_id == project.id)
-        issues = session.exec(issues_statement).all()
-        
-        project_data = ProjectWithIssues(
-            **project.model_dump(),
-            issues_count=len(issues),
-            open_issues=len([i for i in issues if i.status in ["OPEN", "ASSIGNED", "IN_PROGRESS", "REVIEW"]]),
-            completed_issues=len([i for i in issues if i.status == "COMPLETED"]),
-            project_manager_name=pm.username if pm else "Unknown"
-        )
-        result.append(project_data)
+    def load():
+        # The list carries per-project issue counts, so issue changes count too
+        etag = make_etag("projects", fields, project_scope_marker(session), issue_scope_marker(session))
+        statement = _project_list_statement(field_names or PROJECT_LIST_FIELDS).where(Project.is_active == True)
+        rows = [_project_list_row(row) for row in session.exec(statement).mappings()]
+        if not field_names:
+            rows = [ProjectWithIssues(**row) for row in rows]
+        return {"etag": etag, "body": jsonable_encoder(rows)}
     
-    return result
+    cached = project_response_cache.get_or_load(("projects", current_user.role.value, fields), ("projects", "issues"),
+                                                load, settled=reads_primary(session))
+    not_modified = conditional_response(request, response, cached["etag"])
+    if not_modified:
+        return not_modified
+    return JSONResponse(content=cached["body"], headers=dict(response.headers))
+
+@router.get("/batch", response_model=ProjectBatch)
+def get_projects_batch(
+    ids: str = Query(..., description="Comma separated project ids"),
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_reader)
+):
+    """Look up many projects by id; like the project list, only active ones are found"""
+    project_ids = parse_ids(ids)
+    statement = select(Project).where(Project.id.in_(project_ids), Project.is_active == True)
+    found = {project.id: ProjectResponse.model_validate(project) for project in session.exec(statement)}
+    return keyed_results(project_ids, found)
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 def get_project(
-    project_id: str,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    project_id: UUID,
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_reader)
+):
+    def load():
+        statement = select(Project).where(Project.id == project_id)
+        project = session.exec(statement).first()
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
+        etag = make_etag("project", project.id, project.updated_at)
+        return {"etag": etag, "body": jsonable_encoder(ProjectResponse.model_validate(project))}
+    
+    cached = project_response_cache.get_or_load(("project", current_user.role.value, project_id), ("projects",),
+                                                load, settled=reads_primary(session))
+    not_modified = conditional_response(request, response, cached["etag"])
+    if not_modified:
+        return not_modified
+    return JSONResponse(content=cached["body"], headers=dict(response.headers))
+
+@router.get("/{project_id}/board", response_model=ProjectBoard)
+def get_project_board(
+    project_id: UUID,
+    request: Request,
+    response: Response,
+    limit: int = Query(default=20, ge=1, le=100, description="Issues per status column"),
+    status_filter: Optional[IssueStatus] = Query(default=None, alias="status", description="Only this column"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of a column, to load more of it"),
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_reader)
 ):
-    statement = select(Project).where(Project.id == project_id)
-    project = session.exec(statement).first()
+    """Kanban board: the newest issues of each status column plus the column totals"""
+    if cursor and status_filter is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A cursor only applies to one column; pass status as well"
+        )
+    after = decode_cursor(cursor) if cursor else None
+
+    project = session.exec(select(Project).where(Project.id == project_id)).first()
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
-    return project
+    criteria = visible_to(IssueListView, current_user)
+    etag = make_etag("board", project.id, project.updated_at, current_user.id, limit, status_filter, cursor,
+                     issue_scope_marker(session, Issue.project_id == project.id, *visible_to(Issue, current_user)))
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    columns = load_board(session, project.id, criteria, limit, status_filter, after)
+    return ProjectBoard(project_id=project.id, limit=limit, columns=columns)
 
 @router.put("/{project_id}", response_model=ProjectResponse)
 def update_project(
-    project_id: str,
+    project_id: UUID,
     project_update: ProjectCreate,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_pm)
 ):
-    statement = select(Project).where(Project.id == project_id)
-    project = session.exec(statement).first()
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
-    
-    # Only PM who created the project can update it
-    if project.pm_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only update projects you created"
-        )
-    
-    project.title = project_update.title
-    project.description = project_update.description
-    project.updated_at = datetime.utcnow()
-    
+    project = apply_update_project(session, current_user, project_id, project_update)
     session.commit()
     session.refresh(project)
     return project
\ No newline at end of file
@@ -0,0 +1,113 @@
+import json
+import logging
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+from project_sync_backend.app.db.database import get_session
+from project_sync_backend.app.models.issue import IssueResponse
+from project_sync_backend.app.models.projects import ProjectResponse
+from project_sync_backend.app.models.user import User
+from project_sync_backend.app.models.sync import SyncPushRequest, SyncPushResponse, SyncMutationResult
+from project_sync_backend.app.services.mutations import apply_create_issue, apply_assign_issue, apply_issue_status, apply_update_project
+from project_sync_backend.app.services.idempotency import IdempotentRequest, is_key_conflict, load_stored_response, stage_idempotent, response_cache
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.api.dependencies import get_current_user
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+def _apply_mutation(session: Session, current_user: User, mutation):
+    """Run one mutation through the same rules as the REST handlers; returns its response model"""
+    if mutation.type == "create_issue":
+        return IssueResponse.model_validate(apply_create_issue(session, current_user, mutation.payload))
+    if mutation.type == "assign_issue":
+        return IssueResponse.model_validate(apply_assign_issue(session, current_user, mutation.issue_id, mutation.payload))
+    if mutation.type == "update_issue_status":
+        return IssueResponse.model_validate(apply_issue_status(session, current_user, mutation.issue_id, mutation.payload))
+    return ProjectResponse.model_validate(apply_update_project(session, current_user, mutation.project_id, mutation.payload))
+
+def _duplicate(mutation, stored):
+    return SyncMutationResult(
+        client_mutation_id=mutation.client_mutation_id,
+        status="duplicate",
+        status_code=stored.status_code,
+        data=json.loads(stored.body),
+    )
+
+def _rejected(mutation, status_code, detail):
+    return SyncMutationResult(
+        client_mutation_id=mutation.client_mutation_id,
+        status="rejected",
+        status_code=status_code,
+        detail=detail,
+    )
+
+def _push_mutation(session: Session, current_user: User, mutation, staged):
+    # Mutation ids share the Idempotency-Key store, scoped per mutation type
+    request = IdempotentRequest(current_user.id, f"sync:{mutation.type}", mutation.client_mutation_id, mutation)
+    try:
+        stored = load_stored_response(session, request.key_hash)
+        if stored is not None:
+            request.check_matches(stored)
+            return _duplicate(mutation, stored)
+
+        # A savepoint per mutation: a rejected one is undone without touching the rest
+        with session.begin_nested():
+            response = _apply_mutation(session, current_user, mutation)
+            stored = stage_idempotent(session, request, response)
+            session.flush()
+    except HTTPException as e:
+        return _rejected(mutation, e.status_code, e.detail)
+    except IntegrityError as e:
+        # The savepoint is rolled back; the rest of the batch still commits
+        stored = load_stored_response(session, request.key_hash) if is_key_conflict(e) else None
+        if stored is None:
+            logger.warning(f"Sync mutation {mutation.client_mutation_id} violated a constraint: {e.orig}")
+            return _rejected(mutation, status.HTTP_409_CONFLICT, "The mutation conflicts with existing data")
+        # A concurrent push applied the same mutation id first
+        try:
+            request.check_matches(stored)
+        except HTTPException as mismatch:
+            return _rejected(mutation, mismatch.status_code, mismatch.detail)
+        return _duplicate(mutation, stored)
+
+    staged.append((request, stored))
+    return SyncMutationResult(
+        client_mutation_id=mutation.client_mutation_id,
+        status="applied",
+        status_code=stored.status_code,
+        data=json.loads(stored.body),
+    )
+
+@router.post("/push", response_model=SyncPushResponse)
+def push(
+    batch: SyncPushRequest,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Apply an ordered batch of offline mutations in one transaction.
+
+    Each mutation gets its own result; rejected ones do not stop the rest.
+    Mutations already applied by an earlier push (same client mutation id)
+    are reported as duplicates with their original result.
+    """
+    if len(batch.mutations) > settings.SYNC_PUSH_MAX_MUTATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.SYNC_PUSH_MAX_MUTATIONS} mutations can be pushed at once"
+        )
+
+    watermark = datetime.utcnow()
+    staged = []
+    results = [_push_mutation(session, current_user, mutation, staged) for mutation in batch.mutations]
+    session.commit()
+
+    for request, stored in staged:
+        response_cache.put(request.key_hash, stored)
+    for result in results:
+        metrics.increment("sync_mutations_total", status=result.status)
+    logger.info(f"Sync push from {current_user.email}: {len(staged)} of {len(results)} mutations applied")
+    return SyncPushResponse(results=results, watermark=watermark)
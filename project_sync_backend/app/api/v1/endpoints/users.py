@@ -0,0 +1,31 @@
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session, select
+from project_sync_backend.app.core.batch import parse_ids, keyed_results
+from project_sync_backend.app.models.user import User, UserBatch, UserResponse, UserWorkload
+from project_sync_backend.app.services.workload import assignee_workload
+from project_sync_backend.app.api.dependencies import get_read_session, get_current_pm_reader
+
+router = APIRouter()
+
+@router.get("/workload", response_model=List[UserWorkload])
+def get_workload(
+    project_id: Optional[UUID] = Query(default=None, description="Only count issues of this project"),
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_pm_reader)
+):
+    """Open issues per active user (assigned, in progress, in review), least loaded first - PM only"""
+    return assignee_workload(session, project_id)
+
+@router.get("/batch", response_model=UserBatch)
+def get_users_batch(
+    ids: str = Query(..., description="Comma separated user ids"),
+    session: Session = Depends(get_read_session),
+    current_user: User = Depends(get_current_pm_reader)
+):
+    """Look up many active users by id - PM only"""
+    user_ids = parse_ids(ids)
+    statement = select(User).where(User.id.in_(user_ids), User.is_active == True)
+    found = {user.id: UserResponse.model_validate(user) for user in session.exec(statement)}
+    return keyed_results(user_ids, found)
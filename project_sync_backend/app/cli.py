@@ -0,0 +1,89 @@
+"""Maintenance commands.
+
+Usage: python -m project_sync_backend.app.cli <command>
+"""
+import argparse
+import logging
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.db.database import engine
+from project_sync_backend.app.services.read_model import rebuild_issue_list_view
+from project_sync_backend.app.services.rollups import rebuild_rollups
+from project_sync_backend.app.services.archive import archive_completed_issues
+from project_sync_backend.app.services import partitioning
+from project_sync_backend.app.services.response_cache import project_response_cache
+
+logger = logging.getLogger(__name__)
+
+def rebuild_read_model(args):
+    """Refill issue_list_view from issues, projects and users"""
+    with engine.begin() as connection:
+        rows = rebuild_issue_list_view(connection)
+    print(f"issue_list_view rebuilt: {rows} rows")
+
+def rebuild_dashboard_rollups(args):
+    """Recompute the dashboard rollup tables from issue_events"""
+    with engine.begin() as connection:
+        daily, durations = rebuild_rollups(connection)
+    print(f"rollups rebuilt: {daily} daily rows, {durations} status duration rows")
+
+def archive_issues(args):
+    """Move old completed issues into issues_archive"""
+    moved = archive_completed_issues(engine, args.older_than_days, args.batch_size, args.max_batches)
+    print(f"archived {moved} issues")
+
+def partition_issues(args):
+    """Move issues to the hash partitioned layout: prepare, backfill, swap (or unpartition, or check status)"""
+    if args.step == "backfill":
+        batches = partitioning.backfill_partitioned_issues(engine, args.batch_size, args.max_batches, args.pause)
+        print(f"backfilled {batches} batches")
+    else:
+        with engine.begin() as connection:
+            if args.step == "prepare":
+                partitions = args.partitions or settings.ISSUES_HASH_PARTITIONS
+                if partitions <= 0:
+                    raise SystemExit("Set --partitions or ISSUES_HASH_PARTITIONS")
+                partitioning.prepare_partitioned_issues(connection, partitions)
+            elif args.step == "swap":
+                if partitioning.swap_partitioned_issues(connection):
+                    print("swapped; restart the app so issue lookups start pruning partitions")
+            elif args.step == "unpartition":
+                if partitioning.unpartition_issues(connection):
+                    print("unpartitioned; restart the app so issue lookups stop pruning partitions")
+        if args.step in ("swap", "unpartition"):
+            project_response_cache.bump("issues", "projects")
+    with engine.connect() as connection:
+        print(partitioning.partitioning_status(connection))
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="project_sync_backend.app.cli", description="Project Sync maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-read-model", help="Rebuild the denormalized issue_list_view table")
+    rebuild.set_defaults(handler=rebuild_read_model)
+
+    rollups = commands.add_parser("rebuild-rollups", help="Rebuild the dashboard rollups from the issue event log")
+    rollups.set_defaults(handler=rebuild_dashboard_rollups)
+
+    archive = commands.add_parser("archive-issues", help="Move completed issues older than N days into issues_archive")
+    archive.add_argument("--older-than-days", type=int, default=None, help="Defaults to ARCHIVE_AFTER_DAYS")
+    archive.add_argument("--batch-size", type=int, default=None, help="Defaults to ARCHIVE_BATCH_SIZE")
+    archive.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches")
+    archive.set_defaults(handler=archive_issues)
+
+    partition = commands.add_parser("partition-issues", help="Hash partition issues by project_id without downtime (PostgreSQL)")
+    partition.add_argument("step", choices=["prepare", "backfill", "swap", "unpartition", "status"])
+    partition.add_argument("--partitions", type=int, default=None, help="Defaults to ISSUES_HASH_PARTITIONS")
+    partition.add_argument("--batch-size", type=int, default=None, help="Defaults to PARTITION_BACKFILL_BATCH_SIZE")
+    partition.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches")
+    partition.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    partition.set_defaults(handler=partition_issues)
+
+    return parser
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO)
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import logging
+import re
+import time
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.db.database import connection_usage
+
+logger = logging.getLogger(__name__)
+
+# Priority tiers, from most to least protected
+CRITICAL = "critical"
+STANDARD = "standard"
+EXPENSIVE = "expensive"
+
+class RoutePolicy:
+    """Admission limits for one group of routes"""
+
+    def __init__(self, name, methods, pattern, priority, max_concurrency, max_queue):
+        self.name = name
+        self.methods = methods
+        self.pattern = re.compile(pattern)
+        self.priority = priority
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+
+    def matches(self, method, path):
+        return (self.methods is None or method in self.methods) and self.pattern.match(path) is not None
+
+class Lane:
+    """Concurrency limit with a bounded FIFO wait queue for one route policy"""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.active = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(policy.max_concurrency)
+
+    async def acquire(self, timeout):
+        """Wait for a slot; returns the reason for shedding, or None once admitted"""
+        if self.active + self.waiting >= self.policy.max_concurrency + self.policy.max_queue:
+            return "queue_full"
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout)
+        except asyncio.TimeoutError:
+            return "queue_timeout"
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        return None
+
+    def release(self):
+        self.active -= 1
+        self._semaphore.release()
+
+def default_policies():
+    cheap = ("GET", "HEAD")
+    return [
+        RoutePolicy("health", cheap, r"^/(live|ready|health|db-status|metrics)$", CRITICAL, 64, 256),
+        RoutePolicy("auth_me", cheap, r"^/api/v1/auth/me/?$", CRITICAL, 64, 256),
+        RoutePolicy("auth_login", ("POST",), r"^/api/v1/auth/login/?$", CRITICAL, settings.ADMISSION_MAX_CONCURRENCY, settings.ADMISSION_QUEUE_SIZE),
+        RoutePolicy("issues_list", ("GET",), r"^/api/v1/issues/?$", EXPENSIVE, settings.ADMISSION_EXPENSIVE_MAX_CONCURRENCY, settings.ADMISSION_QUEUE_SIZE),
+        RoutePolicy("issues_reports", ("GET",), r"^/api/v1/issues/(my-issues|open-issues)/?$", EXPENSIVE, settings.ADMISSION_EXPENSIVE_MAX_CONCURRENCY, settings.ADMISSION_QUEUE_SIZE),
+        RoutePolicy("projects_list", ("GET",), r"^/api/v1/projects/?$", EXPENSIVE, settings.ADMISSION_EXPENSIVE_MAX_CONCURRENCY, settings.ADMISSION_QUEUE_SIZE),
+        RoutePolicy("dashboard_stats", ("GET",), r"^/api/v1/dashboard/", EXPENSIVE, settings.ADMISSION_EXPENSIVE_MAX_CONCURRENCY, settings.ADMISSION_QUEUE_SIZE),
+        RoutePolicy("default", None, r"", STANDARD, settings.ADMISSION_MAX_CONCURRENCY, settings.ADMISSION_QUEUE_SIZE),
+    ]
+
+class AdmissionControlMiddleware:
+    """Bounds concurrency per route group and sheds load with 503 + Retry-After.
+
+    A request is shed when its route's wait queue is full, when it waits
+    longer than ADMISSION_QUEUE_TIMEOUT_SECONDS, or when the database
+    connection budget is saturated. Expensive routes are shed first (at
+    ADMISSION_EXPENSIVE_SHED_UTILIZATION), standard routes once the budget
+    is exhausted, and critical routes such as health and /auth/me are never
+    shed for database saturation.
+    """
+
+    def __init__(self, app, policies=None):
+        self.app = app
+        self.enabled = settings.ADMISSION_CONTROL_ENABLED
+        self.lanes = [Lane(policy) for policy in (policies or default_policies())]
+
+    def _lane_for(self, method, path):
+        for lane in self.lanes:
+            if lane.policy.matches(method, path):
+                return lane
+        return None
+
+    def _db_overloaded(self, priority):
+        utilization = connection_usage.utilization
+        if priority == EXPENSIVE:
+            return utilization >= settings.ADMISSION_EXPENSIVE_SHED_UTILIZATION
+        if priority == STANDARD:
+            return utilization >= 1.0
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        lane = self._lane_for(scope["method"], scope["path"])
+        if lane is None:
+            await self.app(scope, receive, send)
+            return
+
+        policy = lane.policy
+        if self._db_overloaded(policy.priority):
+            await self._shed(send, policy, "db_saturated")
+            return
+
+        started = time.perf_counter()
+        reason = await lane.acquire(settings.ADMISSION_QUEUE_TIMEOUT_SECONDS)
+        metrics.observe("admission_queue_wait_ms", (time.perf_counter() - started) * 1000, route=policy.name)
+        if reason is not None:
+            await self._shed(send, policy, reason)
+            return
+
+        metrics.set_gauge("admission_in_flight", lane.active, route=policy.name)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            lane.release()
+            metrics.set_gauge("admission_in_flight", lane.active, route=policy.name)
+
+    async def _shed(self, send, policy, reason):
+        metrics.increment("admission_shed_total", route=policy.name, reason=reason)
+        logger.warning(f"Shedding request for route group '{policy.name}': {reason}")
+        body = json.dumps({"detail": "Server is busy, please retry shortly"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(settings.ADMISSION_RETRY_AFTER_SECONDS).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
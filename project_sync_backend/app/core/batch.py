@@ -0,0 +1,46 @@
+from typing import List
+from uuid import UUID
+from fastapi import HTTPException, status
+from project_sync_backend.app.core.config import settings
+
+def parse_ids(ids: str, max_ids: int = None) -> List[UUID]:
+    """Parse an ``ids=a,b,c`` query parameter into unique UUIDs, in the order given.
+
+    Malformed ids and more than ``max_ids`` (BATCH_LOOKUP_MAX_IDS) distinct
+    ids are rejected with a 400.
+    """
+    max_ids = max_ids or settings.BATCH_LOOKUP_MAX_IDS
+    parsed = []
+    seen = set()
+    for raw in ids.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            value = UUID(raw)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid id: {raw}"
+            )
+        if value not in seen:
+            seen.add(value)
+            parsed.append(value)
+    if not parsed:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one id is required"
+        )
+    if len(parsed) > max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {max_ids} ids can be looked up at once"
+        )
+    return parsed
+
+def keyed_results(ids: List[UUID], found: dict):
+    """``items`` for every requested id (None when not found or not visible) plus the missing ids"""
+    return {
+        "items": {item_id: found.get(item_id) for item_id in ids},
+        "not_found": [item_id for item_id in ids if item_id not in found],
+    }
@@ -0,0 +1,162 @@
+import zlib
+from starlette.datastructures import Headers, MutableHeaders
+from project_sync_backend.app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+class GzipEncoder:
+    def __init__(self, level):
+        # wbits=31 selects the gzip container
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+class BrotliEncoder:
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+def parse_accept_encoding(header):
+    """Map each coding in an Accept-Encoding header to its q-value"""
+    codings = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        codings[name] = q
+    return codings
+
+def negotiate_encoding(header):
+    codings = parse_accept_encoding(header)
+    wildcard = codings.get("*", 0.0)
+    candidates = []
+    if brotli is not None:
+        candidates.append(("br", codings.get("br", wildcard)))
+    candidates.append(("gzip", codings.get("gzip", wildcard)))
+    # Highest q wins; ties go to the earlier (stronger) coding
+    best, q = max(candidates, key=lambda candidate: candidate[1])
+    return best if q > 0 else None
+
+class CompressionMiddleware:
+    """Compresses responses with brotli or gzip, negotiated from Accept-Encoding.
+
+    Bodies smaller than ``minimum_size`` are sent as-is. Streamed responses
+    are compressed chunk by chunk (flushing after each one) rather than
+    buffered, so the first bytes still reach the client early.
+    """
+
+    def __init__(self, app, minimum_size=None, gzip_level=None, brotli_quality=None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+        self.gzip_level = settings.COMPRESSION_GZIP_LEVEL if gzip_level is None else gzip_level
+        self.brotli_quality = settings.COMPRESSION_BROTLI_QUALITY if brotli_quality is None else brotli_quality
+
+    def _encoder(self, encoding):
+        if encoding == "br":
+            return BrotliEncoder(self.brotli_quality)
+        return GzipEncoder(self.gzip_level)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = CompressionResponder(send, encoding, self._encoder(encoding), self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+class CompressionResponder:
+    def __init__(self, send, encoding, encoder, minimum_size):
+        self._send = send
+        self.encoding = encoding
+        self.encoder = encoder
+        self.minimum_size = minimum_size
+        self.start_message = None
+        self.compressing = None
+
+    def _eligible(self, headers):
+        if self.start_message["status"] < 200 or self.start_message["status"] in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            # Hold the headers until the first body chunk shows the size
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressing is None:
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            eligible = self._eligible(headers)
+            if eligible:
+                headers.add_vary_header("Accept-Encoding")
+            self.compressing = eligible and (more_body or len(body) >= self.minimum_size)
+            if not self.compressing:
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                # Streaming: the final length is unknown
+                del headers["Content-Length"]
+                await self._send(self.start_message)
+            else:
+                body = self.encoder.compress(body) + self.encoder.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send(self.start_message)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+        elif not self.compressing:
+            await self._send(message)
+            return
+
+        if more_body:
+            chunk = self.encoder.compress(body) + self.encoder.flush()
+        else:
+            chunk = self.encoder.compress(body) + self.encoder.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -8,6 +8,55 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES:int
     APP_DATABASE_URL:str
     ALEMBIC_DATABASE_URL:str
+    APP_READ_DATABASE_URL:Optional[str] = None
+    READ_YOUR_WRITES_SECONDS:int = 10
+    DB_MAX_CONNECTIONS:int = 20
+    DB_DRIVER:str = "psycopg2"
+    DB_PREPARE_THRESHOLD:int = 5
+    DB_POOL_SIZE:int = 0
+    ADMISSION_CONTROL_ENABLED:bool = True
+    ADMISSION_MAX_CONCURRENCY:int = 32
+    ADMISSION_EXPENSIVE_MAX_CONCURRENCY:int = 8
+    ADMISSION_QUEUE_SIZE:int = 64
+    ADMISSION_QUEUE_TIMEOUT_SECONDS:float = 2.0
+    ADMISSION_EXPENSIVE_SHED_UTILIZATION:float = 0.75
+    ADMISSION_RETRY_AFTER_SECONDS:int = 2
+    STATEMENT_TIMEOUT_MS:int = 15000
+    STATEMENT_TIMEOUT_EXPENSIVE_MS:int = 8000
+    COMPRESSION_MINIMUM_SIZE:int = 1024
+    COMPRESSION_GZIP_LEVEL:int = 6
+    COMPRESSION_BROTLI_QUALITY:int = 4
+    HEALTH_PROBE_INTERVAL_SECONDS:int = 30
+    ISSUE_EVENTS_STRICT:bool = False
+    ISSUE_EVENTS_BATCH_SIZE:int = 200
+    ISSUE_EVENTS_FLUSH_INTERVAL_SECONDS:float = 1.0
+    ISSUE_EVENTS_QUEUE_SIZE:int = 10000
+    ARCHIVE_AFTER_DAYS:int = 90
+    ARCHIVE_BATCH_SIZE:int = 500
+    IDEMPOTENCY_KEY_TTL_HOURS:int = 24
+    IDEMPOTENCY_CACHE_SIZE:int = 1024
+    IDEMPOTENCY_CLEANUP_PROBABILITY:float = 0.01
+    SYNC_PUSH_MAX_MUTATIONS:int = 200
+    TASK_WORKERS:int = 4
+    TASK_QUEUE_SIZE:int = 1000
+    TASK_MAX_ATTEMPTS:int = 3
+    TASK_RETRY_BASE_SECONDS:float = 0.5
+    TASK_DRAIN_TIMEOUT_SECONDS:float = 10.0
+    GROUP_COMMIT_ENABLED:bool = False
+    GROUP_COMMIT_MAX_BATCH:int = 100
+    GROUP_COMMIT_MAX_WAIT_MS:int = 5
+    ISSUES_HASH_PARTITIONS:int = 0
+    PARTITION_BACKFILL_BATCH_SIZE:int = 1000
+    USER_SEARCH_MAX_RESULTS:int = 20
+    USER_SEARCH_CACHE_SIZE:int = 512
+    USER_SEARCH_CACHE_TTL_SECONDS:int = 30
+    BATCH_LOOKUP_MAX_IDS:int = 100
+    RESPONSE_CACHE_ENABLED:bool = True
+    RESPONSE_CACHE_BACKEND:str = "memory"
+    RESPONSE_CACHE_SQLITE_PATH:str = "/tmp/project_sync_response_cache.sqlite3"
+    RESPONSE_CACHE_MAX_ENTRIES:int = 1000
+    RESPONSE_CACHE_TTL_SECONDS:int = 60
+    WEB_CONCURRENCY:int = 1
 
     class Config:
         env_file = "project_sync_backend/.env"
@@ -0,0 +1,21 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+from fastapi import HTTPException, status
+
+def encode_cursor(created_at: datetime, issue_id: UUID) -> str:
+    """Opaque keyset cursor pointing after the given (created_at, id)"""
+    payload = json.dumps([created_at.isoformat(), str(issue_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, issue_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(issue_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
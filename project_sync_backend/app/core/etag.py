@@ -0,0 +1,30 @@
+import hashlib
+from typing import Optional
+from fastapi import Request, Response
+
+def make_etag(*parts) -> str:
+    """Weak ETag derived from the values that determine a response body"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+def _normalize(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison against the request's If-None-Match header"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    wanted = _normalize(etag)
+    return any(_normalize(candidate) == wanted for candidate in header.split(","))
+
+def conditional_response(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Return a 304 if the client already has ``etag``; otherwise tag ``response`` and return None"""
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,22 @@
+from typing import Iterable, List, Optional
+from fastapi import HTTPException, status
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str], always: Iterable[str] = ("id",)) -> Optional[List[str]]:
+    """Parse a ``fields=a,b,c`` query parameter.
+
+    Returns None when no fieldset was requested (full payload), otherwise
+    the requested fields in model order plus the ``always`` fields.
+    Unknown field names are rejected with a 400.
+    """
+    if fields is None or not fields.strip():
+        return None
+    allowed = list(allowed)
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(allowed))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed fields: {', '.join(allowed)}"
+        )
+    requested.update(always)
+    return [name for name in allowed if name in requested]
@@ -0,0 +1,56 @@
+import threading
+
+class MetricsRegistry:
+    """Minimal in-process metrics: counters, gauges and latency summaries.
+
+    Values are per worker process and exposed as JSON on ``/metrics``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._summaries = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return (name, tuple(sorted(labels.items())))
+
+    def increment(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is None:
+                summary = self._summaries[key] = {"count": 0, "sum": 0.0, "max": value}
+            summary["count"] += 1
+            summary["sum"] += value
+            summary["max"] = max(summary["max"], value)
+
+    def snapshot(self):
+        def render(items, value):
+            return [
+                {"name": name, "labels": dict(labels), **value(v)}
+                for (name, labels), v in sorted(items, key=lambda item: item[0])
+            ]
+
+        with self._lock:
+            return {
+                "counters": render(self._counters.items(), lambda v: {"value": v}),
+                "gauges": render(self._gauges.items(), lambda v: {"value": v}),
+                "summaries": render(
+                    self._summaries.items(),
+                    lambda v: {**v, "avg": round(v["sum"] / v["count"], 3) if v["count"] else 0},
+                ),
+            }
+
+metrics = MetricsRegistry()
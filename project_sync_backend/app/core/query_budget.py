@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import re
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.db.timeouts import QueryBudget, current_budget, is_query_timeout
+
+logger = logging.getLogger(__name__)
+
+def default_budgets():
+    """(route name, methods, path pattern, statement timeout in ms), first match wins"""
+    return [
+        ("issues_list", ("GET",), re.compile(r"^/api/v1/issues/?$"), settings.STATEMENT_TIMEOUT_EXPENSIVE_MS),
+        ("issues_reports", ("GET",), re.compile(r"^/api/v1/issues/(my-issues|open-issues)/?$"), settings.STATEMENT_TIMEOUT_EXPENSIVE_MS),
+        ("projects_list", ("GET",), re.compile(r"^/api/v1/projects/?$"), settings.STATEMENT_TIMEOUT_EXPENSIVE_MS),
+        ("dashboard", ("GET",), re.compile(r"^/api/v1/dashboard/"), settings.STATEMENT_TIMEOUT_EXPENSIVE_MS),
+        ("default", None, re.compile(r"^/api/"), settings.STATEMENT_TIMEOUT_MS),
+    ]
+
+class QueryBudgetMiddleware:
+    """Gives each API request a statement timeout budget and cancels its
+    queries when the client disconnects before the response is sent."""
+
+    def __init__(self, app, budgets=None):
+        self.app = app
+        self.budgets = budgets or default_budgets()
+
+    def _budget_for(self, method, path):
+        for name, methods, pattern, timeout_ms in self.budgets:
+            if (methods is None or method in methods) and pattern.match(path):
+                return QueryBudget(name, timeout_ms)
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = self._budget_for(scope["method"], scope["path"])
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Forward every message to the app, watching for a disconnect
+        messages = asyncio.Queue()
+
+        async def watch_for_disconnect():
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    if budget.cancel():
+                        metrics.increment("queries_cancelled_total", route=budget.route, reason="client_disconnect")
+                        logger.info(f"Client disconnected, cancelled in-flight queries for {budget.route}")
+                    return
+
+        token = current_budget.set(budget)
+        watcher = asyncio.create_task(watch_for_disconnect())
+        try:
+            await self.app(scope, messages.get, send)
+        finally:
+            watcher.cancel()
+            current_budget.reset(token)
+
+async def query_timeout_handler(request: Request, exc: Exception):
+    """Turn statement timeouts into 504s; other database errors stay 500s"""
+    if not is_query_timeout(exc):
+        raise exc
+    budget = current_budget.get()
+    route = budget.route if budget else request.url.path
+    reason = "client_disconnect" if budget and budget.cancelled else "timeout"
+    metrics.increment("statement_timeouts_total", route=route, reason=reason)
+    logger.warning(f"Query for {request.method} {request.url.path} exceeded its time budget ({reason})")
+    return JSONResponse(
+        status_code=504,
+        content={"detail": "The request took too long to process. Please narrow the query or retry later."},
+    )
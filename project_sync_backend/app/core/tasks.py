@@ -0,0 +1,164 @@
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.db.hooks import on_commit
+
+logger = logging.getLogger(__name__)
+
+class Task:
+    def __init__(self, name, fn, args, kwargs, max_attempts):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.max_attempts = max_attempts
+        self.attempts = 0
+        self.enqueued_at = time.perf_counter()
+
+class BackgroundTaskRunner:
+    """Small in-process executor for side effects that should not delay a response.
+
+    Tasks go into a bounded queue served by ``workers`` threads. A task
+    that raises is retried with exponential backoff up to ``max_attempts``
+    times; retries wait in a delay heap so they do not hold a worker.
+    ``stop`` stops accepting new tasks and drains what is queued (and
+    pending retries) before the workers exit.
+    """
+
+    def __init__(self, workers=None, max_queue=None, max_attempts=None, retry_base_seconds=None):
+        self.workers = workers or settings.TASK_WORKERS
+        self.max_attempts = max_attempts or settings.TASK_MAX_ATTEMPTS
+        self.retry_base_seconds = retry_base_seconds or settings.TASK_RETRY_BASE_SECONDS
+        self._queue = queue.Queue(maxsize=max_queue or settings.TASK_QUEUE_SIZE)
+        self._delayed = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._threads = []
+        self._accepting = False
+        self._stopping = False
+        self._in_flight = 0
+
+    @property
+    def running(self):
+        return bool(self._threads)
+
+    def start(self):
+        if self.running:
+            return
+        self._accepting = True
+        self._stopping = False
+        self._threads = [
+            threading.Thread(target=self._work, name=f"task-worker-{index}", daemon=True)
+            for index in range(self.workers)
+        ]
+        self._threads.append(threading.Thread(target=self._schedule_retries, name="task-retry-scheduler", daemon=True))
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Background task runner started with {self.workers} workers")
+
+    def submit(self, name, fn, *args, max_attempts=None, **kwargs):
+        """Queue ``fn(*args, **kwargs)``; returns False if the task was rejected"""
+        if not self._accepting:
+            metrics.increment("tasks_rejected_total", task=name, reason="not_running")
+            logger.warning(f"Task runner is not running, dropping task {name}")
+            return False
+        task = Task(name, fn, args, kwargs, max_attempts or self.max_attempts)
+        try:
+            self._queue.put_nowait(task)
+        except queue.Full:
+            metrics.increment("tasks_rejected_total", task=name, reason="queue_full")
+            logger.warning(f"Task queue is full, dropping task {name}")
+            return False
+        metrics.set_gauge("tasks_queue_depth", self._queue.qsize())
+        return True
+
+    def stop(self, timeout=None):
+        """Stop accepting tasks, wait for queued tasks and retries to finish, then stop the workers"""
+        if not self.running:
+            return
+        timeout = settings.TASK_DRAIN_TIMEOUT_SECONDS if timeout is None else timeout
+        self._accepting = False
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while (self._queue.unfinished_tasks or self._delayed or self._in_flight) and time.monotonic() < deadline:
+                self._condition.wait(0.05)
+            left = self._queue.qsize() + len(self._delayed)
+            self._stopping = True
+            self._condition.notify_all()
+        if left:
+            metrics.increment("tasks_dropped_total", left)
+            logger.warning(f"Task runner drain timed out with {left} tasks left")
+        for thread in self._threads:
+            thread.join(max(deadline - time.monotonic(), 0.1))
+        self._threads = []
+        logger.info("Background task runner stopped")
+
+    def _work(self):
+        while not self._stopping:
+            try:
+                task = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            with self._condition:
+                self._in_flight += 1
+            try:
+                self._run(task)
+            finally:
+                self._queue.task_done()
+                with self._condition:
+                    self._in_flight -= 1
+                    self._condition.notify_all()
+                metrics.set_gauge("tasks_queue_depth", self._queue.qsize())
+
+    def _run(self, task):
+        task.attempts += 1
+        started = time.perf_counter()
+        try:
+            task.fn(*task.args, **task.kwargs)
+        except Exception as e:
+            metrics.observe("task_run_ms", (time.perf_counter() - started) * 1000, task=task.name)
+            if task.attempts >= task.max_attempts:
+                metrics.increment("tasks_failed_total", task=task.name)
+                logger.error(f"Task {task.name} failed after {task.attempts} attempts: {e}")
+                return
+            delay = self.retry_base_seconds * 2 ** (task.attempts - 1)
+            metrics.increment("tasks_retried_total", task=task.name)
+            logger.warning(f"Task {task.name} failed (attempt {task.attempts}), retrying in {delay:.1f}s: {e}")
+            with self._condition:
+                heapq.heappush(self._delayed, (time.monotonic() + delay, next(self._sequence), task))
+                self._condition.notify_all()
+            return
+        finished = time.perf_counter()
+        metrics.observe("task_run_ms", (finished - started) * 1000, task=task.name)
+        # Time from submit to completion, including queueing and retries
+        metrics.observe("task_latency_ms", (finished - task.enqueued_at) * 1000, task=task.name)
+        metrics.increment("tasks_completed_total", task=task.name)
+
+    def _schedule_retries(self):
+        with self._condition:
+            while not self._stopping:
+                if not self._delayed:
+                    self._condition.wait(0.5)
+                    continue
+                due_at, _, task = self._delayed[0]
+                wait = due_at - time.monotonic()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                heapq.heappop(self._delayed)
+                try:
+                    self._queue.put_nowait(task)
+                except queue.Full:
+                    metrics.increment("tasks_dropped_total", task=task.name)
+                    logger.warning(f"Task queue is full, dropping retry of {task.name}")
+
+task_runner = BackgroundTaskRunner()
+
+def submit_after_commit(session, name, fn, *args, **kwargs):
+    """Queue a task once ``session`` commits; nothing is queued if it rolls back"""
+    on_commit(session, lambda: task_runner.submit(name, fn, *args, **kwargs))
@@ -1,21 +1,59 @@
 from sqlmodel import create_engine, SQLModel, Session
 from sqlalchemy.pool import NullPool
 from sqlalchemy.exc import OperationalError
-from sqlalchemy import text
+from sqlalchemy import event, text, inspect
+from sqlalchemy.engine import make_url
 from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.db.timeouts import track_budgets
 import logging
+import os
+import threading
 import time
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-# Create engine with better connection parameters for Neon
-engine = create_engine(
-    settings.APP_DATABASE_URL,
-    echo=False,
-    # Disable connection pooling - better for serverless/cloud databases
-    poolclass=NullPool,
+def database_url_for_driver(database_url, driver=None):
+    """Point a PostgreSQL URL at the DB_DRIVER DBAPI (psycopg2 or psycopg 3).
+
+    A URL that already names its driver (``postgresql+psycopg://``) is kept
+    as is; if DB_DRIVER was set explicitly to a different one, that is a
+    configuration error.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        return url
+    explicit_driver = driver or ("DB_DRIVER" in settings.model_fields_set and settings.DB_DRIVER)
+    if "+" in url.drivername:
+        if explicit_driver and explicit_driver != url.get_driver_name():
+            raise ValueError(
+                f"Database URL uses driver {url.get_driver_name()!r} but DB_DRIVER is {explicit_driver!r}"
+            )
+        return url
+    return url.set(drivername=f"postgresql+{explicit_driver or settings.DB_DRIVER}")
+
+def create_database_engine(database_url):
+    """Create an engine for ``database_url``.
+
+    PostgreSQL (Neon) gets the SSL/keepalive settings and no pooling unless
+    DB_POOL_SIZE is set; SQLite is supported for local development, e.g. to
+    try out replica routing with two database files.
+
+    With DB_DRIVER=psycopg, statements executed DB_PREPARE_THRESHOLD times
+    on a connection are prepared server side. Prepared statements live as
+    long as the connection, so they only pay off with DB_POOL_SIZE > 0 and
+    a direct (or PgBouncer >= 1.21) endpoint.
+    """
+    url = database_url_for_driver(database_url)
+    if url.get_backend_name() == "sqlite":
+        return create_engine(
+            url,
+            echo=False,
+            connect_args={"check_same_thread": False},
+        )
+
     # Connection arguments for better reliability
-    connect_args={
+    connect_args = {
         "sslmode": "require",
         "connect_timeout": 30,  # Increased timeout
         "application_name": "ProjectSync",
@@ -23,50 +61,130 @@ engine = create_engine(
         "keepalives_idle": 600,
         "keepalives_interval": 30,
         "keepalives_count": 3,
-    },
-    # Pool settings (even though we're using NullPool, these are good to have)
-    pool_pre_ping=True,  # Validate connections before use
-    pool_recycle=300,    # Recycle connections every 5 minutes
+    }
+    if url.get_driver_name() == "psycopg":
+        connect_args["prepare_threshold"] = settings.DB_PREPARE_THRESHOLD
+
+    if settings.DB_POOL_SIZE > 0:
+        pool_args = {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": max(settings.DB_MAX_CONNECTIONS - settings.DB_POOL_SIZE, 0),
+        }
+    else:
+        # Disable connection pooling - better for serverless/cloud databases
+        pool_args = {"poolclass": NullPool}
+
+    # Create engine with better connection parameters for Neon
+    return create_engine(
+        url,
+        echo=False,
+        connect_args=connect_args,
+        pool_pre_ping=True,  # Validate connections before use
+        pool_recycle=300,    # Recycle connections every 5 minutes
+        **pool_args,
+    )
+
+engine = create_database_engine(settings.APP_DATABASE_URL)
+
+# Optional read replica; without one, reads go to the primary
+read_engine = (
+    create_database_engine(settings.APP_READ_DATABASE_URL)
+    if settings.APP_READ_DATABASE_URL
+    else engine
 )
 
-def create_db_and_tables():
-    """Create database tables with retry logic"""
-    max_retries = 3
-    retry_delay = 5
-    
-    for attempt in range(max_retries):
-        try:
-            logger.info(f"Attempting to create database tables (attempt {attempt + 1}/{max_retries})")
-            SQLModel.metadata.create_all(engine)
-            logger.info("Database tables created successfully")
-            return
-        except OperationalError as e:
-            logger.error(f"Database connection failed (attempt {attempt + 1}): {e}")
-            if attempt < max_retries - 1:
-                logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
+class DatabaseState:
+    """Outcome of the background database initialization, used for readiness"""
+
+    def __init__(self):
+        self.reachable = False
+        self.schema_ready = False
+        self.schema_revision = None
+        self.schema_head = None
+        self.attempts = 0
+        self.last_error = None
+        self.initialized_at = None
+
+    @property
+    def ready(self):
+        return self.reachable and self.schema_ready
+
+    def to_dict(self):
+        return {
+            "ready": self.ready,
+            "database_reachable": self.reachable,
+            "schema_ready": self.schema_ready,
+            "schema_revision": self.schema_revision,
+            "schema_head": self.schema_head,
+            "schema_up_to_date": self.schema_revision is None or self.schema_revision == self.schema_head,
+            "attempts": self.attempts,
+            "last_error": self.last_error,
+            "initialized_at": self.initialized_at,
+        }
+
+db_state = DatabaseState()
+
+def get_alembic_head():
+    """Return the head revision of the migration scripts shipped with the app"""
+    try:
+        from alembic.config import Config
+        from alembic.script import ScriptDirectory
+
+        backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+        config = Config(os.path.join(backend_dir, "alembic.ini"))
+        config.set_main_option("script_location", os.path.join(backend_dir, "alembic"))
+        return ScriptDirectory.from_config(config).get_current_head()
+    except Exception as e:
+        logger.warning(f"Could not determine Alembic head revision: {e}")
+        return None
+
+def initialize_database():
+    """Verify the schema once, without retrying.
+
+    If the database is managed by Alembic, the revision recorded in
+    ``alembic_version`` is compared against the migration head instead of
+    running ``create_all``. Otherwise the tables are created. Retries are
+    left to the caller so startup never blocks on a sleeping database.
+    """
+    db_state.attempts += 1
+    try:
+        with engine.connect() as connection:
+            db_state.reachable = True
+            if inspect(connection).has_table("alembic_version"):
+                revision = connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+                head = get_alembic_head()
+                db_state.schema_revision = revision
+                db_state.schema_head = head
+                if head and revision != head:
+                    logger.warning(f"Database schema is at revision {revision} but the code expects {head}; run 'alembic upgrade head'")
+                else:
+                    logger.info(f"Database schema is at Alembic revision {revision}")
             else:
-                logger.error("Failed to create database tables after all retries")
-                raise
-        except Exception as e:
-            logger.error(f"Unexpected error creating database tables: {e}")
-            raise
+                logger.info("No alembic_version table found, creating database tables")
+                SQLModel.metadata.create_all(connection)
+                from project_sync_backend.app.services.bootstrap import bootstrap_schema
+                bootstrap_schema(connection)
+                connection.commit()
+        db_state.schema_ready = True
+        db_state.last_error = None
+        db_state.initialized_at = datetime.utcnow().isoformat()
+    except Exception as e:
+        db_state.last_error = str(e)
+        raise
 
-def get_session():
-    """Get database session with connection validation"""
+def _open_session(bind):
+    """Open a session on ``bind``, retrying only while establishing the connection"""
     max_retries = 3
     retry_delay = 1
     
     for attempt in range(max_retries):
+        session = Session(bind)
         try:
-            with Session(engine) as session:
-                # Test the connection
-                from sqlalchemy import text
-                session.exec(text("SELECT 1"))
-                yield session
-                return
+            # Test the connection
+            session.exec(text("SELECT 1"))
+            break
         except OperationalError as e:
+            session.close()
             logger.warning(f"Database session failed (attempt {attempt + 1}): {e}")
             if attempt < max_retries - 1:
                 time.sleep(retry_delay)
@@ -75,16 +193,110 @@ def get_session():
                 logger.error("Failed to establish database session after all retries")
                 raise
         except Exception as e:
+            session.close()
             logger.error(f"Unexpected error in database session: {e}")
             raise
 
+    # Errors raised by the request handler are not retried
+    with session:
+        yield session
+
+class SessionRouter:
+    """Routes read sessions to the replica unless the caller wrote recently.
+
+    Writers are remembered for ``window_seconds`` so that a read directly
+    following a write by the same user is served by the primary and sees
+    its own changes despite replication lag. The window is tracked per
+    process.
+    """
+
+    def __init__(self, primary, replica, window_seconds):
+        self.primary = primary
+        self.replica = replica
+        self.window_seconds = window_seconds
+        self._recent_writes = {}
+        self._lock = threading.Lock()
+
+    @property
+    def has_replica(self):
+        return self.replica is not self.primary
+
+    def note_write(self, key):
+        if not self.has_replica or key is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._recent_writes[key] = now + self.window_seconds
+            if len(self._recent_writes) > 10000:
+                self._recent_writes = {k: v for k, v in self._recent_writes.items() if v > now}
+
+    def wrote_recently(self, key):
+        if key is None:
+            return False
+        with self._lock:
+            expires_at = self._recent_writes.get(key)
+        return expires_at is not None and expires_at > time.monotonic()
+
+    def read_bind(self, key=None):
+        if not self.has_replica or self.wrote_recently(key):
+            return self.primary
+        return self.replica
+
+session_router = SessionRouter(engine, read_engine, settings.READ_YOUR_WRITES_SECONDS)
+
+class ConnectionUsage:
+    """Counts connections checked out across the engines.
+
+    With NullPool there is no pool to inspect, so saturation is measured
+    against the DB_MAX_CONNECTIONS budget instead.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.in_use = 0
+        self._lock = threading.Lock()
+
+    def track(self, bind):
+        event.listen(bind, "checkout", self._on_checkout)
+        event.listen(bind, "checkin", self._on_checkin)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.in_use += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+
+    @property
+    def utilization(self):
+        if self.capacity <= 0:
+            return 0.0
+        return self.in_use / self.capacity
+
+connection_usage = ConnectionUsage(settings.DB_MAX_CONNECTIONS)
+for bind in {engine, read_engine}:
+    connection_usage.track(bind)
+    track_budgets(bind)
+
+def get_session():
+    """Get a primary database session with connection validation"""
+    yield from _open_session(engine)
+
+def get_routed_read_session(key=None):
+    """Get a session for read-only work, on the replica when it is safe to"""
+    yield from _open_session(session_router.read_bind(key))
+
 def test_database_connection():
     """Test database connection - useful for health checks"""
     try:
         with Session(engine) as session:
-            result = session.exec(text("SELECT version()"))
+            if engine.dialect.name == "sqlite":
+                result = session.exec(text("SELECT sqlite_version()"))
+            else:
+                result = session.exec(text("SELECT version()"))
             version = result.first()
-            logger.info(f"Database connection successful. PostgreSQL version: {version}")
+            logger.info(f"Database connection successful. Server version: {version}")
             return True
     except Exception as e:
         logger.error(f"Database connection test failed: {e}")
@@ -0,0 +1,75 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from sqlalchemy import text
+from project_sync_backend.app.db.database import engine
+
+logger = logging.getLogger(__name__)
+
+class HealthProbe:
+    """Periodically probes the database and caches the outcome.
+
+    Health endpoints read the cached snapshot instead of opening a new
+    connection (and TLS handshake) on every load balancer ping.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self.healthy = None
+        self.latency_ms = None
+        self.last_checked_at = None
+        self.last_success_at = None
+        self.last_failure_at = None
+        self.failure_streak = 0
+        self.total_checks = 0
+        self.last_error = None
+
+    def probe(self):
+        """Run a live probe, record the outcome and return the new snapshot"""
+        started = time.perf_counter()
+        error = None
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            error = str(e)
+        latency_ms = round((time.perf_counter() - started) * 1000, 2)
+        now = datetime.utcnow().isoformat()
+
+        with self._lock:
+            self.total_checks += 1
+            self.last_checked_at = now
+            self.latency_ms = latency_ms
+            if error is None:
+                self.healthy = True
+                self.last_success_at = now
+                self.failure_streak = 0
+                self.last_error = None
+            else:
+                self.healthy = False
+                self.last_failure_at = now
+                self.failure_streak += 1
+                self.last_error = error
+
+        if error is None:
+            logger.debug(f"Database probe succeeded in {latency_ms} ms")
+        else:
+            logger.warning(f"Database probe failed (streak {self.failure_streak}): {error}")
+        return self.snapshot()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "healthy": self.healthy,
+                "latency_ms": self.latency_ms,
+                "last_checked_at": self.last_checked_at,
+                "last_success_at": self.last_success_at,
+                "last_failure_at": self.last_failure_at,
+                "failure_streak": self.failure_streak,
+                "total_checks": self.total_checks,
+                "last_error": self.last_error,
+            }
+
+health_probe = HealthProbe(engine)
@@ -0,0 +1,35 @@
+import logging
+from sqlalchemy import event
+from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+PENDING_CALLBACKS_KEY = "after_commit_callbacks"
+
+def on_commit(session: Session, callback):
+    """Run ``callback()`` once the session's current transaction commits.
+
+    Callbacks are dropped if the transaction rolls back, including when
+    they were registered inside a savepoint that is rolled back.
+    """
+    session.info.setdefault(PENDING_CALLBACKS_KEY, []).append((session.get_nested_transaction(), callback))
+
+@event.listens_for(Session, "after_commit")
+def run_commit_callbacks(session):
+    pending = session.info.pop(PENDING_CALLBACKS_KEY, None)
+    for _, callback in pending or ():
+        try:
+            callback()
+        except Exception as e:
+            # The data is committed; a failed side effect must not turn the request into an error
+            logger.error(f"After-commit callback {callback!r} failed: {e}")
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_savepoint_callbacks(session, previous_transaction):
+    pending = session.info.get(PENDING_CALLBACKS_KEY)
+    if not pending:
+        return
+    if previous_transaction.nested:
+        pending[:] = [(savepoint, callback) for savepoint, callback in pending if savepoint is not previous_transaction]
+    else:
+        session.info.pop(PENDING_CALLBACKS_KEY, None)
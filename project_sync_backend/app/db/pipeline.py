@@ -0,0 +1,74 @@
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+def supports_pipeline(dbapi_connection):
+    """psycopg 3 connections have pipeline mode; psycopg2 and sqlite3 do not"""
+    return hasattr(dbapi_connection, "pipeline")
+
+def _bind_parameters(compiled, dialect):
+    params = compiled.construct_params()
+    for name, value in params.items():
+        bind = compiled.binds.get(name)
+        processor = bind.type.bind_processor(dialect) if bind is not None else None
+        if processor is not None:
+            params[name] = processor(value)
+    return params
+
+def _processed_rows(cursor, statement, dialect):
+    processors = [
+        column.type.result_processor(dialect, description[1])
+        for column, description in zip(statement.selected_columns, cursor.description)
+    ]
+    return [
+        tuple(processor(value) if processor else value for processor, value in zip(processors, row))
+        for row in cursor.fetchall()
+    ]
+
+def run_pipelined(session: Session, statements):
+    """Run several independent SELECTs and return the rows (tuples) of each, in order.
+
+    On psycopg 3 they are sent together in pipeline mode, costing one
+    network round trip instead of one per statement; on other drivers they
+    simply run one after another. Statements run in the session's current
+    transaction. Use it for plain Core selects (no ORM entities, no
+    expanding IN lists).
+
+    SQLAlchemy's own execution reads each result as soon as the statement
+    is sent, which pipeline mode does not allow, so the pipelined path uses
+    DBAPI cursors. It still fires the engine's before/after_cursor_execute
+    events (with no execution context) and raises driver errors wrapped
+    the way SQLAlchemy does, e.g. a statement timeout as OperationalError.
+    """
+    connection = session.connection()
+    dialect = connection.dialect
+    dbapi_connection = connection.connection.dbapi_connection
+
+    if not supports_pipeline(dbapi_connection):
+        return [[tuple(row) for row in connection.execute(statement)] for statement in statements]
+
+    queries = []
+    for statement in statements:
+        compiled = statement.compile(dialect=dialect)
+        queries.append((str(compiled), _bind_parameters(compiled, dialect)))
+
+    cursors = []
+    sql, params = queries[0]
+    try:
+        with dbapi_connection.pipeline():
+            for sql, params in queries:
+                cursor = dbapi_connection.cursor()
+                cursors.append(cursor)
+                for listener in connection.dispatch.before_cursor_execute:
+                    sql, params = listener(connection, cursor, sql, params, None, False)
+                cursor.execute(sql, params)
+        # Leaving the block synced the pipeline, so every cursor has its result
+        results = []
+        for cursor, statement, (sql, params) in zip(cursors, statements, queries):
+            connection.dispatch.after_cursor_execute(connection, cursor, sql, params, None, False)
+            results.append(_processed_rows(cursor, statement, dialect))
+    except dialect.loaded_dbapi.Error as e:
+        raise DBAPIError.instance(sql, params, e, dialect.loaded_dbapi.Error, dialect=dialect) from e
+    finally:
+        for cursor in cursors:
+            cursor.close()
+    return results
@@ -0,0 +1,101 @@
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATE for "canceling statement due to statement timeout / user request"
+QUERY_CANCELED_SQLSTATE = "57014"
+
+class QueryBudget:
+    """Time budget for the queries of one request.
+
+    Transactions opened while the budget is active get a statement timeout
+    of whatever is left of it (``SET LOCAL statement_timeout`` on
+    PostgreSQL, a progress handler on SQLite). The connections in use are
+    remembered so a client disconnect can cancel their running queries.
+    """
+
+    def __init__(self, route, timeout_ms):
+        self.route = route
+        self.timeout_ms = timeout_ms
+        self.deadline = time.monotonic() + timeout_ms / 1000
+        self.cancelled = False
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def remaining_ms(self):
+        return max(int((self.deadline - time.monotonic()) * 1000), 1)
+
+    def expired(self):
+        return self.cancelled or time.monotonic() >= self.deadline
+
+    def register(self, dbapi_connection, dialect_name):
+        with self._lock:
+            self._connections[id(dbapi_connection)] = (dbapi_connection, dialect_name)
+
+    def unregister(self, dbapi_connection):
+        with self._lock:
+            self._connections.pop(id(dbapi_connection), None)
+
+    def cancel(self):
+        """Cancel queries running on behalf of this request; returns how many connections were signalled"""
+        self.cancelled = True
+        with self._lock:
+            connections = list(self._connections.values())
+        for dbapi_connection, dialect_name in connections:
+            try:
+                if dialect_name == "sqlite":
+                    dbapi_connection.interrupt()
+                else:
+                    dbapi_connection.cancel()
+            except Exception as e:
+                logger.warning(f"Could not cancel query for route {self.route}: {e}")
+        return len(connections)
+
+current_budget: ContextVar[Optional[QueryBudget]] = ContextVar("query_budget", default=None)
+
+def is_query_timeout(exc):
+    """True if ``exc`` is the database reporting a cancelled or timed out statement"""
+    if not isinstance(exc, DBAPIError):
+        return False
+    orig = exc.orig
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    if sqlstate == QUERY_CANCELED_SQLSTATE:
+        return True
+    return "interrupted" in str(orig)
+
+@event.listens_for(Session, "after_begin")
+def apply_statement_timeout(session, transaction, connection):
+    budget = current_budget.get()
+    if budget is None:
+        return
+
+    dialect_name = connection.dialect.name
+    dbapi_connection = connection.connection.dbapi_connection
+    if dialect_name == "postgresql":
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {budget.remaining_ms()}")
+    elif dialect_name == "sqlite":
+        dbapi_connection.set_progress_handler(lambda: 1 if budget.expired() else 0, 1000)
+    else:
+        return
+
+    budget.register(dbapi_connection, dialect_name)
+    connection.connection.info["query_budget"] = budget
+
+def release_budget(dbapi_connection, connection_record):
+    """Pool checkin hook: detach the connection from the request's budget"""
+    budget = connection_record.info.pop("query_budget", None)
+    if budget is None:
+        return
+    budget.unregister(dbapi_connection)
+    if hasattr(dbapi_connection, "set_progress_handler"):
+        dbapi_connection.set_progress_handler(None, 0)
+
+def track_budgets(bind):
+    event.listen(bind, "checkin", release_budget)
@@ -1,16 +1,29 @@
 import os
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.exc import OperationalError
 
 from project_sync_backend.app.api.v1.endpoints.projects import router as projects_router
 from project_sync_backend.app.api.v1.endpoints.auth import router as auth_router
 from project_sync_backend.app.api.v1.endpoints.issues import router as issues_router
 from project_sync_backend.app.api.v1.endpoints.dashboard import router as dashboard_router
+from project_sync_backend.app.api.v1.endpoints.sync import router as sync_router
+from project_sync_backend.app.api.v1.endpoints.users import router as users_router
 
 from project_sync_backend.app.core.config import settings
-from project_sync_backend.app.db.database import create_db_and_tables, test_database_connection
+from project_sync_backend.app.core.admission import AdmissionControlMiddleware
+from project_sync_backend.app.core.compression import CompressionMiddleware
+from project_sync_backend.app.core.query_budget import QueryBudgetMiddleware, query_timeout_handler
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.core.tasks import task_runner
+from project_sync_backend.app.db.database import db_state, initialize_database, connection_usage
+from project_sync_backend.app.db.health import health_probe
+from project_sync_backend.app.services.events import issue_event_writer
 
 # Set up logging
 logging.basicConfig(
@@ -19,6 +32,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+async def initialize_database_in_background():
+    """Verify the schema off the startup path, backing off while the database is unreachable"""
+    retry_delay = 1
+    while True:
+        try:
+            await run_in_threadpool(initialize_database)
+            logger.info("✅ Database initialization completed")
+            return
+        except Exception as e:
+            logger.warning(f"⚠️ Database initialization failed (attempt {db_state.attempts}): {e}")
+            logger.info(f"Retrying database initialization in {retry_delay} seconds...")
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 60)
+
+async def run_health_probe():
+    """Probe the database on an interval so health endpoints can serve cached state"""
+    while True:
+        await run_in_threadpool(health_probe.probe)
+        await asyncio.sleep(settings.HEALTH_PROBE_INTERVAL_SECONDS)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
@@ -27,35 +60,16 @@ async def lifespan(app: FastAPI):
     # Print environment settings (be careful not to log sensitive data in production)
     logger.info("Environment Settings Loaded")
     logger.info(f"Database URL configured: {bool(settings.APP_DATABASE_URL)}")
+    if settings.RESPONSE_CACHE_ENABLED and settings.RESPONSE_CACHE_BACKEND == "memory" and settings.WEB_CONCURRENCY > 1:
+        logger.warning(f"⚠️ RESPONSE_CACHE_BACKEND=memory with {settings.WEB_CONCURRENCY} workers: "
+                       "cached project responses miss other workers' writes until they expire; use sqlite")
     
-    # Database initialization with error handling
-    try:
-        logger.info("🔍 Testing database connection...")
-        
-        # First test the connection
-        if test_database_connection():
-            logger.info("✅ Database connection test successful")
-            
-            # If connection test passes, create tables
-            logger.info("🔧 Creating database tables...")
-            create_db_and_tables()
-            logger.info("✅ Database tables created successfully")
-            
-        else:
-            logger.warning("⚠️ Database connection failed")
-            
-    except Exception as e:
-        logger.error(f"❌ Database initialization failed: {str(e)}")
-        logger.error("This is likely due to:")
-        logger.error("1. Network connectivity issues")
-        logger.error("2. Neon database is sleeping/inactive")
-        logger.error("3. Incorrect database credentials")
-        logger.error("4. Firewall blocking the connection")
-        
-        # For development, you might want to continue without database
-        # For production, you might want to fail fast
-        logger.warning("⚠️ Starting application without database initialization")
-        logger.warning("Database operations will fail until connection is restored")
+    # Database initialization runs in the background so a sleeping Neon
+    # instance does not hold up startup; /ready reports when it is done
+    init_task = asyncio.create_task(initialize_database_in_background())
+    probe_task = asyncio.create_task(run_health_probe())
+    issue_event_writer.start()
+    task_runner.start()
     
     logger.info("🎉 Application startup completed")
     
@@ -63,7 +77,15 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 Shutting down Project Management System...")
-    # Add any cleanup code here if needed
+    for task in (init_task, probe_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    # Finish queued side effects, then write out buffered issue events
+    await run_in_threadpool(task_runner.stop)
+    await run_in_threadpool(issue_event_writer.stop)
 
 app = FastAPI(
     title="Project Management System",
@@ -72,6 +94,16 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# gzip/brotli response compression, negotiated from Accept-Encoding
+app.add_middleware(CompressionMiddleware)
+
+# Per-route statement timeouts; timed out queries become 504s
+app.add_middleware(QueryBudgetMiddleware)
+app.add_exception_handler(OperationalError, query_timeout_handler)
+
+# Admission control sits inside CORS so shed responses still carry CORS headers
+app.add_middleware(AdmissionControlMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -83,6 +115,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let the frontend read ETags for conditional polling
+    expose_headers=["ETag"],
 )
 
 # Include routers
@@ -90,6 +124,8 @@ app.include_router(projects_router, prefix="/api/v1/projects", tags=["projects"]
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["authentication"])
 app.include_router(issues_router, prefix="/api/v1/issues", tags=["issues"])
 app.include_router(dashboard_router, prefix="/api/v1", tags=["dashboard"])
+app.include_router(sync_router, prefix="/api/v1/sync", tags=["sync"])
+app.include_router(users_router, prefix="/api/v1/users", tags=["users"])
 
 @app.get("/", tags=["root"])
 @app.head("/", tags=["root"])
@@ -101,16 +137,32 @@ def read_root():
         "health": "OK"
     }
 
+@app.get("/live", tags=["health"])
+def liveness_check():
+    """Liveness probe - the process is up, regardless of database state"""
+    return {"status": "alive", "version": "1.0.0"}
+
+@app.get("/ready", tags=["health"])
+def readiness_check():
+    """Readiness probe - 503 until the database is reachable and the schema verified"""
+    state = db_state.to_dict()
+    state["probe"] = health_probe.snapshot()
+    if not db_state.ready or state["probe"]["healthy"] is False:
+        return JSONResponse(status_code=503, content={"status": "starting", **state})
+    return {"status": "ready", **state}
+
 @app.get("/health", tags=["health"])
-def health_check():
-    """Enhanced health check with database status"""
+def health_check(deep: bool = False):
+    """Health check served from the cached database probe; ?deep=1 runs a live probe"""
     try:
-        db_status = test_database_connection()
+        probe = health_probe.probe() if deep else health_probe.snapshot()
+        db_status = bool(probe["healthy"])
         return {
             "status": "healthy" if db_status else "degraded",
             "database": "connected" if db_status else "disconnected",
             "version": "1.0.0",
-            "message": "API is running" if db_status else "API running but database unavailable"
+            "message": "API is running" if db_status else "API running but database unavailable",
+            "probe": probe
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -122,14 +174,17 @@ def health_check():
         }
 
 @app.get("/db-status", tags=["health"])
-def database_status():
-    """Detailed database status endpoint"""
+def database_status(deep: bool = False):
+    """Detailed database status endpoint, from the cached probe unless ?deep=1"""
     try:
-        db_connected = test_database_connection()
+        probe = health_probe.probe() if deep else health_probe.snapshot()
+        db_connected = bool(probe["healthy"])
         return {
             "database_connected": db_connected,
             "database_url_configured": bool(settings.APP_DATABASE_URL),
-            "status": "Database is accessible" if db_connected else "Database connection failed"
+            "status": "Database is accessible" if db_connected else "Database connection failed",
+            "probe": probe,
+            "initialization": db_state.to_dict()
         }
     except Exception as e:
         return {
@@ -138,6 +193,13 @@ def database_status():
             "status": f"Database error: {str(e)}"
         }
 
+@app.get("/metrics", tags=["health"])
+def get_metrics():
+    """In-process metrics for this worker"""
+    metrics.set_gauge("db_connections_in_use", connection_usage.in_use)
+    metrics.set_gauge("db_connection_utilization", round(connection_usage.utilization, 3))
+    return metrics.snapshot()
+
 # Only print sensitive settings in development
 if os.getenv("ENVIRONMENT", "development") == "development":
     print("ENV SETTINGS:", {
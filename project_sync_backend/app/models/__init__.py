@@ -8,13 +8,19 @@
 # __all__ = ["User", "Project", "Issue"]
 
 
-from .user import User, UserCreate, UserResponse, UserLogin, Token, TokenData, UserRole
-from .projects import Project, ProjectCreate, ProjectResponse, ProjectWithIssues
-from .issue import Issue, IssueCreate, IssueResponse, IssueAssign, IssueStatusUpdate, IssueWithDetails, IssueStatus, IssuePriority, IssueType
+from .user import User, UserCreate, UserResponse, UserLogin, Token, TokenData, UserRole, UserWorkload, WorkloadIssue, UserBatch
+from .projects import Project, ProjectCreate, ProjectResponse, ProjectWithIssues, ProjectBatch
+from .issue import Issue, IssueListView, IssueArchive, IssueEvent, IssueEventType, IssueCreate, IssueResponse, IssueAssign, IssueStatusUpdate, IssueWithDetails, IssueStatus, IssuePriority, IssueType, IssueSearchResult, IssueSearchPage, BoardColumn, ProjectBoard, IssueBatch
+from .analytics import IssueDailyRollup, StatusDurationRollup
+from .idempotency import IdempotencyKey
+from .sync import SyncPushRequest, SyncPushResponse, SyncMutationResult
 
 __all__ = [
-    "User", "UserCreate", "UserResponse", "UserLogin", "Token", "TokenData", "UserRole",
-    "Project", "ProjectCreate", "ProjectResponse", "ProjectWithIssues",
-    "Issue", "IssueCreate", "IssueResponse", "IssueAssign", "IssueStatusUpdate", 
-    "IssueWithDetails", "IssueStatus", "IssuePriority", "IssueType"
+    "User", "UserCreate", "UserResponse", "UserLogin", "Token", "TokenData", "UserRole", "UserWorkload", "WorkloadIssue", "UserBatch",
+    "Project", "ProjectCreate", "ProjectResponse", "ProjectWithIssues", "ProjectBatch",
+    "Issue", "IssueListView", "IssueArchive", "IssueEvent", "IssueEventType", "IssueCreate", "IssueResponse", "IssueAssign", "IssueStatusUpdate", 
+    "IssueWithDetails", "IssueStatus", "IssuePriority", "IssueType", "IssueSearchResult", "IssueSearchPage",
+    "BoardColumn", "ProjectBoard", "IssueBatch",
+    "IssueDailyRollup", "StatusDurationRollup", "IdempotencyKey",
+    "SyncPushRequest", "SyncPushResponse", "SyncMutationResult"
 ]
\ No newline at end of file
@@ -0,0 +1,24 @@
+from sqlmodel import SQLModel, Field
+from datetime import date
+from uuid import UUID
+from project_sync_backend.app.models.issue import IssueStatus
+
+class IssueDailyRollup(SQLModel, table=True):
+    """Issues opened, assigned and completed per project per day"""
+    __tablename__ = "issue_daily_rollups"
+
+    project_id: UUID = Field(primary_key=True)
+    day: date = Field(primary_key=True, index=True)
+    opened: int = Field(default=0)
+    assigned: int = Field(default=0)
+    completed: int = Field(default=0)
+
+class StatusDurationRollup(SQLModel, table=True):
+    """Time issues spent in a status, bucketed by the day they left it"""
+    __tablename__ = "status_duration_rollups"
+
+    project_id: UUID = Field(primary_key=True)
+    day: date = Field(primary_key=True, index=True)
+    status: IssueStatus = Field(primary_key=True)
+    total_seconds: float = Field(default=0)
+    transitions: int = Field(default=0)
@@ -0,0 +1,18 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+from uuid import UUID
+
+class IdempotencyKey(SQLModel, table=True):
+    """Stored outcome of a request made with an Idempotency-Key header"""
+    __tablename__ = "idempotency_keys"
+
+    # sha256 of user id, route and the client's key
+    key_hash: str = Field(primary_key=True, max_length=64)
+    user_id: UUID
+    scope: str = Field(max_length=100)
+    # sha256 of the request body, so a reused key with a different body is rejected
+    request_hash: str = Field(max_length=64)
+    status_code: int
+    response_body: str
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime = Field(index=True)
@@ -1,7 +1,9 @@
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional
+from typing import Dict, Optional, List
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+from project_sync_backend.app.core.ids import uuid7
 from enum import Enum
 
 class IssueStatus(str, Enum):
@@ -23,6 +25,11 @@ class IssueType(str, Enum):
     FEATURE = "FEATURE"
     ENHANCEMENT = "ENHANCEMENT"
 
+class IssueEventType(str, Enum):
+    CREATED = "CREATED"
+    ASSIGNED = "ASSIGNED"
+    STATUS_CHANGED = "STATUS_CHANGED"
+
 class IssueBase(SQLModel):
     title: str = Field(max_length=255)
     description: Optional[str] = None
@@ -31,8 +38,16 @@ class IssueBase(SQLModel):
 
 class Issue(IssueBase, table=True):
     __tablename__ = "issues"
+    __table_args__ = (
+        # Used by the archive job to find old completed issues
+        Index(
+            "ix_issues_completed_updated_at", "updated_at",
+            postgresql_where=text("status = 'COMPLETED'"),
+            sqlite_where=text("status = 'COMPLETED'"),
+        ),
+    )
     
-    id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
+    id: Optional[UUID] = Field(default_factory=uuid7, primary_key=True)
     status: IssueStatus = Field(default=IssueStatus.OPEN)
     project_id: UUID = Field(foreign_key="projects.id")
     assigned_to_id: Optional[UUID] = Field(foreign_key="users.id", default=None)
@@ -51,6 +66,68 @@ class Issue(IssueBase, table=True):
         sa_relationship_kwargs={"foreign_keys": "Issue.created_by_id"}
     )
 
+class IssueListView(IssueBase, table=True):
+    """Denormalized issue listing row (read model).
+
+    Carries the project title and user names next to the issue fields so
+    list endpoints read one table. Kept in sync by the issue and project
+    write paths in the same transaction; see services/read_model.py.
+    """
+    __tablename__ = "issue_list_view"
+    __table_args__ = (
+        # Board columns: one project's issues per status, newest first
+        Index("ix_issue_list_view_board", "project_id", "status", "created_at", "id"),
+        # Assignee workload: open issues per assignee and status, oldest first
+        Index("ix_issue_list_view_workload", "assigned_to_id", "status", "created_at"),
+    )
+
+    # Same value as issues.id; no foreign key so the table can be rebuilt freely
+    id: UUID = Field(primary_key=True)
+    status: IssueStatus = Field(index=True)
+    project_id: UUID = Field(index=True)
+    assigned_to_id: Optional[UUID] = Field(default=None, index=True)
+    created_by_id: UUID = Field(index=True)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    project_title: Optional[str] = Field(default=None, max_length=255)
+    assignee_name: Optional[str] = Field(default=None, max_length=100)
+    creator_name: Optional[str] = Field(default=None, max_length=100)
+
+class IssueArchive(IssueBase, table=True):
+    """Completed issues moved out of ``issues`` by the archive job.
+
+    Names are copied in at archive time so archived rows read without joins.
+    """
+    __tablename__ = "issues_archive"
+
+    # Same value as the original issues.id
+    id: UUID = Field(primary_key=True)
+    status: IssueStatus
+    project_id: UUID = Field(index=True)
+    assigned_to_id: Optional[UUID] = Field(default=None, index=True)
+    created_by_id: UUID = Field(index=True)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    project_title: Optional[str] = Field(default=None, max_length=255)
+    assignee_name: Optional[str] = Field(default=None, max_length=100)
+    creator_name: Optional[str] = Field(default=None, max_length=100)
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
+
+class IssueEvent(SQLModel, table=True):
+    """One row per issue transition; rows are only ever inserted"""
+    __tablename__ = "issue_events"
+
+    id: Optional[UUID] = Field(default_factory=uuid7, primary_key=True)
+    # No foreign keys, so the log can be written in batches outside the request transaction
+    issue_id: UUID = Field(index=True)
+    project_id: UUID = Field(index=True)
+    event_type: IssueEventType
+    from_status: Optional[IssueStatus] = None
+    to_status: Optional[IssueStatus] = None
+    actor_id: UUID
+    assignee_id: Optional[UUID] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
 class IssueCreate(IssueBase):
     project_id: UUID
 
@@ -71,4 +148,28 @@ class IssueStatusUpdate(SQLModel):
 class IssueWithDetails(IssueResponse):
     project_title: str
     assignee_name: Optional[str] = None
-    creator_name: str
\ No newline at end of file
+    creator_name: str
+
+class IssueSearchResult(IssueWithDetails):
+    rank: float
+
+class IssueSearchPage(SQLModel):
+    items: List[IssueSearchResult]
+    limit: int
+    offset: int
+    has_more: bool
+
+class IssueBatch(SQLModel):
+    items: Dict[UUID, Optional[IssueWithDetails]]
+    not_found: List[UUID]
+
+class BoardColumn(SQLModel):
+    status: IssueStatus
+    total: int
+    items: List[IssueWithDetails]
+    next_cursor: Optional[str] = None
+
+class ProjectBoard(SQLModel):
+    project_id: UUID
+    limit: int
+    columns: List[BoardColumn]
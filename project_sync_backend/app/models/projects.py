@@ -20,9 +20,10 @@
 
 
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+from project_sync_backend.app.core.ids import uuid7
 
 class ProjectBase(SQLModel):
     title: str = Field(max_length=255)
@@ -32,7 +33,7 @@ class ProjectBase(SQLModel):
 class Project(ProjectBase, table=True):
     __tablename__ = "projects"
     
-    id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
+    id: Optional[UUID] = Field(default_factory=uuid7, primary_key=True)
     pm_id: UUID = Field(foreign_key="users.id")
     created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
@@ -53,4 +54,8 @@ class ProjectWithIssues(ProjectResponse):
     issues_count: int
     open_issues: int
     completed_issues: int
-    project_manager_name: str
\ No newline at end of file
+    project_manager_name: str
+
+class ProjectBatch(SQLModel):
+    items: Dict[UUID, Optional[ProjectResponse]]
+    not_found: List[UUID]
\ No newline at end of file
@@ -0,0 +1,51 @@
+from sqlmodel import SQLModel, Field
+from pydantic import Field as PydanticField
+from typing import Annotated, Any, List, Literal, Optional, Union
+from datetime import datetime
+from uuid import UUID
+from project_sync_backend.app.models.issue import IssueCreate, IssueAssign, IssueStatusUpdate
+from project_sync_backend.app.models.projects import ProjectCreate
+
+class SyncMutationBase(SQLModel):
+    # Generated by the client; a mutation id that was already applied is not applied again
+    client_mutation_id: str = Field(min_length=1, max_length=100)
+
+class CreateIssueMutation(SyncMutationBase):
+    type: Literal["create_issue"]
+    payload: IssueCreate
+
+class AssignIssueMutation(SyncMutationBase):
+    type: Literal["assign_issue"]
+    issue_id: UUID
+    payload: IssueAssign
+
+class IssueStatusMutation(SyncMutationBase):
+    type: Literal["update_issue_status"]
+    issue_id: UUID
+    payload: IssueStatusUpdate
+
+class UpdateProjectMutation(SyncMutationBase):
+    type: Literal["update_project"]
+    project_id: UUID
+    payload: ProjectCreate
+
+SyncMutation = Annotated[
+    Union[CreateIssueMutation, AssignIssueMutation, IssueStatusMutation, UpdateProjectMutation],
+    PydanticField(discriminator="type"),
+]
+
+class SyncPushRequest(SQLModel):
+    mutations: List[SyncMutation]
+
+class SyncMutationResult(SQLModel):
+    client_mutation_id: str
+    # applied, duplicate (applied by an earlier push) or rejected
+    status: Literal["applied", "duplicate", "rejected"]
+    status_code: int
+    data: Optional[Any] = None
+    detail: Optional[Any] = None
+
+class SyncPushResponse(SQLModel):
+    results: List[SyncMutationResult]
+    # Server time the batch started; changes after it may not be reflected in the results
+    watermark: datetime
@@ -2,9 +2,10 @@
 from project_sync_backend.app.models.projects import Project
 from project_sync_backend.app.models.issue import Issue
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+from project_sync_backend.app.core.ids import uuid7
 from enum import Enum
 from pydantic import EmailStr,validator,model_validator
 from project_sync_backend.app.core.validators import validate_email, validate_password, validate_username,StripWhitespaceMixin
@@ -32,7 +33,7 @@ class UserBase(StripWhitespaceMixin, SQLModel):
 class User(UserBase, table=True):
     __tablename__ = "users"
     
-    id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
+    id: Optional[UUID] = Field(default_factory=uuid7, primary_key=True)
     password_hash: str = Field(max_length=255)
     created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
@@ -74,6 +75,27 @@ class UserResponse(SQLModel):
     created_at: datetime
 
 
+class UserBatch(SQLModel):
+    items: Dict[UUID, Optional[UserResponse]]
+    not_found: List[UUID]
+
+class WorkloadIssue(SQLModel):
+    id: UUID
+    title: str
+    status: str
+    created_at: datetime
+
+class UserWorkload(SQLModel):
+    id: UUID
+    username: str
+    role: UserRole
+    assigned: int
+    in_progress: int
+    review: int
+    total_open: int
+    oldest_open: Optional[WorkloadIssue] = None
+
+
 class UserLogin(SQLModel):
     email: EmailStr
     password: str
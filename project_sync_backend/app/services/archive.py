@@ -0,0 +1,65 @@
+import logging
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import delete, insert, literal
+from sqlmodel import select
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.models.issue import Issue, IssueArchive, IssueListView, IssueStatus
+from project_sync_backend.app.services.read_model import DENORMALIZED_COLUMNS, denormalized_issue_select
+from project_sync_backend.app.services.response_cache import project_response_cache
+
+logger = logging.getLogger(__name__)
+
+def archive_batch(connection, cutoff, batch_size):
+    """Move one batch of completed issues last updated before ``cutoff``; returns how many moved.
+
+    Runs in the caller's transaction. On PostgreSQL the batch is claimed
+    with FOR UPDATE SKIP LOCKED, so rows a request is updating are left for
+    the next run instead of being waited on.
+    """
+    ids = connection.execute(
+        select(Issue.id)
+        .where(Issue.status == IssueStatus.COMPLETED, Issue.updated_at < cutoff)
+        .order_by(Issue.updated_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).scalars().all()
+    if not ids:
+        return 0
+
+    source = denormalized_issue_select().add_columns(literal(datetime.utcnow()).label("archived_at")).where(Issue.id.in_(ids))
+    target = [IssueArchive.__table__.c[name] for name in DENORMALIZED_COLUMNS + ("archived_at",)]
+    connection.execute(insert(IssueArchive.__table__).from_select(target, source))
+    connection.execute(delete(IssueListView.__table__).where(IssueListView.id.in_(ids)))
+    connection.execute(delete(Issue.__table__).where(Issue.id.in_(ids)))
+    return len(ids)
+
+def archive_completed_issues(bind, older_than_days=None, batch_size=None, max_batches=None, pause_seconds=0.1):
+    """Archive completed issues in short transactions, one batch each, until none are left"""
+    older_than_days = settings.ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        started = time.perf_counter()
+        with bind.begin() as connection:
+            moved = archive_batch(connection, cutoff, batch_size)
+        if not moved:
+            break
+        # Core writes skip the session hooks that invalidate cached responses
+        project_response_cache.bump("issues", "projects")
+        batches += 1
+        total += moved
+        metrics.observe("archive_batch_ms", (time.perf_counter() - started) * 1000)
+        logger.info(f"Archived batch {batches}: {moved} issues")
+        if moved < batch_size:
+            break
+        # Give other writers a turn between batches
+        time.sleep(pause_seconds)
+
+    metrics.increment("issues_archived_total", total)
+    logger.info(f"Archived {total} issues completed before {cutoff:%Y-%m-%d}")
+    return total
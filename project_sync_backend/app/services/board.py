@@ -0,0 +1,65 @@
+from sqlalchemy import func, tuple_
+from sqlmodel import Session, select
+from project_sync_backend.app.core.cursors import encode_cursor
+from project_sync_backend.app.models.issue import IssueListView, IssueStatus, IssueWithDetails, BoardColumn
+from project_sync_backend.app.services.read_model import issue_list_row
+
+BOARD_FIELDS = list(IssueWithDetails.model_fields)
+
+def board_statement(project_id, criteria, limit, status=None, after=None):
+    """One windowed query for a project's board.
+
+    Each row is numbered within its status column (newest first) and
+    carries the column's total, so the first ``limit + 1`` rows of every
+    column come back together; the extra row only says there is more.
+    With ``after`` (a column's cursor, so ``status`` is set too) the next
+    ``limit + 1`` rows of that column are returned instead.
+    """
+    order = (IssueListView.created_at.desc(), IssueListView.id.desc())
+    ranked = (
+        select(
+            *[getattr(IssueListView, name).label(name) for name in BOARD_FIELDS],
+            func.row_number().over(partition_by=IssueListView.status, order_by=order).label("position"),
+            func.count().over(partition_by=IssueListView.status).label("column_total"),
+        )
+        .where(IssueListView.project_id == project_id, *criteria)
+    )
+    if status is not None:
+        ranked = ranked.where(IssueListView.status == status)
+    ranked = ranked.subquery()
+
+    statement = select(*ranked.c).order_by(ranked.c.status, ranked.c.position)
+    if after is None:
+        return statement.where(ranked.c.position <= limit + 1)
+    return statement.where(tuple_(ranked.c.created_at, ranked.c.id) < tuple_(*after)).limit(limit + 1)
+
+def load_board(session: Session, project_id, criteria, limit, status=None, after=None):
+    """Board columns (every status, or just ``status``) with up to ``limit`` issues each"""
+    columns = {
+        column_status: {"total": 0, "rows": []}
+        for column_status in ([status] if status is not None else list(IssueStatus))
+    }
+    for row in session.exec(board_statement(project_id, criteria, limit, status, after)).mappings():
+        row = dict(row)
+        position = row.pop("position")
+        column = columns[row["status"]]
+        column["total"] = row.pop("column_total")
+        if after is None and position > limit:
+            column["more"] = True
+            continue
+        column["rows"].append(row)
+
+    board = []
+    for column_status, column in columns.items():
+        rows = column["rows"]
+        has_more = column.get("more", False)
+        if after is not None and len(rows) > limit:
+            rows, has_more = rows[:limit], True
+        items = [IssueWithDetails(**issue_list_row(row)) for row in rows]
+        board.append(BoardColumn(
+            status=column_status,
+            total=column["total"],
+            items=items,
+            next_cursor=encode_cursor(items[-1].created_at, items[-1].id) if has_more else None,
+        ))
+    return board
@@ -0,0 +1,9 @@
+from project_sync_backend.app.services.read_model import backfill_issue_list_view
+from project_sync_backend.app.services.search import ensure_search_schema
+from project_sync_backend.app.services.user_search import ensure_user_search_schema
+
+def bootstrap_schema(connection):
+    """Schema steps ``create_all`` cannot express, for databases not managed by Alembic"""
+    ensure_search_schema(connection)
+    ensure_user_search_schema(connection)
+    backfill_issue_list_view(connection)
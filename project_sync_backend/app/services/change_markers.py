@@ -0,0 +1,23 @@
+from sqlalchemy import func
+from sqlmodel import Session, select
+from project_sync_backend.app.models.issue import Issue
+from project_sync_backend.app.models.projects import Project
+
+# Rows are never deleted through the API (only the archive job removes
+# issues, which lowers the count) and every mutation bumps updated_at, so
+# (row count, latest updated_at) changes whenever anything in the scope
+# does. Both are answered from a single aggregate query.
+
+def issue_scope_marker(session: Session, *criteria):
+    statement = select(func.count(Issue.id), func.max(Issue.updated_at))
+    if criteria:
+        statement = statement.where(*criteria)
+    count, last_updated = session.exec(statement).one()
+    return f"issues:{count}:{last_updated}"
+
+def project_scope_marker(session: Session, *criteria):
+    statement = select(func.count(Project.id), func.max(Project.updated_at))
+    if criteria:
+        statement = statement.where(*criteria)
+    count, last_updated = session.exec(statement).one()
+    return f"projects:{count}:{last_updated}"
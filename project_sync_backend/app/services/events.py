@@ -0,0 +1,148 @@
+import logging
+import queue
+import threading
+import time
+from sqlalchemy import insert
+from sqlmodel import Session
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.db.database import engine
+from project_sync_backend.app.db.hooks import on_commit
+from project_sync_backend.app.models.issue import IssueEvent, IssueEventType
+from project_sync_backend.app.services.rollups import apply_events
+
+logger = logging.getLogger(__name__)
+
+class IssueEventWriter:
+    """Buffers issue events in memory and inserts them in batches from a background thread.
+
+    Events reach the buffer only after the request transaction commits, so
+    a rolled back write never shows up in the log. A batch is written when
+    ``batch_size`` events are waiting or ``flush_interval`` seconds have
+    passed, whichever comes first. If the buffer is full the events are
+    written synchronously instead of being dropped.
+
+    Each batch is folded into the dashboard rollups in the same transaction,
+    so the hot per-project rollup rows are locked once per batch by this
+    thread instead of by every issue write. Events that were already
+    inserted with the request (strict mode) go through the buffer as
+    ``stored`` to be folded only.
+    """
+
+    def __init__(self, bind, batch_size=None, flush_interval=None, max_queue=None):
+        self.bind = bind
+        self.batch_size = batch_size or settings.ISSUE_EVENTS_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.ISSUE_EVENTS_FLUSH_INTERVAL_SECONDS
+        self._queue = queue.Queue(maxsize=max_queue or settings.ISSUE_EVENTS_QUEUE_SIZE)
+        self._stopping = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="issue-event-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=10):
+        """Flush whatever is buffered and stop the writer thread"""
+        if not self.running:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def enqueue(self, events, stored=False):
+        if not self.running:
+            self._write_events(events, stored)
+            return
+        for index, issue_event in enumerate(events):
+            try:
+                self._queue.put_nowait((issue_event, stored))
+            except queue.Full:
+                metrics.increment("issue_events_overflow_total")
+                self._write_events(events[index:], stored)
+                return
+        metrics.set_gauge("issue_events_buffered", self._queue.qsize())
+
+    def _write_events(self, events, stored):
+        if stored:
+            self.write([], stored=events)
+        else:
+            self.write(events)
+
+    def write(self, rows, stored=()):
+        """Insert a batch of event rows (dicts) with one executemany and fold them into the rollups.
+
+        ``stored`` rows are already in issue_events and are only folded.
+        """
+        if not rows and not stored:
+            return
+        started = time.perf_counter()
+        with self.bind.begin() as connection:
+            if rows:
+                connection.execute(insert(IssueEvent.__table__), rows)
+            apply_events(connection, [*rows, *stored])
+        metrics.observe("issue_events_flush_ms", (time.perf_counter() - started) * 1000)
+        metrics.increment("issue_events_written_total", len(rows))
+
+    def _next_batch(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            rows = [issue_event for issue_event, stored in batch if not stored]
+            stored = [issue_event for issue_event, stored in batch if stored]
+            try:
+                self.write(rows, stored)
+            except Exception as e:
+                # The rows stay lost only if the retry fails too
+                logger.warning(f"Writing {len(batch)} issue events failed, retrying once: {e}")
+                time.sleep(self.flush_interval)
+                try:
+                    self.write(rows, stored)
+                except Exception as e:
+                    metrics.increment("issue_events_dropped_total", len(batch))
+                    logger.error(f"Dropped {len(batch)} issue events: {e}")
+
+issue_event_writer = IssueEventWriter(engine)
+
+def record_issue_event(session: Session, issue, event_type: IssueEventType, actor_id, from_status=None):
+    """Record a transition of ``issue`` as part of the session's current transaction.
+
+    In strict mode the event is inserted with the request's own writes;
+    otherwise it is handed to the buffered writer once the session commits.
+    Either way the buffered writer folds it into the dashboard rollups
+    after the commit, outside the request transaction.
+    """
+    issue_event = IssueEvent(
+        issue_id=issue.id,
+        project_id=issue.project_id,
+        event_type=event_type,
+        from_status=from_status,
+        to_status=issue.status,
+        actor_id=actor_id,
+        assignee_id=issue.assigned_to_id,
+    )
+    row = issue_event.model_dump()
+    if settings.ISSUE_EVENTS_STRICT:
+        session.add(issue_event)
+    on_commit(session, lambda: issue_event_writer.enqueue([row], stored=settings.ISSUE_EVENTS_STRICT))
+    return issue_event
@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+from fastapi import HTTPException, status
+from sqlmodel import Session, select
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.db.database import engine
+from project_sync_backend.app.models.issue import IssueCreate, IssueEventType, IssueResponse
+from project_sync_backend.app.models.projects import Project
+from project_sync_backend.app.models.user import User
+from project_sync_backend.app.services.events import record_issue_event
+from project_sync_backend.app.services.mutations import build_issue
+from project_sync_backend.app.services.read_model import sync_issue
+
+logger = logging.getLogger(__name__)
+
+class PendingCreate:
+    def __init__(self, user_id, payload: IssueCreate):
+        self.user_id = user_id
+        self.payload = payload
+        self.result = None
+        self.error = None
+        self.finished = False
+        self.leading = False
+        self.wake = threading.Event()
+        self._lock = threading.Lock()
+
+    def finish(self, result=None, error=None):
+        """Set the outcome; the first one wins, so a timed out caller keeps its 503"""
+        with self._lock:
+            if self.finished:
+                return
+            self.result = result
+            self.error = error
+            self.finished = True
+        self.wake.set()
+
+class IssueCreateBatcher:
+    """Coalesces concurrent issue creations into one INSERT and one commit.
+
+    The first request to arrive opens a batch and waits up to
+    ``max_wait_ms`` (or until ``max_batch`` requests have joined), then
+    writes the whole batch from its own thread while the others wait for
+    their result. Every caller gets its own response or error: a missing
+    project only fails that caller, and if the batch as a whole fails each
+    request is retried in a transaction of its own.
+
+    Callers never wait longer than ``max_wait`` plus ``write_timeout``
+    (STATEMENT_TIMEOUT_MS by default). A request still queued by then was
+    missed by the leader handoff, so it leads the queue itself; one whose
+    batch is still being written gets a 503.
+    """
+
+    def __init__(self, bind, max_batch=None, max_wait_ms=None, write_timeout=None):
+        self.bind = bind
+        self.max_batch = max_batch or settings.GROUP_COMMIT_MAX_BATCH
+        self.max_wait = (max_wait_ms or settings.GROUP_COMMIT_MAX_WAIT_MS) / 1000
+        self.write_timeout = write_timeout or settings.STATEMENT_TIMEOUT_MS / 1000
+        self._pending = []
+        self._condition = threading.Condition()
+
+    def create(self, user_id, payload: IssueCreate) -> IssueResponse:
+        item = PendingCreate(user_id, payload)
+        with self._condition:
+            self._pending.append(item)
+            item.leading = len(self._pending) == 1
+            if len(self._pending) >= self.max_batch:
+                self._condition.notify_all()
+
+        while not item.finished:
+            if item.leading:
+                item.leading = False
+                self._lead()
+                continue
+            # Woken either with a result or to lead the requests left over from a full batch
+            if not item.wake.wait(self.max_wait + self.write_timeout):
+                self._take_over(item)
+                continue
+            item.wake.clear()
+
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    def _take_over(self, item):
+        """Called when ``item`` waited too long: lead the queue if it is still in it, else give up"""
+        with self._condition:
+            if item.finished:
+                return
+            if item in self._pending:
+                logger.warning("Group commit leader handoff was missed; a waiting request takes over")
+                item.leading = True
+                return
+        metrics.increment("group_commit_timeouts_total")
+        item.finish(error=HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Issue creation timed out, please retry"
+        ))
+
+    def _lead(self):
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._pending) >= self.max_batch, timeout=self.max_wait)
+            batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+            if self._pending:
+                self._pending[0].leading = True
+                self._pending[0].wake.set()
+        try:
+            self._commit(batch)
+        finally:
+            # Nobody may be left waiting on a batch whose leader failed
+            for item in batch:
+                if not item.finished:
+                    item.finish(error=HTTPException(
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail="Issue creation failed, please retry"
+                    ))
+
+    def _commit(self, batch):
+        started = time.perf_counter()
+        try:
+            self._write(batch)
+        except Exception as e:
+            metrics.increment("group_commit_fallbacks_total")
+            logger.warning(f"Group commit of {len(batch)} issues failed, writing them one by one: {e}")
+            for item in batch:
+                if item.finished:
+                    continue
+                try:
+                    self._write([item])
+                except Exception as e:
+                    item.finish(error=e)
+        metrics.observe("group_commit_batch_size", len(batch))
+        metrics.observe("group_commit_ms", (time.perf_counter() - started) * 1000)
+
+    def _write(self, batch):
+        """Insert the issues of ``batch`` and their read model rows in one transaction"""
+        with Session(self.bind, expire_on_commit=False) as session:
+            # Load the projects and creators once; sync_issue finds them in the identity map
+            project_ids = {item.payload.project_id for item in batch}
+            found = {project.id for project in session.exec(select(Project).where(Project.id.in_(project_ids)))}
+            session.exec(select(User).where(User.id.in_({item.user_id for item in batch}))).all()
+
+            created = []
+            for item in batch:
+                if item.payload.project_id not in found:
+                    item.finish(error=HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Project not found"
+                    ))
+                    continue
+                created.append((item, build_issue(item.payload, item.user_id)))
+            if not created:
+                return
+
+            session.add_all([issue for _, issue in created])
+            session.flush()
+            for item, issue in created:
+                sync_issue(session, issue, is_new=True)
+                record_issue_event(session, issue, IssueEventType.CREATED, item.user_id)
+            session.commit()
+
+        for item, issue in created:
+            item.finish(IssueResponse.model_validate(issue))
+
+issue_create_batcher = IssueCreateBatcher(engine)
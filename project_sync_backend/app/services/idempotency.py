@@ -0,0 +1,174 @@
+import hashlib
+import json
+import logging
+import random
+from datetime import datetime, timedelta
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.lru import LRUCache
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.models.idempotency import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+CLEANUP_BATCH_SIZE = 1000
+
+def _sha256(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+class StoredResponse:
+    def __init__(self, request_hash, status_code, body, expires_at):
+        self.request_hash = request_hash
+        self.status_code = status_code
+        self.body = body
+        self.expires_at = expires_at
+
+    @property
+    def expired(self):
+        return self.expires_at <= datetime.utcnow()
+
+    @property
+    def seconds_left(self):
+        return max((self.expires_at - datetime.utcnow()).total_seconds(), 0)
+
+class StoredResponseCache(LRUCache):
+    """Recently stored responses, keyed by key hash; each is dropped when its key expires"""
+
+    def put(self, key_hash, stored):
+        return super().put(key_hash, stored, ttl=stored.seconds_left)
+
+response_cache = StoredResponseCache(settings.IDEMPOTENCY_CACHE_SIZE)
+
+class IdempotentRequest:
+    """One request carrying an Idempotency-Key.
+
+    ``replay`` is the stored response when the key was seen before;
+    otherwise the handler does its work and calls ``commit_idempotent``,
+    which saves the response in the same transaction as the write.
+    """
+
+    def __init__(self, user_id, scope, key, payload):
+        self.user_id = user_id
+        self.scope = scope
+        self.key_hash = _sha256(f"{user_id}:{scope}:{key}")
+        self.request_hash = _sha256(payload.model_dump_json())
+        self.replay = None
+
+    def check_matches(self, stored):
+        if stored.request_hash != self.request_hash:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used with a different request body"
+            )
+
+    def replay_response(self, stored):
+        self.check_matches(stored)
+        metrics.increment("idempotent_replays_total", scope=self.scope)
+        return JSONResponse(
+            status_code=stored.status_code,
+            content=json.loads(stored.body),
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+def is_key_conflict(error: IntegrityError):
+    """True if ``error`` is a duplicate idempotency key rather than some other constraint"""
+    # psycopg2 and psycopg 3 name the violated constraint; SQLite only says it in the message
+    constraint = getattr(getattr(error.orig, "diag", None), "constraint_name", None)
+    if constraint is not None:
+        return constraint == "idempotency_keys_pkey"
+    return "idempotency_keys.key_hash" in str(error.orig)
+
+def load_stored_response(session: Session, key_hash):
+    """Cached or stored response for ``key_hash``, ignoring expired ones"""
+    stored = response_cache.get(key_hash)
+    if stored is not None:
+        return stored
+    row = session.get(IdempotencyKey, key_hash)
+    if row is None:
+        return None
+    stored = StoredResponse(row.request_hash, row.status_code, row.response_body, row.expires_at)
+    if stored.expired:
+        # Free the key for reuse; the delete commits with the new write
+        session.delete(row)
+        return None
+    response_cache.put(key_hash, stored)
+    return stored
+
+def start_idempotent(session: Session, user_id, scope, key, payload):
+    """Begin handling a request that may carry an Idempotency-Key (None if it does not)"""
+    if not key:
+        return None
+    request = IdempotentRequest(user_id, scope, key, payload)
+    stored = load_stored_response(session, request.key_hash)
+    if stored is not None:
+        request.replay = request.replay_response(stored)
+    return request
+
+def stage_idempotent(session: Session, request, response, status_code=200):
+    """Add the key row for ``request`` to the session without committing"""
+    stored = StoredResponse(
+        request.request_hash,
+        status_code,
+        response.model_dump_json(),
+        datetime.utcnow() + timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS),
+    )
+    session.add(IdempotencyKey(
+        key_hash=request.key_hash,
+        user_id=request.user_id,
+        scope=request.scope,
+        request_hash=stored.request_hash,
+        status_code=stored.status_code,
+        response_body=stored.body,
+        expires_at=stored.expires_at,
+    ))
+    return stored
+
+def commit_idempotent(session: Session, request, response, status_code=200):
+    """Commit the handler's writes, storing ``response`` under the request's key.
+
+    Returns None on success. If a concurrent retry with the same key
+    committed first, the primary key on idempotency_keys makes this commit
+    fail; the writes are rolled back and the other request's response is
+    returned to replay instead.
+    """
+    if request is None:
+        session.commit()
+        return None
+
+    stored = stage_idempotent(session, request, response, status_code)
+    try:
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        metrics.increment("idempotent_conflicts_total", scope=request.scope)
+        stored = load_stored_response(session, request.key_hash)
+        if stored is None:
+            raise
+        return request.replay_response(stored)
+
+    response_cache.put(request.key_hash, stored)
+    if random.random() < settings.IDEMPOTENCY_CLEANUP_PROBABILITY:
+        purge_expired_keys(session)
+    return None
+
+def purge_expired_keys(session: Session):
+    """Delete up to CLEANUP_BATCH_SIZE expired keys; called on a small fraction of writes"""
+    expired = (
+        select(IdempotencyKey.key_hash)
+        .where(IdempotencyKey.expires_at < datetime.utcnow())
+        .limit(CLEANUP_BATCH_SIZE)
+    )
+    try:
+        result = session.exec(delete(IdempotencyKey).where(IdempotencyKey.key_hash.in_(expired)))
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        logger.warning(f"Cleaning up expired idempotency keys failed: {e}")
+        return 0
+    if result.rowcount:
+        logger.info(f"Removed {result.rowcount} expired idempotency keys")
+    return result.rowcount
@@ -0,0 +1,160 @@
+from datetime import datetime
+from uuid import UUID
+from fastapi import HTTPException, status
+from sqlmodel import Session, select
+from project_sync_backend.app.models.issue import Issue, IssueStatus, IssueEventType, IssueCreate, IssueAssign, IssueStatusUpdate
+from project_sync_backend.app.models.projects import Project, ProjectCreate
+from project_sync_backend.app.models.user import User, UserRole
+from project_sync_backend.app.services.events import record_issue_event
+from project_sync_backend.app.services.read_model import sync_issue, sync_project
+from project_sync_backend.app.services.partitioning import load_issue
+from project_sync_backend.app.services.notifications import notify_issue_assigned, notify_issue_status_changed
+from project_sync_backend.app.core.tasks import submit_after_commit
+
+# Business rules for issue and project writes, shared by the REST handlers
+# and the sync push endpoint. These functions validate and stage changes
+# on the session but never commit; the caller owns the transaction.
+
+def require_pm(current_user: User):
+    if current_user.role != UserRole.PM:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only Project Managers can perform this action"
+        )
+
+def apply_create_issue(session: Session, current_user: User, issue: IssueCreate) -> Issue:
+    # Verify project exists
+    project_statement = select(Project).where(Project.id == issue.project_id)
+    project = session.exec(project_statement).first()
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    
+    db_issue = build_issue(issue, current_user.id)
+    session.add(db_issue)
+    session.flush()
+    sync_issue(session, db_issue, is_new=True)
+    record_issue_event(session, db_issue, IssueEventType.CREATED, current_user.id)
+    return db_issue
+
+def build_issue(issue: IssueCreate, created_by_id: UUID) -> Issue:
+    return Issue(
+        title=issue.title,
+        description=issue.description,
+        priority=issue.priority,
+        issue_type=issue.issue_type,
+        project_id=issue.project_id,
+        created_by_id=created_by_id,
+        status=IssueStatus.OPEN  # Always starts as OPEN
+    )
+
+def apply_assign_issue(session: Session, current_user: User, issue_id: UUID, assignment: IssueAssign) -> Issue:
+    require_pm(current_user)
+    
+    # Get issue
+    issue = load_issue(session, issue_id)
+    if not issue:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Issue not found"
+        )
+    
+    # Verify assignee exists
+    assignee_statement = select(User).where(User.id == assignment.assigned_to_id)
+    assignee = session.exec(assignee_statement).first()
+    if not assignee:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    previous_status = issue.status
+    issue.assigned_to_id = assignment.assigned_to_id
+    issue.status = IssueStatus.ASSIGNED
+    issue.updated_at = datetime.utcnow()
+    sync_issue(session, issue)
+    record_issue_event(session, issue, IssueEventType.ASSIGNED, current_user.id, from_status=previous_status)
+    submit_after_commit(session, "notify_issue_assigned", notify_issue_assigned,
+                        issue.id, issue.title, issue.assigned_to_id, current_user.id)
+    return issue
+
+def apply_issue_status(session: Session, current_user: User, issue_id: UUID, status_update: IssueStatusUpdate) -> Issue:
+    issue = load_issue(session, issue_id)
+    if not issue:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Issue not found"
+        )
+    
+    # Permission checks
+    if current_user.role != UserRole.PM:
+        # Non-PM users can only update their assigned issues
+        if issue.assigned_to_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can only update issues assigned to you"
+            )
+        
+        # Non-PM users cannot mark as COMPLETED
+        if status_update.status == IssueStatus.COMPLETED:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only Project Manager can mark issues as completed"
+            )
+        
+        # Non-PM users cannot work on OPEN issues
+        if issue.status == IssueStatus.OPEN:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="This issue must be assigned by PM before you can work on it"
+            )
+    
+    # Status transition validation for non-PM users
+    if current_user.role != UserRole.PM:
+        valid_transitions = {
+            IssueStatus.ASSIGNED: [IssueStatus.IN_PROGRESS],
+            IssueStatus.IN_PROGRESS: [IssueStatus.REVIEW, IssueStatus.ASSIGNED],
+            IssueStatus.REVIEW: [IssueStatus.IN_PROGRESS],  # Can go back to in progress
+        }
+        
+        if issue.status not in valid_transitions or status_update.status not in valid_transitions[issue.status]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid status transition from {issue.status} to {status_update.status}"
+            )
+    
+    previous_status = issue.status
+    issue.status = status_update.status
+    issue.updated_at = datetime.utcnow()
+    sync_issue(session, issue)
+    record_issue_event(session, issue, IssueEventType.STATUS_CHANGED, current_user.id, from_status=previous_status)
+    submit_after_commit(session, "notify_issue_status_changed", notify_issue_status_changed,
+                        issue.id, issue.title, previous_status, issue.status,
+                        [issue.created_by_id, issue.assigned_to_id], current_user.id)
+    return issue
+
+def apply_update_project(session: Session, current_user: User, project_id: UUID, project_update: ProjectCreate) -> Project:
+    require_pm(current_user)
+    
+    statement = select(Project).where(Project.id == project_id)
+    project = session.exec(statement).first()
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    
+    # Only PM who created the project can update it
+    if project.pm_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only update projects you created"
+        )
+    
+    project.title = project_update.title
+    project.description = project_update.description
+    project.updated_at = datetime.utcnow()
+    sync_project(session, project)
+    return project
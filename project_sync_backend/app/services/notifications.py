@@ -0,0 +1,20 @@
+import logging
+from uuid import UUID
+from project_sync_backend.app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Post-commit side effects of issue changes. They run on the background
+# task runner (see core/tasks.py), never inside a request, so they may be
+# slow or fail and be retried without affecting the API. Delivery is a log
+# line for now; this is where e-mail or push delivery plugs in.
+
+def notify_issue_assigned(issue_id: UUID, title: str, assignee_id: UUID, actor_id: UUID):
+    logger.info(f"Notify user {assignee_id}: issue '{title}' ({issue_id}) was assigned to you by {actor_id}")
+    metrics.increment("notifications_sent_total", kind="issue_assigned")
+
+def notify_issue_status_changed(issue_id: UUID, title: str, from_status, to_status, recipient_ids, actor_id: UUID):
+    for recipient_id in recipient_ids:
+        if recipient_id and recipient_id != actor_id:
+            logger.info(f"Notify user {recipient_id}: issue '{title}' ({issue_id}) moved from {from_status} to {to_status}")
+            metrics.increment("notifications_sent_total", kind="issue_status_changed")
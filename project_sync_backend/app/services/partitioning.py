@@ -0,0 +1,301 @@
+import logging
+import re
+import threading
+import time
+from sqlalchemy import text
+from sqlmodel import Session, select
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.models.issue import Issue, IssueListView
+
+logger = logging.getLogger(__name__)
+
+# Optional PostgreSQL layout where issues is hash partitioned by project_id.
+#
+# Moving an existing installation over happens online, in three steps:
+#   1. prepare:  create issues_partitioned (same columns, PARTITION BY HASH
+#                (project_id)) and a trigger on issues that mirrors every
+#                insert, update and delete into it
+#   2. backfill: copy the existing rows over in id order, in small batches
+#   3. swap:     in one short transaction, check both tables agree, rename
+#                issues -> issues_unpartitioned and issues_partitioned ->
+#                issues, and drop the trigger
+# issues_unpartitioned is kept for a rollback and can be dropped once the
+# new table has been running for a while. Columns, indexes and foreign keys
+# are copied from the catalog, and the swap gives the new indexes the
+# names the old ones had.
+#
+# This is opted into with ``python -m project_sync_backend.app.cli
+# partition-issues``, which also has an ``unpartition`` step to go back. The
+# f4c2a8d61e93 migration can create the same layout offline instead (with
+# ``-x issue_partitions=N``).
+
+SHADOW_TABLE = "issues_partitioned"
+OLD_TABLE = "issues_unpartitioned"
+SYNC_FUNCTION = "issues_partitioned_sync"
+
+# Whether issues is partitioned, per engine; read from the catalog once
+_partitioned_binds = {}
+_partitioned_lock = threading.Lock()
+
+def partition_pruning_enabled(session: Session):
+    """True if issues is hash partitioned on the session's database (checked once per process)"""
+    bind = session.get_bind()
+    with _partitioned_lock:
+        if bind not in _partitioned_binds:
+            _partitioned_binds[bind] = bind.dialect.name == "postgresql" and issues_partitioned(session.connection())
+        return _partitioned_binds[bind]
+
+def issue_by_id(session: Session, issue_id):
+    """SELECT of one issue that lets the planner prune to a single partition.
+
+    Hash partitions are only pruned on project_id, so in partitioned mode
+    the key is looked up from issue_list_view (same transaction, keyed by
+    id) in a subquery that PostgreSQL evaluates before scanning issues.
+    The read model may lag behind issues, so load issues with load_issue,
+    which falls back to an unpruned lookup.
+    """
+    statement = select(Issue).where(Issue.id == issue_id)
+    if partition_pruning_enabled(session):
+        partition_key = select(IssueListView.project_id).where(IssueListView.id == issue_id).scalar_subquery()
+        statement = statement.where(Issue.project_id == partition_key)
+    return statement
+
+def load_issue(session: Session, issue_id):
+    """The issue with ``issue_id``, or None; issues itself decides, never issue_list_view.
+
+    Tries the pruned lookup first. If the read model has no row for the
+    issue (yet), it is looked up again by id alone, scanning every
+    partition's primary key index. Updates of the loaded issue are flushed
+    by id alone as well, which works the same way.
+    """
+    issue = session.exec(issue_by_id(session, issue_id)).first()
+    if issue is None and partition_pruning_enabled(session):
+        issue = session.exec(select(Issue).where(Issue.id == issue_id)).first()
+    return issue
+
+def _table_exists(connection, name):
+    return connection.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}).scalar()
+
+def _writable_columns(connection, table="issues"):
+    """Columns of ``table`` in order, leaving out generated ones (search_vector)"""
+    return connection.execute(text(
+        "SELECT attname FROM pg_attribute WHERE attrelid = CAST(:table AS regclass) "
+        "AND attnum > 0 AND NOT attisdropped AND attgenerated = '' ORDER BY attnum"
+    ), {"table": table}).scalars().all()
+
+def _index_names(connection, table):
+    return connection.execute(text(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE i.indrelid = CAST(:table AS regclass) ORDER BY c.relname"
+    ), {"table": table}).scalars().all()
+
+def _renamed_index(name, table):
+    """Name of the ``table`` copy of the issues index ``name`` (issues_pkey -> issues_partitioned_pkey)"""
+    return name.replace("issues", table, 1) if "issues" in name else f"{table}_{name}"
+
+def _copy_indexes(connection):
+    """Create every secondary index of issues on the shadow table (they cascade to the partitions)"""
+    indexes = connection.execute(text(
+        "SELECT c.relname, pg_get_indexdef(i.indexrelid), i.indisunique, "
+        "a.attnum = ANY(CAST(i.indkey AS int2[])) "
+        "FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attname = 'project_id' "
+        "WHERE i.indrelid = CAST('issues' AS regclass) AND NOT i.indisprimary"
+    )).all()
+    for name, definition, unique, has_partition_key in indexes:
+        if unique and not has_partition_key:
+            raise RuntimeError(f"Unique index {name} does not include project_id, which hash partitions require")
+        copy, replaced = re.subn(
+            r"^CREATE (UNIQUE )?INDEX \S+ ON (ONLY )?\S+ ",
+            lambda match: f"CREATE {match.group(1) or ''}INDEX {_renamed_index(name, SHADOW_TABLE)} ON {SHADOW_TABLE} ",
+            definition,
+        )
+        if not replaced:
+            raise RuntimeError(f"Cannot copy index {name}: {definition}")
+        connection.execute(text(copy))
+
+def _copy_foreign_keys(connection):
+    definitions = connection.execute(text(
+        "SELECT pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = CAST('issues' AS regclass) AND contype = 'f'"
+    )).scalars().all()
+    for definition in definitions:
+        connection.execute(text(f"ALTER TABLE {SHADOW_TABLE} ADD {definition}"))
+
+def issues_partitioned(connection):
+    """True once issues itself is the partitioned table"""
+    return connection.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = 'issues' AND c.relnamespace = current_schema()::regnamespace)"
+    )).scalar()
+
+def prepare_partitioned_issues(connection, partitions):
+    """Step 1: create issues_partitioned with ``partitions`` hash partitions and the sync trigger"""
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1")
+    if issues_partitioned(connection):
+        logger.info("issues is already partitioned")
+        return False
+    if _table_exists(connection, SHADOW_TABLE):
+        logger.info(f"{SHADOW_TABLE} already exists")
+        return False
+
+    connection.execute(text(
+        f"CREATE TABLE {SHADOW_TABLE} (LIKE issues INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS) "
+        "PARTITION BY HASH (project_id)"
+    ))
+    # Unique constraints on a partitioned table must include the partition key
+    connection.execute(text(
+        f"ALTER TABLE {SHADOW_TABLE} ADD CONSTRAINT {_renamed_index('issues_pkey', SHADOW_TABLE)} PRIMARY KEY (id, project_id)"
+    ))
+    _copy_foreign_keys(connection)
+    for remainder in range(partitions):
+        connection.execute(text(
+            f"CREATE TABLE {SHADOW_TABLE}_p{remainder} PARTITION OF {SHADOW_TABLE} "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        ))
+    _copy_indexes(connection)
+
+    columns = _writable_columns(connection)
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"NEW.{column}" for column in columns)
+    connection.execute(text(f"""
+        CREATE OR REPLACE FUNCTION {SYNC_FUNCTION}() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                DELETE FROM {SHADOW_TABLE} WHERE id = OLD.id AND project_id = OLD.project_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO {SHADOW_TABLE} ({column_list}) VALUES ({new_values})
+                ON CONFLICT (id, project_id) DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+    connection.execute(text(
+        f"CREATE TRIGGER {SYNC_FUNCTION} AFTER INSERT OR UPDATE OR DELETE ON issues "
+        f"FOR EACH ROW EXECUTE FUNCTION {SYNC_FUNCTION}()"
+    ))
+    logger.info(f"Created {SHADOW_TABLE} with {partitions} hash partitions")
+    return True
+
+def backfill_batch(connection, after_id, batch_size):
+    """Copy the next ``batch_size`` issues after ``after_id``; returns the last id copied (None when done)"""
+    # FOR SHARE holds off concurrent deletes until the copy commits, so a
+    # row deleted meanwhile cannot be resurrected in the new table
+    ids = connection.execute(
+        text("SELECT id FROM issues WHERE (CAST(:after AS uuid) IS NULL OR id > CAST(:after AS uuid)) "
+             "ORDER BY id LIMIT :limit FOR SHARE"),
+        {"after": after_id, "limit": batch_size},
+    ).scalars().all()
+    if not ids:
+        return None
+    column_list = ", ".join(_writable_columns(connection))
+    connection.execute(
+        text(f"INSERT INTO {SHADOW_TABLE} ({column_list}) SELECT {column_list} FROM issues "
+             "WHERE id = ANY(CAST(:ids AS uuid[])) ON CONFLICT (id, project_id) DO NOTHING"),
+        {"ids": [str(issue_id) for issue_id in ids]},
+    )
+    return ids[-1]
+
+def backfill_partitioned_issues(bind, batch_size=None, max_batches=None, pause_seconds=0.0):
+    """Step 2: copy existing issues into issues_partitioned, one transaction per batch"""
+    batch_size = batch_size or settings.PARTITION_BACKFILL_BATCH_SIZE
+    after_id = None
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        with bind.begin() as connection:
+            last_id = backfill_batch(connection, after_id, batch_size)
+        if last_id is None:
+            break
+        after_id = last_id
+        batches += 1
+        if batches % 100 == 0:
+            logger.info(f"Backfilled {batches} batches of issues, up to {after_id}")
+        if pause_seconds:
+            time.sleep(pause_seconds)
+    logger.info(f"Backfill finished after {batches} batches")
+    return batches
+
+def swap_partitioned_issues(connection):
+    """Step 3: make issues_partitioned the issues table; run in its own transaction"""
+    if issues_partitioned(connection):
+        logger.info("issues is already partitioned")
+        return False
+    # Blocks writers for the duration of the check and the renames
+    connection.execute(text("LOCK TABLE issues IN ACCESS EXCLUSIVE MODE"))
+    missing = connection.execute(text(
+        f"SELECT count(*) FROM issues i WHERE NOT EXISTS "
+        f"(SELECT 1 FROM {SHADOW_TABLE} p WHERE p.id = i.id AND p.project_id = i.project_id)"
+    )).scalar()
+    if missing:
+        raise RuntimeError(f"{missing} issues are not in {SHADOW_TABLE} yet; run the backfill first")
+    extra = connection.execute(text(
+        f"SELECT count(*) FROM {SHADOW_TABLE} p WHERE NOT EXISTS (SELECT 1 FROM issues i WHERE i.id = p.id)"
+    )).scalar()
+    if extra:
+        connection.execute(text(
+            f"DELETE FROM {SHADOW_TABLE} p WHERE NOT EXISTS (SELECT 1 FROM issues i WHERE i.id = p.id)"
+        ))
+        logger.warning(f"Removed {extra} rows from {SHADOW_TABLE} that no longer exist in issues")
+    index_names = _index_names(connection, "issues")
+    copied = set(_index_names(connection, SHADOW_TABLE))
+    missing_indexes = [name for name in index_names if _renamed_index(name, SHADOW_TABLE) not in copied]
+    if missing_indexes:
+        raise RuntimeError(
+            f"Indexes {', '.join(missing_indexes)} were added to issues after prepare; "
+            f"create them on {SHADOW_TABLE} as {', '.join(_renamed_index(name, SHADOW_TABLE) for name in missing_indexes)} first"
+        )
+
+    connection.execute(text(f"DROP TRIGGER {SYNC_FUNCTION} ON issues"))
+    connection.execute(text(f"DROP FUNCTION {SYNC_FUNCTION}()"))
+    connection.execute(text(f"ALTER TABLE issues RENAME TO {OLD_TABLE}"))
+    connection.execute(text(f"ALTER TABLE {SHADOW_TABLE} RENAME TO issues"))
+    for name in index_names:
+        connection.execute(text(f"ALTER INDEX {name} RENAME TO {_renamed_index(name, OLD_TABLE)}"))
+        connection.execute(text(f"ALTER INDEX {_renamed_index(name, SHADOW_TABLE)} RENAME TO {name}"))
+    logger.info(f"issues is now hash partitioned; the previous table is kept as {OLD_TABLE}")
+    return True
+
+def drop_partitioned_shadow(connection):
+    """Undo step 1 (before the swap): drop the trigger and issues_partitioned"""
+    connection.execute(text(f"DROP TRIGGER IF EXISTS {SYNC_FUNCTION} ON issues"))
+    connection.execute(text(f"DROP FUNCTION IF EXISTS {SYNC_FUNCTION}()"))
+    connection.execute(text(f"DROP TABLE IF EXISTS {SHADOW_TABLE}"))
+
+def unpartition_issues(connection):
+    """Go back to the plain issues table, copying rows written since the swap (takes a lock on issues)"""
+    if not issues_partitioned(connection):
+        drop_partitioned_shadow(connection)
+        return False
+    if not _table_exists(connection, OLD_TABLE):
+        raise RuntimeError(f"{OLD_TABLE} was dropped; cannot switch back to an unpartitioned issues table")
+    connection.execute(text("LOCK TABLE issues IN ACCESS EXCLUSIVE MODE"))
+    column_list = ", ".join(_writable_columns(connection, OLD_TABLE))
+    index_names = _index_names(connection, "issues")
+    kept = set(_index_names(connection, OLD_TABLE))
+    connection.execute(text(f"TRUNCATE {OLD_TABLE}"))
+    connection.execute(text(f"INSERT INTO {OLD_TABLE} ({column_list}) SELECT {column_list} FROM issues"))
+    connection.execute(text("DROP TABLE issues"))
+    connection.execute(text(f"ALTER TABLE {OLD_TABLE} RENAME TO issues"))
+    for name in index_names:
+        if _renamed_index(name, OLD_TABLE) in kept:
+            connection.execute(text(f"ALTER INDEX {_renamed_index(name, OLD_TABLE)} RENAME TO {name}"))
+    return True
+
+def partitioning_status(connection):
+    """Where an installation is in the prepare/backfill/swap sequence"""
+    if issues_partitioned(connection):
+        partitions = connection.execute(text(
+            "SELECT count(*) FROM pg_inherits WHERE inhparent = 'issues'::regclass"
+        )).scalar()
+        return {"state": "partitioned", "partitions": partitions,
+                "old_table_kept": _table_exists(connection, OLD_TABLE)}
+    if _table_exists(connection, SHADOW_TABLE):
+        return {
+            "state": "backfilling",
+            "issues": connection.execute(text("SELECT count(*) FROM issues")).scalar(),
+            "copied": connection.execute(text(f"SELECT count(*) FROM {SHADOW_TABLE}")).scalar(),
+        }
+    return {"state": "unpartitioned"}
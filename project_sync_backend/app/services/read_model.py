@@ -0,0 +1,100 @@
+import logging
+from sqlalchemy import delete, insert, update
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, select
+from project_sync_backend.app.models.issue import Issue, IssueListView
+from project_sync_backend.app.models.projects import Project
+from project_sync_backend.app.models.user import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+# Columns copied verbatim from issues into issue_list_view
+ISSUE_COLUMNS = (
+    "id", "title", "description", "priority", "issue_type", "status", "project_id",
+    "assigned_to_id", "created_by_id", "created_at", "updated_at",
+)
+
+ISSUE_LIST_DEFAULTS = {"project_title": "Unknown", "creator_name": "Unknown"}
+
+def visible_to(model, user):
+    """Criteria limiting ``model`` (issues, issue_list_view or issues_archive) to what ``user`` may list"""
+    if user.role == UserRole.PM:
+        # PM can see all issues
+        return []
+    # Others see only their assigned issues
+    return [model.assigned_to_id == user.id]
+
+def issue_list_row(row):
+    """A listing row (mapping) with the placeholders used for missing names"""
+    return {
+        name: ISSUE_LIST_DEFAULTS.get(name) if value is None else value
+        for name, value in row.items()
+    }
+
+def sync_issue(session: Session, issue: Issue, is_new: bool = False):
+    """Upsert the issue_list_view row for ``issue`` in the caller's transaction.
+
+    The project and users are usually already in the session's identity
+    map (the handler loaded them), so this rarely costs extra queries.
+    """
+    row = None if is_new else session.get(IssueListView, issue.id)
+    if row is None:
+        row = IssueListView(id=issue.id, project_id=issue.project_id, created_by_id=issue.created_by_id,
+                            status=issue.status, title=issue.title, priority=issue.priority,
+                            issue_type=issue.issue_type)
+        session.add(row)
+    for name in ISSUE_COLUMNS:
+        setattr(row, name, getattr(issue, name))
+
+    project = session.get(Project, issue.project_id)
+    creator = session.get(User, issue.created_by_id)
+    assignee = session.get(User, issue.assigned_to_id) if issue.assigned_to_id else None
+    row.project_title = project.title if project else None
+    row.creator_name = creator.username if creator else None
+    row.assignee_name = assignee.username if assignee else None
+
+def sync_project(session: Session, project: Project):
+    """Propagate a project's title to its issues' list rows"""
+    session.exec(
+        update(IssueListView)
+        .where(IssueListView.project_id == project.id)
+        .values(project_title=project.title)
+    )
+
+DENORMALIZED_COLUMNS = ISSUE_COLUMNS + ("project_title", "assignee_name", "creator_name")
+
+def denormalized_issue_select():
+    """Issue columns plus project title and user names, in DENORMALIZED_COLUMNS order"""
+    assignee = aliased(User)
+    creator = aliased(User)
+    return (
+        select(
+            *[getattr(Issue, name) for name in ISSUE_COLUMNS],
+            Project.title,
+            assignee.username,
+            creator.username,
+        )
+        .select_from(Issue)
+        .join(Project, Project.id == Issue.project_id, isouter=True)
+        .join(assignee, assignee.id == Issue.assigned_to_id, isouter=True)
+        .join(creator, creator.id == Issue.created_by_id, isouter=True)
+    )
+
+def rebuild_statement():
+    """INSERT ... SELECT that fills issue_list_view from the normalized tables"""
+    target = [IssueListView.__table__.c[name] for name in DENORMALIZED_COLUMNS]
+    return insert(IssueListView.__table__).from_select(target, denormalized_issue_select())
+
+def rebuild_issue_list_view(connection):
+    """Recreate every issue_list_view row; run inside a transaction"""
+    connection.execute(delete(IssueListView.__table__))
+    result = connection.execute(rebuild_statement())
+    logger.info(f"Rebuilt issue_list_view with {result.rowcount} rows")
+    return result.rowcount
+
+def backfill_issue_list_view(connection):
+    """Populate an empty read model when issues already exist (first deploy)"""
+    has_rows = connection.execute(select(IssueListView.id).limit(1)).first()
+    has_issues = connection.execute(select(Issue.id).limit(1)).first()
+    if has_issues and not has_rows:
+        rebuild_issue_list_view(connection)
@@ -0,0 +1,244 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from sqlalchemy import event
+from sqlmodel import Session
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.lru import LRUCache
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.db.database import session_router
+from project_sync_backend.app.db.hooks import on_commit
+from project_sync_backend.app.models.issue import Issue
+from project_sync_backend.app.models.projects import Project
+
+logger = logging.getLogger(__name__)
+
+# Cached GET responses for the project routes.
+#
+# Keys carry the current version of every scope the response is built from
+# ("projects", "issues"). Committed writes to those tables bump the
+# version, so older entries are never read again and age out of the LRU.
+# A version is the bump's wall clock time in nanoseconds, which also tells
+# how long ago the scope last changed.
+
+SCOPE_MODELS = {Project: "projects", Issue: "issues"}
+
+def _new_version(current):
+    return max(current + 1, time.time_ns())
+
+class MemoryCacheBackend:
+    """LRU of at most ``max_entries`` values in this process, each kept ``ttl`` seconds.
+
+    Versions are per process too: with several workers, a write made in
+    another worker (or by a maintenance command) is only seen here once the
+    entry expires. Deployments running more than one worker use the SQLite
+    backend.
+    """
+
+    def __init__(self, max_entries, ttl):
+        self._items = LRUCache(max_entries, ttl)
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self._items.get(key)
+
+    def put(self, key, value):
+        evicted = self._items.put(key, value)
+        if evicted:
+            metrics.increment("response_cache_evictions_total", evicted)
+
+    def versions(self, scopes):
+        with self._lock:
+            return tuple(self._versions.get(scope, 0) for scope in scopes)
+
+    def bump(self, scopes):
+        with self._lock:
+            for scope in scopes:
+                self._versions[scope] = _new_version(self._versions.get(scope, 0))
+
+    def clear(self):
+        self._items.clear()
+
+class SQLiteCacheBackend:
+    """Entries and versions in a local SQLite file shared by the workers of one host.
+
+    Values are stored as JSON. Each thread keeps its own connection; the
+    file runs in WAL mode so readers do not block the occasional writer.
+    """
+
+    def __init__(self, path, max_entries, ttl):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local = threading.local()
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS ix_response_cache_used_at ON response_cache (used_at)")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache_versions (scope TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+        )
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit: every statement is its own short transaction
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            self._local.connection = connection
+        return connection
+
+    def get(self, key):
+        connection = self._connection()
+        now = time.time()
+        row = connection.execute("SELECT value, expires_at FROM response_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at <= now:
+            connection.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+            return None
+        connection.execute("UPDATE response_cache SET used_at = ? WHERE key = ?", (now, key))
+        return json.loads(value)
+
+    def put(self, key, value):
+        connection = self._connection()
+        now = time.time()
+        connection.execute(
+            "INSERT OR REPLACE INTO response_cache (key, value, expires_at, used_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), now + self.ttl, now),
+        )
+        evicted = connection.execute(
+            "DELETE FROM response_cache WHERE key IN "
+            "(SELECT key FROM response_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        ).rowcount
+        if evicted > 0:
+            metrics.increment("response_cache_evictions_total", evicted)
+
+    def versions(self, scopes):
+        placeholders = ", ".join("?" for _ in scopes)
+        rows = dict(self._connection().execute(
+            f"SELECT scope, version FROM response_cache_versions WHERE scope IN ({placeholders})", tuple(scopes)
+        ).fetchall())
+        return tuple(rows.get(scope, 0) for scope in scopes)
+
+    def bump(self, scopes):
+        connection = self._connection()
+        for scope in scopes:
+            connection.execute(
+                "INSERT INTO response_cache_versions (scope, version) VALUES (?, ?) "
+                "ON CONFLICT (scope) DO UPDATE SET version = max(version + 1, excluded.version)",
+                (scope, time.time_ns()),
+            )
+
+    def clear(self):
+        self._connection().execute("DELETE FROM response_cache")
+
+class Flight:
+    def __init__(self):
+        self.value = None
+        self.error = None
+        self.done = threading.Event()
+
+class ProjectResponseCache:
+    """Versioned response cache with single-flight loading.
+
+    Concurrent misses on the same key run ``loader`` once; the other
+    callers wait for its result (or its error), for at most the statement
+    timeout before loading it themselves. A failing backend only costs the
+    cache: requests then go to the database as if it were off.
+    """
+
+    def __init__(self, backend, enabled=True):
+        self.backend = backend
+        self.enabled = enabled
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def bump(self, *scopes):
+        try:
+            self.backend.bump(scopes)
+        except Exception as e:
+            logger.error(f"Bumping response cache versions {scopes} failed: {e}")
+
+    def get_or_load(self, parts, scopes, loader, settled=True):
+        """Cached value for ``parts`` at the current version of ``scopes``, calling ``loader()`` on a miss.
+
+        With ``settled=False`` (read on a replica) a fresh result is not
+        stored while a scope changed within READ_YOUR_WRITES_SECONDS, since
+        the replica may not have that change yet.
+        """
+        if not self.enabled:
+            return loader()
+        try:
+            versions = self.backend.versions(scopes)
+            key = "|".join(str(part) for part in (*parts, *versions))
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Response cache lookup failed: {e}")
+            return loader()
+        if value is not None:
+            metrics.increment("response_cache_hits_total")
+            return value
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leading = flight is None
+            if leading:
+                flight = self._flights[key] = Flight()
+        if not leading:
+            metrics.increment("response_cache_coalesced_total")
+            if not flight.done.wait(settings.STATEMENT_TIMEOUT_MS / 1000):
+                metrics.increment("response_cache_wait_timeouts_total")
+                return loader()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        metrics.increment("response_cache_misses_total")
+        try:
+            flight.value = loader()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+        changed_since = (time.time_ns() - max(versions)) / 1e9
+        if settled or changed_since >= settings.READ_YOUR_WRITES_SECONDS:
+            try:
+                self.backend.put(key, flight.value)
+            except Exception as e:
+                logger.warning(f"Response cache store failed: {e}")
+        return flight.value
+
+def _create_backend():
+    if settings.RESPONSE_CACHE_BACKEND == "sqlite":
+        return SQLiteCacheBackend(settings.RESPONSE_CACHE_SQLITE_PATH, settings.RESPONSE_CACHE_MAX_ENTRIES,
+                                  settings.RESPONSE_CACHE_TTL_SECONDS)
+    return MemoryCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+project_response_cache = ProjectResponseCache(_create_backend(), settings.RESPONSE_CACHE_ENABLED)
+
+def reads_primary(session: Session):
+    """True when ``session`` reads from the primary, which always has the latest commits"""
+    return not session_router.has_replica or session.get_bind() is session_router.primary
+
+@event.listens_for(Session, "after_flush")
+def bump_changed_scopes(session, flush_context):
+    """Bump the versions of the tables this flush wrote to once the transaction commits"""
+    scopes = {
+        SCOPE_MODELS[type(instance)]
+        for instance in (*session.new, *session.dirty, *session.deleted)
+        if type(instance) in SCOPE_MODELS
+    }
+    if scopes:
+        on_commit(session, lambda: project_response_cache.bump(*sorted(scopes)))
@@ -0,0 +1,170 @@
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+from sqlalchemy import delete, func, insert, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+from project_sync_backend.app.models.analytics import IssueDailyRollup, StatusDurationRollup
+from project_sync_backend.app.models.issue import IssueEvent, IssueEventType, IssueStatus
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_COUNTERS = ("opened", "assigned", "completed")
+
+def _upsert_increment(connection, model, keys, increments):
+    """INSERT ... ON CONFLICT DO UPDATE adding ``increments`` to the existing row"""
+    insert_factory = postgresql.insert if connection.dialect.name == "postgresql" else sqlite.insert
+    table = model.__table__
+    statement = insert_factory(table).values(**keys, **increments)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={name: table.c[name] + statement.excluded[name] for name in increments},
+    )
+    connection.execute(statement)
+
+def counter_increments(event_type, to_status):
+    """Which daily counters a transition bumps"""
+    if event_type == IssueEventType.CREATED:
+        return {"opened": 1}
+    if event_type == IssueEventType.ASSIGNED:
+        return {"assigned": 1}
+    if to_status == IssueStatus.COMPLETED:
+        return {"completed": 1}
+    return {}
+
+def fold_events(events, entered_status_at=None):
+    """Daily counters and status durations for ``events`` (mappings of issue_events columns).
+
+    Events must come in ``created_at`` order within each issue. Time in a
+    status runs from the event that moved the issue into it to the event
+    that moved it out; ``entered_status_at`` maps issue ids to when they
+    entered their status before the first of ``events``.
+    """
+    daily = defaultdict(lambda: dict.fromkeys(ROLLUP_COUNTERS, 0))
+    durations = defaultdict(lambda: {"total_seconds": 0.0, "transitions": 0})
+    entered_status_at = dict(entered_status_at or {})
+    for issue_event in events:
+        issue_id, from_status, to_status = issue_event["issue_id"], issue_event["from_status"], issue_event["to_status"]
+        occurred_at = issue_event["created_at"]
+        day = occurred_at.date()
+        for name, value in counter_increments(issue_event["event_type"], to_status).items():
+            daily[(issue_event["project_id"], day)][name] += value
+        if from_status == to_status:
+            continue
+        entered_at = entered_status_at.get(issue_id)
+        if from_status is not None and entered_at is not None:
+            bucket = durations[(issue_event["project_id"], day, from_status)]
+            bucket["total_seconds"] += max((occurred_at - entered_at).total_seconds(), 0.0)
+            bucket["transitions"] += 1
+        entered_status_at[issue_id] = occurred_at
+    return daily, durations
+
+def _status_entered_before(connection, events):
+    """When each issue of ``events`` last changed status before its first event in ``events``"""
+    first_event_at = {}
+    for issue_event in events:
+        issue_id = issue_event["issue_id"]
+        first_event_at[issue_id] = min(first_event_at.get(issue_id, issue_event["created_at"]), issue_event["created_at"])
+    rows = connection.execute(
+        select(IssueEvent.issue_id, IssueEvent.created_at).where(
+            IssueEvent.issue_id.in_(list(first_event_at)),
+            IssueEvent.id.not_in([issue_event["id"] for issue_event in events]),
+            or_(IssueEvent.from_status.is_(None), IssueEvent.from_status != IssueEvent.to_status),
+        )
+    )
+    entered_status_at = {}
+    for issue_id, created_at in rows:
+        if created_at <= first_event_at[issue_id] and created_at > entered_status_at.get(issue_id, created_at.min):
+            entered_status_at[issue_id] = created_at
+    return entered_status_at
+
+def apply_events(connection, events):
+    """Fold a batch of issue events into the rollups with one upsert per rollup row.
+
+    The events may already be in issue_events (same transaction) or not
+    yet; earlier events of the same issues are read from the log.
+    """
+    if not events:
+        return
+    events = sorted(events, key=lambda issue_event: issue_event["created_at"])
+    daily, durations = fold_events(events, _status_entered_before(connection, events))
+    for (project_id, day), counts in daily.items():
+        increments = {name: value for name, value in counts.items() if value}
+        if increments:
+            _upsert_increment(connection, IssueDailyRollup, {"project_id": project_id, "day": day}, increments)
+    for (project_id, day, status), totals in durations.items():
+        _upsert_increment(connection, StatusDurationRollup, {"project_id": project_id, "day": day, "status": status}, totals)
+
+def rebuild_rollups(connection):
+    """Recompute every rollup row from the issue_events log; run inside a transaction"""
+    events = connection.execute(
+        select(
+            IssueEvent.issue_id, IssueEvent.project_id, IssueEvent.event_type,
+            IssueEvent.from_status, IssueEvent.to_status, IssueEvent.created_at,
+        ).order_by(IssueEvent.issue_id, IssueEvent.created_at)
+    ).mappings()
+    daily, durations = fold_events(events)
+
+    connection.execute(delete(IssueDailyRollup.__table__))
+    connection.execute(delete(StatusDurationRollup.__table__))
+    if daily:
+        connection.execute(insert(IssueDailyRollup.__table__), [
+            {"project_id": project_id, "day": day, **counts} for (project_id, day), counts in daily.items()
+        ])
+    if durations:
+        connection.execute(insert(StatusDurationRollup.__table__), [
+            {"project_id": project_id, "day": day, "status": status, **totals}
+            for (project_id, day, status), totals in durations.items()
+        ])
+    logger.info(f"Rebuilt rollups: {len(daily)} daily rows, {len(durations)} status duration rows")
+    return len(daily), len(durations)
+
+def period_start(day: date, interval: str) -> date:
+    """First day of the day/week bucket ``day`` falls in (weeks start on Monday)"""
+    if interval == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+def issue_trends(session: Session, start: date, end: date, interval: str, project_id=None):
+    """Opened/assigned/completed counts per period, with empty periods filled in"""
+    statement = (
+        select(IssueDailyRollup.day, *[func.sum(getattr(IssueDailyRollup, name)) for name in ROLLUP_COUNTERS])
+        .where(IssueDailyRollup.day >= start, IssueDailyRollup.day <= end)
+        .group_by(IssueDailyRollup.day)
+    )
+    if project_id is not None:
+        statement = statement.where(IssueDailyRollup.project_id == project_id)
+
+    step = timedelta(days=7 if interval == "week" else 1)
+    series = {}
+    current = period_start(start, interval)
+    while current <= end:
+        series[current] = dict.fromkeys(ROLLUP_COUNTERS, 0)
+        current += step
+    for day, *counts in session.exec(statement):
+        bucket = series[period_start(day, interval)]
+        for name, value in zip(ROLLUP_COUNTERS, counts):
+            bucket[name] += value or 0
+    return [{"period": period, **counts} for period, counts in series.items()]
+
+def time_in_status(session: Session, start: date, end: date, project_id=None):
+    """Average time spent in each status, for transitions out of it between start and end"""
+    statement = (
+        select(
+            StatusDurationRollup.status,
+            func.sum(StatusDurationRollup.total_seconds),
+            func.sum(StatusDurationRollup.transitions),
+        )
+        .where(StatusDurationRollup.day >= start, StatusDurationRollup.day <= end)
+        .group_by(StatusDurationRollup.status)
+    )
+    if project_id is not None:
+        statement = statement.where(StatusDurationRollup.project_id == project_id)
+    return [
+        {
+            "status": status,
+            "transitions": transitions,
+            "averageSeconds": round(total_seconds / transitions, 1) if transitions else None,
+        }
+        for status, total_seconds, transitions in session.exec(statement)
+    ]
@@ -0,0 +1,141 @@
+import re
+from fastapi import HTTPException, status
+from sqlalchemy import func, literal_column, table, column, text
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, select
+from project_sync_backend.app.models.issue import Issue
+from project_sync_backend.app.models.projects import Project
+from project_sync_backend.app.models.user import User, UserRole
+
+MAX_SEARCH_TERMS = 8
+
+# Weighted so title matches rank above description matches
+PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+# SQLite: an FTS5 table with its own copy of the text. Issues have UUID keys,
+# so FTS rows are tied to them through issues_fts_keys, whose INTEGER PRIMARY
+# KEY survives VACUUM (the implicit rowid of issues does not).
+SQLITE_SEARCH_DDL = [
+    """CREATE TABLE IF NOT EXISTS issues_fts_keys (
+        fts_rowid INTEGER PRIMARY KEY AUTOINCREMENT, issue_id CHAR(32) NOT NULL UNIQUE
+    )""",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5(title, description)",
+    """CREATE TRIGGER IF NOT EXISTS issues_fts_ai AFTER INSERT ON issues BEGIN
+        INSERT INTO issues_fts_keys(issue_id) VALUES (new.id);
+        INSERT INTO issues_fts(rowid, title, description) VALUES (last_insert_rowid(), new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS issues_fts_ad AFTER DELETE ON issues BEGIN
+        DELETE FROM issues_fts WHERE rowid = (SELECT fts_rowid FROM issues_fts_keys WHERE issue_id = old.id);
+        DELETE FROM issues_fts_keys WHERE issue_id = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS issues_fts_au AFTER UPDATE OF title, description ON issues BEGIN
+        UPDATE issues_fts SET title = new.title, description = new.description
+        WHERE rowid = (SELECT fts_rowid FROM issues_fts_keys WHERE issue_id = old.id);
+    END""",
+]
+
+SQLITE_SEARCH_REBUILD = [
+    "DELETE FROM issues_fts",
+    "DELETE FROM issues_fts_keys",
+    "INSERT INTO issues_fts_keys(issue_id) SELECT id FROM issues",
+    """INSERT INTO issues_fts(rowid, title, description)
+        SELECT k.fts_rowid, i.title, i.description FROM issues i JOIN issues_fts_keys k ON k.issue_id = i.id""",
+]
+
+def _drop_rowid_search_schema(connection):
+    """Drop the first SQLite layout, an external-content table keyed by issues.rowid"""
+    for trigger in ("issues_fts_ai", "issues_fts_ad", "issues_fts_au"):
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    connection.execute(text("DROP TABLE issues_fts"))
+
+def ensure_search_schema(connection):
+    """Create the full-text search structures if missing.
+
+    PostgreSQL gets a generated ``search_vector`` column with a GIN index
+    (the same as the Alembic migration); SQLite gets an FTS5 table kept in
+    sync by triggers.
+    """
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        connection.execute(text(
+            f"ALTER TABLE issues ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({PG_SEARCH_VECTOR}) STORED"
+        ))
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_issues_search_vector ON issues USING GIN (search_vector)"
+        ))
+    elif dialect == "sqlite":
+        existing = connection.execute(text(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'issues_fts'"
+        )).scalar()
+        if existing is not None and "content_rowid" in existing:
+            _drop_rowid_search_schema(connection)
+        for statement in SQLITE_SEARCH_DDL:
+            connection.execute(text(statement))
+        if existing is None or "content_rowid" in existing:
+            for statement in SQLITE_SEARCH_REBUILD:
+                connection.execute(text(statement))
+
+def search_terms(q: str):
+    return re.findall(r"\w+", q.lower())[:MAX_SEARCH_TERMS]
+
+def search_issues(session: Session, current_user: User, q: str, limit: int, offset: int):
+    """Ranked, prefix-matching search over issue titles and descriptions.
+
+    Scoped like get_issues: PMs search all issues, everyone else only the
+    issues assigned to them. Returns ``(rows, has_more)`` where each row is
+    ``(issue, project_title, assignee_name, creator_name, rank)``.
+    """
+    terms = search_terms(q)
+    if not terms:
+        return [], False
+
+    assignee = aliased(User)
+    creator = aliased(User)
+    dialect = session.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        vector = literal_column("issues.search_vector")
+        tsquery = func.to_tsquery("english", " & ".join(f"{term}:*" for term in terms))
+        rank = func.ts_rank_cd(vector, tsquery)
+        statement = (
+            select(Issue, Project.title, assignee.username, creator.username, rank.label("rank"))
+            .select_from(Issue)
+            .where(vector.op("@@")(tsquery))
+        )
+        order_by = [rank.desc(), Issue.created_at.desc()]
+    elif dialect == "sqlite":
+        fts = table("issues_fts", column("rowid"))
+        fts_keys = table("issues_fts_keys", column("fts_rowid"), column("issue_id"))
+        match = " ".join(f'"{term}"*' for term in terms)
+        # bm25() is lower-is-better; negate it so rank reads like ts_rank
+        rank = -func.bm25(literal_column("issues_fts"))
+        statement = (
+            select(Issue, Project.title, assignee.username, creator.username, rank.label("rank"))
+            .select_from(Issue)
+            .join(fts_keys, fts_keys.c.issue_id == Issue.id)
+            .join(fts, fts.c.rowid == fts_keys.c.fts_rowid)
+            .where(literal_column("issues_fts").op("MATCH")(match))
+        )
+        order_by = [rank.desc(), Issue.created_at.desc()]
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Issue search is only available on PostgreSQL and SQLite"
+        )
+
+    statement = (
+        statement
+        .join(Project, Project.id == Issue.project_id, isouter=True)
+        .join(assignee, assignee.id == Issue.assigned_to_id, isouter=True)
+        .join(creator, creator.id == Issue.created_by_id, isouter=True)
+    )
+    if current_user.role != UserRole.PM:
+        statement = statement.where(Issue.assigned_to_id == current_user.id)
+
+    # Fetch one extra row to know whether another page exists without a COUNT
+    rows = session.exec(statement.order_by(*order_by).limit(limit + 1).offset(offset)).all()
+    return rows[:limit], len(rows) > limit
@@ -0,0 +1,87 @@
+from sqlalchemy import case, func, or_, text
+from sqlmodel import Session, select
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.lru import LRUCache
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.models.user import User, UserResponse
+
+# Substring matching only kicks in from this many characters: below it a
+# trigram index cannot help and a prefix match is what autocomplete wants
+MIN_SUBSTRING_LENGTH = 3
+
+PG_USER_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    # text_pattern_ops serves LIKE 'prefix%' regardless of collation
+    "CREATE INDEX IF NOT EXISTS ix_users_username_prefix ON users (lower(username) text_pattern_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_prefix ON users (lower(email) text_pattern_ops)",
+    # Trigram indexes serve LIKE '%substring%'
+    "CREATE INDEX IF NOT EXISTS ix_users_username_trgm ON users USING gin (lower(username) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING gin (lower(email) gin_trgm_ops)",
+]
+
+SQLITE_USER_SEARCH_DDL = [
+    # Prefix matches are written as range scans on these expression indexes
+    "CREATE INDEX IF NOT EXISTS ix_users_username_lower ON users (lower(username))",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email))",
+]
+
+def ensure_user_search_schema(connection):
+    """Create the indexes behind user search if missing (same as the Alembic migration on PostgreSQL)"""
+    dialect = connection.dialect.name
+    statements = PG_USER_SEARCH_DDL if dialect == "postgresql" else SQLITE_USER_SEARCH_DDL if dialect == "sqlite" else []
+    for statement in statements:
+        connection.execute(text(statement))
+
+# Recent results, expiring after a few seconds
+user_search_cache = LRUCache(settings.USER_SEARCH_CACHE_SIZE, settings.USER_SEARCH_CACHE_TTL_SECONDS)
+
+def _escape_like(term):
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _prefix_match(expression, term, dialect):
+    if dialect == "sqlite":
+        # SQLite only uses an index for LIKE under case_sensitive_like; a range does the same job
+        return (expression >= term) & (expression < term + "\uffff")
+    return expression.like(_escape_like(term) + "%", escape="\\")
+
+def user_search_statement(term, limit, dialect):
+    username = func.lower(User.username)
+    email = func.lower(User.email)
+    matches = [_prefix_match(username, term, dialect), _prefix_match(email, term, dialect)]
+    if len(term) >= MIN_SUBSTRING_LENGTH:
+        pattern = f"%{_escape_like(term)}%"
+        matches += [username.like(pattern, escape="\\"), email.like(pattern, escape="\\")]
+    rank = case(
+        (username == term, 0),
+        (_prefix_match(username, term, dialect), 1),
+        (_prefix_match(email, term, dialect), 2),
+        else_=3,
+    )
+    return (
+        select(User)
+        .where(User.is_active == True, or_(*matches))
+        .order_by(rank, func.length(User.username), username)
+        .limit(limit)
+    )
+
+def search_users(session: Session, q: str, limit: int):
+    """Active users whose username or email starts with (or, from three characters, contains) ``q``.
+
+    Exact username matches rank first, then username prefixes, then email
+    prefixes, then substring matches; shorter usernames first within each.
+    Results are cached briefly per (query, limit) since autocomplete sends
+    the same short prefixes over and over.
+    """
+    term = q.strip().lower()
+    if not term:
+        return []
+    key = (term, limit)
+    cached = user_search_cache.get(key)
+    if cached is not None:
+        metrics.increment("user_search_cache_total", result="hit")
+        return cached
+    metrics.increment("user_search_cache_total", result="miss")
+    dialect = session.get_bind().dialect.name
+    users = [UserResponse.model_validate(user) for user in session.exec(user_search_statement(term, limit, dialect))]
+    user_search_cache.put(key, users)
+    return users
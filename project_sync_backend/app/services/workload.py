@@ -0,0 +1,75 @@
+from sqlalchemy import and_, case, func
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, select
+from project_sync_backend.app.models.issue import IssueListView, IssueStatus
+from project_sync_backend.app.models.user import User, UserWorkload, WorkloadIssue
+
+# Statuses that count as work in hand (OPEN issues have no assignee yet)
+WORKLOAD_STATUSES = {
+    IssueStatus.ASSIGNED: "assigned",
+    IssueStatus.IN_PROGRESS: "in_progress",
+    IssueStatus.REVIEW: "review",
+}
+
+def workload_statement(project_id=None):
+    """Active users with their open issue counts, least loaded first.
+
+    The counts and the oldest open date come from one GROUP BY over
+    issue_list_view (ix_issue_list_view_workload); the oldest issue itself
+    is joined back on (assignee, created_at).
+    """
+    def open_issues(model):
+        criteria = [model.assigned_to_id.is_not(None), model.status.in_(list(WORKLOAD_STATUSES))]
+        if project_id is not None:
+            criteria.append(model.project_id == project_id)
+        return criteria
+
+    counts = (
+        select(
+            IssueListView.assigned_to_id,
+            *[
+                func.sum(case((IssueListView.status == issue_status, 1), else_=0)).label(name)
+                for issue_status, name in WORKLOAD_STATUSES.items()
+            ],
+            func.min(IssueListView.created_at).label("oldest_at"),
+        )
+        .where(*open_issues(IssueListView))
+        .group_by(IssueListView.assigned_to_id)
+        .subquery()
+    )
+    oldest = aliased(IssueListView)
+    total_open = sum(func.coalesce(getattr(counts.c, name), 0) for name in WORKLOAD_STATUSES.values())
+    return (
+        select(
+            User.id, User.username, User.role,
+            *[func.coalesce(getattr(counts.c, name), 0).label(name) for name in WORKLOAD_STATUSES.values()],
+            oldest.id.label("oldest_id"), oldest.title.label("oldest_title"),
+            oldest.status.label("oldest_status"), oldest.created_at.label("oldest_created_at"),
+        )
+        .select_from(User)
+        .join(counts, counts.c.assigned_to_id == User.id, isouter=True)
+        .join(
+            oldest,
+            and_(oldest.assigned_to_id == User.id, oldest.created_at == counts.c.oldest_at, *open_issues(oldest)),
+            isouter=True,
+        )
+        .where(User.is_active == True)
+        .order_by(total_open, User.username, oldest.id)
+    )
+
+def assignee_workload(session: Session, project_id=None):
+    workloads = {}
+    for row in session.exec(workload_statement(project_id)).mappings():
+        # Two open issues created at the same instant would repeat the user
+        if row["id"] in workloads:
+            continue
+        counts = {name: row[name] for name in WORKLOAD_STATUSES.values()}
+        oldest_open = None
+        if row["oldest_id"] is not None:
+            oldest_open = WorkloadIssue(id=row["oldest_id"], title=row["oldest_title"],
+                                        status=row["oldest_status"], created_at=row["oldest_created_at"])
+        workloads[row["id"]] = UserWorkload(
+            id=row["id"], username=row["username"], role=row["role"],
+            total_open=sum(counts.values()), oldest_open=oldest_open, **counts,
+        )
+    return list(workloads.values())
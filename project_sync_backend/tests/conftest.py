@@ -0,0 +1,80 @@
+import os
+import tempfile
+import pytest
+
+# Settings are read when the app modules are imported, so point them at a
+# throwaway SQLite database first
+_database_dir = tempfile.mkdtemp(prefix="project_sync_tests_")
+_database_url = f"sqlite:///{os.path.join(_database_dir, 'test.db')}"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("APP_DATABASE_URL", _database_url)
+os.environ.setdefault("ALEMBIC_DATABASE_URL", _database_url)
+os.environ.setdefault("ENVIRONMENT", "test")
+
+from datetime import timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, SQLModel
+from project_sync_backend.app.api.v1.endpoints.auth import create_access_token
+from project_sync_backend.app.db.database import engine as app_engine
+from project_sync_backend.app.main import app
+from project_sync_backend.app.models.projects import Project
+from project_sync_backend.app.models.user import User, UserRole
+from project_sync_backend.app.services.bootstrap import bootstrap_schema
+from project_sync_backend.app.services.idempotency import response_cache
+from project_sync_backend.app.services.response_cache import project_response_cache
+from project_sync_backend.app.services.user_search import user_search_cache
+
+@pytest.fixture
+def engine():
+    SQLModel.metadata.create_all(app_engine)
+    yield app_engine
+    SQLModel.metadata.drop_all(app_engine)
+    with app_engine.begin() as connection:
+        # Tables created by bootstrap_schema rather than the models
+        connection.execute(text("DROP TABLE IF EXISTS issues_fts"))
+        connection.execute(text("DROP TABLE IF EXISTS issues_fts_keys"))
+
+@pytest.fixture
+def client(engine):
+    """TestClient for the app (lifespan included) on a freshly bootstrapped database"""
+    with engine.begin() as connection:
+        bootstrap_schema(connection)
+    for cache in (response_cache, user_search_cache, project_response_cache.backend):
+        cache.clear()
+    with TestClient(app) as client:
+        yield client
+
+@pytest.fixture
+def make_user(engine):
+    """Factory creating a user; returns ``(user id, auth headers)``"""
+    def make_user(username, role=UserRole.DEVELOPER):
+        with Session(engine) as session:
+            user = User(email=f"{username}@example.com", username=username, password_hash="x", role=role)
+            session.add(user)
+            session.commit()
+            token = create_access_token({"sub": user.email}, timedelta(minutes=30))
+            return user.id, {"Authorization": f"Bearer {token}"}
+    return make_user
+
+@pytest.fixture
+def pm_and_project(engine):
+    """A project manager and one of their projects, as (user id, project id)"""
+    with Session(engine) as session:
+        pm = User(email="pm@example.com", username="pm", password_hash="x", role=UserRole.PM)
+        session.add(pm)
+        session.flush()
+        project = Project(title="Project", description="", pm_id=pm.id)
+        session.add(project)
+        session.commit()
+        return pm.id, project.id
+
+@pytest.fixture
+def postgres_url():
+    """A scratch PostgreSQL database (TEST_POSTGRES_URL, without a driver); tests needing it skip otherwise"""
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    return url
@@ -0,0 +1,64 @@
+import asyncio
+from project_sync_backend.app.core.admission import CRITICAL, STANDARD, AdmissionControlMiddleware, RoutePolicy
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.db.database import connection_usage
+from project_sync_backend.app.models.user import UserRole
+
+def test_db_saturation_sheds_expensive_routes_first(client, make_user, monkeypatch):
+    _, headers = make_user("lead", UserRole.PM)
+    monkeypatch.setattr(connection_usage, "in_use", int(connection_usage.capacity * settings.ADMISSION_EXPENSIVE_SHED_UTILIZATION))
+
+    shed = client.get("/api/v1/projects/", headers=headers)
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == str(settings.ADMISSION_RETRY_AFTER_SECONDS)
+    assert client.get("/api/v1/issues/my-issues", headers=headers).status_code == 503
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    assert client.get("/", headers=headers).status_code == 200
+
+    # Once the budget is exhausted only the critical lanes get through
+    monkeypatch.setattr(connection_usage, "in_use", connection_usage.capacity)
+    assert client.post("/api/v1/projects/", headers=headers, json={"title": "Busy"}).status_code == 503
+    assert client.get("/").status_code == 503
+    for path in ("/live", "/health", "/metrics"):
+        assert client.get(path).status_code == 200, path
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+def run_concurrently(middleware, paths):
+    async def request(path):
+        messages = []
+        async def receive():
+            return {"type": "http.request", "body": b""}
+        async def send(message):
+            messages.append(message)
+        await middleware({"type": "http", "method": "GET", "path": path}, receive, send)
+        return messages[0]["status"]
+
+    async def run():
+        return await asyncio.gather(*[request(path) for path in paths])
+    return asyncio.run(run())
+
+def test_requests_beyond_a_lane_queue_are_shed(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_QUEUE_TIMEOUT_SECONDS", 5)
+
+    async def slow_app(scope, receive, send):
+        await asyncio.sleep(0.05)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = AdmissionControlMiddleware(slow_app, [
+        RoutePolicy("health", None, r"^/health$", CRITICAL, 8, 8),
+        RoutePolicy("default", None, r"", STANDARD, 1, 1),
+    ])
+    # One runs, one waits, the third finds the queue full; the health lane is separate
+    assert run_concurrently(middleware, ["/a", "/b", "/c", "/health"]) == [200, 200, 503, 200]
+
+def test_requests_waiting_too_long_are_shed(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_QUEUE_TIMEOUT_SECONDS", 0.01)
+
+    async def slow_app(scope, receive, send):
+        await asyncio.sleep(0.1)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = AdmissionControlMiddleware(slow_app, [RoutePolicy("default", None, r"", STANDARD, 1, 4)])
+    assert run_concurrently(middleware, ["/a", "/b"]) == [200, 503]
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+from sqlalchemy import update
+from sqlmodel import Session, select
+from project_sync_backend.app.models.issue import Issue, IssueArchive
+from project_sync_backend.app.models.user import UserRole
+from project_sync_backend.app.services.archive import archive_completed_issues
+
+def create_issue(client, headers, project_id, title):
+    response = client.post("/api/v1/issues/", headers=headers, json={
+        "title": title, "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+def complete(client, headers, issue_id):
+    response = client.put(f"/api/v1/issues/{issue_id}/status", headers=headers, json={"status": "COMPLETED"})
+    assert response.status_code == 200, response.text
+
+def backdate(engine, issue_id, days):
+    with engine.begin() as connection:
+        connection.execute(update(Issue.__table__).where(Issue.id == UUID(issue_id))
+                           .values(updated_at=datetime.utcnow() - timedelta(days=days)))
+
+def titles(response):
+    assert response.status_code == 200, response.text
+    return sorted(row["title"] for row in response.json())
+
+def test_old_completed_issues_move_to_the_archive_and_stay_listable(client, engine, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    old = create_issue(client, headers, project_id, "Old and done")
+    recent = create_issue(client, headers, project_id, "Recently done")
+    create_issue(client, headers, project_id, "Open")
+    for issue_id in (old, recent):
+        complete(client, headers, issue_id)
+    backdate(engine, old, 90)
+
+    assert archive_completed_issues(engine, older_than_days=30, batch_size=1, pause_seconds=0) == 1
+
+    with Session(engine) as session:
+        assert session.get(Issue, UUID(old)) is None
+        assert session.exec(select(IssueArchive.title)).all() == ["Old and done"]
+    assert titles(client.get("/api/v1/issues/", headers=headers)) == ["Open", "Recently done"]
+    assert titles(client.get("/api/v1/issues/", headers=headers, params={"include_archived": True})) == [
+        "Old and done", "Open", "Recently done",
+    ]
+    archived = client.get("/api/v1/issues/", headers=headers, params={"include_archived": True, "fields": "id,status"})
+    assert {"id": old, "status": "COMPLETED"} in archived.json()
+
+    # Archived issues still count towards the project's totals
+    project = client.get("/api/v1/projects/", headers=headers).json()[0]
+    assert (project["issues_count"], project["open_issues"], project["completed_issues"]) == (3, 1, 2)
+
+def test_archive_runs_in_batches_until_nothing_is_left(client, engine, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    for index in range(5):
+        issue_id = create_issue(client, headers, project_id, f"Done {index}")
+        complete(client, headers, issue_id)
+        backdate(engine, issue_id, 90)
+
+    assert archive_completed_issues(engine, older_than_days=30, batch_size=2, max_batches=2, pause_seconds=0) == 4
+    assert archive_completed_issues(engine, older_than_days=30, batch_size=2, pause_seconds=0) == 1
+    assert titles(client.get("/api/v1/issues/", headers=headers)) == []
+    assert len(client.get("/api/v1/issues/", headers=headers, params={"include_archived": True}).json()) == 5
@@ -0,0 +1,62 @@
+from uuid import uuid4
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.models.user import UserRole
+from project_sync_backend.app.services.archive import archive_completed_issues
+
+def batch(client, path, headers, ids):
+    return client.get(path, headers=headers, params={"ids": ",".join(str(item_id) for item_id in ids)})
+
+def test_issue_batch_keys_results_by_id_and_scopes_them_like_the_list(client, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, pm_headers = make_user("lead", UserRole.PM)
+    developer_id, developer_headers = make_user("dev")
+    mine, other = [
+        client.post("/api/v1/issues/", headers=pm_headers, json={
+            "title": title, "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+        }).json()["id"]
+        for title in ("Mine", "Other")
+    ]
+    client.put(f"/api/v1/issues/{mine}/assign", headers=pm_headers, json={"assigned_to_id": str(developer_id)})
+    missing = str(uuid4())
+
+    response = batch(client, "/api/v1/issues/batch", pm_headers, [other, missing, mine, other])
+    assert response.status_code == 200
+    body = response.json()
+    assert list(body["items"]) == [other, missing, mine]
+    assert body["items"][mine]["assignee_name"] == "dev" and body["items"][missing] is None
+    assert body["not_found"] == [missing]
+
+    body = batch(client, "/api/v1/issues/batch", developer_headers, [mine, other]).json()
+    assert body["items"][other] is None and body["not_found"] == [other]
+
+def test_project_and_user_batches(client, make_user, pm_and_project):
+    pm_id, project_id = pm_and_project
+    lead_id, pm_headers = make_user("lead", UserRole.PM)
+    _, developer_headers = make_user("dev")
+    missing = str(uuid4())
+
+    body = batch(client, "/api/v1/projects/batch", developer_headers, [project_id, missing]).json()
+    assert body["items"][str(project_id)]["title"] == "Project" and body["not_found"] == [missing]
+
+    body = batch(client, "/api/v1/users/batch", pm_headers, [pm_id, lead_id]).json()
+    assert [user["username"] for user in body["items"].values()] == ["pm", "lead"]
+    assert batch(client, "/api/v1/users/batch", developer_headers, [pm_id]).status_code == 403
+
+def test_batch_ids_are_validated(client, make_user, monkeypatch):
+    _, headers = make_user("lead", UserRole.PM)
+    monkeypatch.setattr(settings, "BATCH_LOOKUP_MAX_IDS", 2)
+    for ids in (["not-a-uuid"], [""], [uuid4(), uuid4(), uuid4()]):
+        assert batch(client, "/api/v1/issues/batch", headers, ids).status_code == 400, ids
+
+def test_issue_batch_finds_archived_issues(client, engine, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    issue_id = client.post("/api/v1/issues/", headers=headers, json={
+        "title": "Done", "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+    }).json()["id"]
+    client.put(f"/api/v1/issues/{issue_id}/status", headers=headers, json={"status": "COMPLETED"})
+    # A cutoff in the future archives every completed issue
+    assert archive_completed_issues(engine, older_than_days=-1, pause_seconds=0) == 1
+
+    body = batch(client, "/api/v1/issues/batch", headers, [issue_id]).json()
+    assert body["items"][issue_id]["title"] == "Done" and body["not_found"] == []
@@ -0,0 +1,49 @@
+from project_sync_backend.app.models.user import UserRole
+
+def board(client, headers, project_id, **params):
+    response = client.get(f"/api/v1/projects/{project_id}/board", headers=headers, params=params)
+    assert response.status_code == 200, response.text
+    return {column["status"]: column for column in response.json()["columns"]}
+
+def titles(column):
+    return [issue["title"] for issue in column["items"]]
+
+def test_board_groups_issues_by_status_and_pages_each_column(client, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, pm_headers = make_user("lead", UserRole.PM)
+    developer_id, developer_headers = make_user("dev")
+    issue_ids = [
+        client.post("/api/v1/issues/", headers=pm_headers, json={
+            "title": f"Issue {index}", "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+        }).json()["id"]
+        for index in range(6)
+    ]
+    client.put(f"/api/v1/issues/{issue_ids[0]}/assign", headers=pm_headers, json={"assigned_to_id": str(developer_id)})
+
+    columns = board(client, pm_headers, project_id, limit=2)
+    assert list(columns) == ["OPEN", "ASSIGNED", "IN_PROGRESS", "REVIEW", "COMPLETED"]
+    assert columns["ASSIGNED"]["total"] == 1 and titles(columns["ASSIGNED"]) == ["Issue 0"]
+    assert columns["ASSIGNED"]["next_cursor"] is None
+    assert columns["COMPLETED"] == {"status": "COMPLETED", "total": 0, "items": [], "next_cursor": None}
+
+    # Newest first, then the rest of the column through its cursor
+    opened = columns["OPEN"]
+    assert opened["total"] == 5 and titles(opened) == ["Issue 5", "Issue 4"]
+    seen = titles(opened)
+    while opened["next_cursor"]:
+        opened = board(client, pm_headers, project_id, limit=2, status="OPEN", cursor=opened["next_cursor"])["OPEN"]
+        seen += titles(opened)
+    assert seen == ["Issue 5", "Issue 4", "Issue 3", "Issue 2", "Issue 1"]
+
+    # Developers only see the issues assigned to them
+    columns = board(client, developer_headers, project_id)
+    assert columns["OPEN"]["total"] == 0
+    assert titles(columns["ASSIGNED"]) == ["Issue 0"]
+
+def test_board_rejects_cursor_without_status_and_unknown_projects(client, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    response = client.get(f"/api/v1/projects/{project_id}/board", headers=headers, params={"cursor": "abc"})
+    assert response.status_code == 400
+    response = client.get("/api/v1/projects/00000000-0000-0000-0000-000000000000/board", headers=headers)
+    assert response.status_code == 404
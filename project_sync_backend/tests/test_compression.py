@@ -0,0 +1,76 @@
+import asyncio
+import zlib
+from starlette.applications import Starlette
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+from project_sync_backend.app.core.compression import CompressionMiddleware, negotiate_encoding
+from project_sync_backend.app.models.user import UserRole
+
+def test_large_json_responses_are_gzipped(client, engine, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    for index in range(20):
+        client.post("/api/v1/issues/", headers=headers, json={
+            "title": f"Issue {index}", "description": "Steps to reproduce", "priority": "LOW", "issue_type": "BUG",
+            "project_id": str(project_id),
+        })
+
+    response = client.get("/api/v1/issues/", headers={**headers, "Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert len(response.json()) == 20
+
+    plain = client.get("/api/v1/issues/", headers={**headers, "Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == response.json()
+
+def test_small_responses_and_304s_are_sent_as_is(client, make_user):
+    _, headers = make_user("lead", UserRole.PM)
+    small = client.get("/live", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers and small.headers["vary"] == "Accept-Encoding"
+
+    etag = client.get("/api/v1/projects/", headers=headers).headers["etag"]
+    not_modified = client.get("/api/v1/projects/", headers={**headers, "If-None-Match": etag, "Accept-Encoding": "gzip"})
+    assert not_modified.status_code == 304 and "content-encoding" not in not_modified.headers
+
+def test_streamed_responses_are_compressed_chunk_by_chunk():
+    chunks = [b'{"rows": [', b"1, 2, 3", b"]}"]
+
+    async def stream(request):
+        async def body():
+            for chunk in chunks:
+                yield chunk
+        return StreamingResponse(body(), media_type="application/json")
+
+    app = CompressionMiddleware(Starlette(routes=[Route("/stream", stream)]), minimum_size=1024)
+    scope = {"type": "http", "method": "GET", "path": "/stream", "query_string": b"", "root_path": "",
+             "headers": [(b"accept-encoding", b"gzip")]}
+    messages = []
+    disconnected = asyncio.Event()
+
+    async def receive():
+        # The client stays connected until the response is complete
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if not message.get("more_body", True):
+            disconnected.set()
+
+    asyncio.run(app(scope, receive, send))
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip" and b"content-length" not in headers
+    # Each chunk is flushed, so the client can decode it as soon as it arrives
+    decompressor = zlib.decompressobj(31)
+    bodies = [decompressor.decompress(message["body"]) for message in messages[1:]]
+    assert bodies[:len(chunks)] == chunks and not any(bodies[len(chunks):])
+    assert decompressor.eof
+
+def test_encoding_negotiation():
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("*") == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity") is None
+    assert negotiate_encoding("") is None
@@ -0,0 +1,58 @@
+from project_sync_backend.app.models.user import UserRole
+
+def create_issue(client, headers, project_id, title="Crash"):
+    response = client.post("/api/v1/issues/", headers=headers, json={
+        "title": title, "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+def revalidate(client, path, headers, etag):
+    return client.get(path, headers={**headers, "If-None-Match": etag})
+
+def test_issue_list_is_revalidated_until_an_issue_changes(client, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    issue_id = create_issue(client, headers, project_id)
+
+    first = client.get("/api/v1/issues/", headers=headers)
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"') and first.headers["cache-control"] == "private, no-cache"
+
+    not_modified = revalidate(client, "/api/v1/issues/", headers, etag)
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    # Strong form, lists of candidates and * match as well
+    assert revalidate(client, "/api/v1/issues/", headers, etag[2:]).status_code == 304
+    assert revalidate(client, "/api/v1/issues/", headers, f'"other", {etag}').status_code == 304
+    assert revalidate(client, "/api/v1/issues/", headers, "*").status_code == 304
+
+    response = client.put(f"/api/v1/issues/{issue_id}/status", headers=headers, json={"status": "COMPLETED"})
+    assert response.status_code == 200
+    changed = revalidate(client, "/api/v1/issues/", headers, etag)
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert changed.json()[0]["status"] == "COMPLETED"
+
+def test_list_etags_depend_on_the_caller_and_the_fieldset(client, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, lead_headers = make_user("lead", UserRole.PM)
+    _, other_headers = make_user("other", UserRole.PM)
+    create_issue(client, lead_headers, project_id)
+
+    etag = client.get("/api/v1/issues/", headers=lead_headers).headers["etag"]
+    assert revalidate(client, "/api/v1/issues/", other_headers, etag).status_code == 200
+    sparse = client.get("/api/v1/issues/", headers={**lead_headers, "If-None-Match": etag}, params={"fields": "title"})
+    assert sparse.status_code == 200 and sparse.headers["etag"] != etag
+
+def test_project_detail_and_dashboard_answer_304(client, make_user):
+    _, headers = make_user("lead", UserRole.PM)
+    project_id = client.post("/api/v1/projects/", headers=headers, json={"title": "Roadmap"}).json()["id"]
+    for path in (f"/api/v1/projects/{project_id}", "/api/v1/projects/", "/api/v1/dashboard/stats"):
+        response = client.get(path, headers=headers)
+        assert response.status_code == 200, (path, response.text)
+        assert revalidate(client, path, headers, response.headers["etag"]).status_code == 304, path
+
+    etag = client.get(f"/api/v1/projects/{project_id}", headers=headers).headers["etag"]
+    response = client.put(f"/api/v1/projects/{project_id}", headers=headers, json={"title": "Renamed"})
+    assert response.status_code == 200, response.text
+    assert revalidate(client, f"/api/v1/projects/{project_id}", headers, etag).status_code == 200
@@ -0,0 +1,64 @@
+from uuid import uuid4
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, select
+from project_sync_backend.app.models.issue import IssueEvent, IssueEventType, IssueStatus
+from project_sync_backend.app.models.user import UserRole
+from project_sync_backend.app.services.events import IssueEventWriter, issue_event_writer
+
+def logged_events(engine):
+    with Session(engine) as session:
+        events = session.exec(select(IssueEvent).order_by(IssueEvent.id)).all()
+        return [(e.event_type, e.from_status, e.to_status) for e in events]
+
+def test_committed_transitions_are_logged_once_the_writer_flushes(client, engine, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, pm_headers = make_user("lead", UserRole.PM)
+    developer_id, developer_headers = make_user("dev")
+    issue_id = client.post("/api/v1/issues/", headers=pm_headers, json={
+        "title": "Crash", "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+    }).json()["id"]
+    client.put(f"/api/v1/issues/{issue_id}/assign", headers=pm_headers, json={"assigned_to_id": str(developer_id)})
+    # Refused, so nothing is logged for it
+    refused = client.put(f"/api/v1/issues/{issue_id}/status", headers=developer_headers, json={"status": "COMPLETED"})
+    assert refused.status_code == 403
+    client.put(f"/api/v1/issues/{issue_id}/status", headers=developer_headers, json={"status": "IN_PROGRESS"})
+
+    issue_event_writer.stop()
+    issue_event_writer.start()
+    assert logged_events(engine) == [
+        (IssueEventType.CREATED, None, IssueStatus.OPEN),
+        (IssueEventType.ASSIGNED, IssueStatus.OPEN, IssueStatus.ASSIGNED),
+        (IssueEventType.STATUS_CHANGED, IssueStatus.ASSIGNED, IssueStatus.IN_PROGRESS),
+    ]
+
+def event_row(status):
+    return IssueEvent(issue_id=uuid4(), project_id=uuid4(), event_type=IssueEventType.CREATED,
+                      to_status=status, actor_id=uuid4()).model_dump()
+
+@pytest.fixture
+def inserts(engine):
+    """Statements inserting into issue_events, as executed"""
+    executed = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO issue_events"):
+            executed.append(statement)
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+def test_buffered_events_are_inserted_in_batches(engine, inserts):
+    writer = IssueEventWriter(engine, batch_size=5, flush_interval=60)
+    writer.start()
+    try:
+        for _ in range(5):
+            writer.enqueue([event_row(IssueStatus.OPEN)])
+    finally:
+        writer.stop()
+    assert len(logged_events(engine)) == 5
+    assert len(inserts) == 1
+
+def test_events_are_written_directly_when_the_writer_is_stopped(engine, inserts):
+    writer = IssueEventWriter(engine)
+    writer.enqueue([event_row(IssueStatus.OPEN) for _ in range(3)])
+    assert len(logged_events(engine)) == 3 and len(inserts) == 1
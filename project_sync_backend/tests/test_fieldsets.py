@@ -0,0 +1,38 @@
+from project_sync_backend.app.models.user import UserRole
+
+def test_issue_list_returns_only_the_requested_fields(client, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    issue_id = client.post("/api/v1/issues/", headers=headers, json={
+        "title": "Crash", "description": "Long text", "priority": "HIGH", "issue_type": "BUG", "project_id": str(project_id),
+    }).json()["id"]
+
+    response = client.get("/api/v1/issues/", headers=headers, params={"fields": "status, title"})
+    assert response.status_code == 200
+    # id is always included; fields come back in model order
+    assert response.json() == [{"title": "Crash", "id": issue_id, "status": "OPEN"}]
+    assert list(response.json()[0]) == ["title", "id", "status"]
+
+    full = client.get("/api/v1/issues/", headers=headers).json()[0]
+    assert full["description"] == "Long text" and full["project_title"] == "Project"
+
+def test_project_list_projects_counts_and_names_on_request(client, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    client.post("/api/v1/issues/", headers=headers, json={
+        "title": "Crash", "description": "", "priority": "HIGH", "issue_type": "BUG", "project_id": str(project_id),
+    })
+
+    assert client.get("/api/v1/projects/", headers=headers, params={"fields": "title"}).json() == [
+        {"title": "Project", "id": str(project_id)}
+    ]
+    assert client.get("/api/v1/projects/", headers=headers, params={"fields": "open_issues,project_manager_name"}).json() == [
+        {"id": str(project_id), "open_issues": 1, "project_manager_name": "pm"}
+    ]
+
+def test_unknown_fields_are_rejected(client, make_user):
+    _, headers = make_user("lead", UserRole.PM)
+    for path in ("/api/v1/issues/", "/api/v1/projects/"):
+        response = client.get(path, headers=headers, params={"fields": "title,password_hash"})
+        assert response.status_code == 400
+        assert "password_hash" in response.json()["detail"]
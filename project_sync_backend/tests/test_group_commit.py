@@ -0,0 +1,107 @@
+import threading
+import uuid
+import pytest
+from fastapi import HTTPException
+from sqlmodel import Session, func, select
+from project_sync_backend.app.models.issue import Issue, IssueCreate, IssuePriority, IssueType
+from project_sync_backend.app.services.group_commit import IssueCreateBatcher, PendingCreate
+
+class RecordingBatcher(IssueCreateBatcher):
+    """Remembers the size of every batch it writes"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batches = []
+
+    def _commit(self, batch):
+        self.batches.append(len(batch))
+        super()._commit(batch)
+
+def payload(project_id, title="Issue"):
+    return IssueCreate(title=title, description="", priority=IssuePriority.LOW,
+                       issue_type=IssueType.BUG, project_id=project_id)
+
+def create_concurrently(batcher, requests):
+    """Run ``batcher.create`` for every (user id, payload) at once; returns results or errors in order"""
+    outcomes = [None] * len(requests)
+    start = threading.Barrier(len(requests))
+
+    def run(index, user_id, issue):
+        start.wait()
+        try:
+            outcomes[index] = batcher.create(user_id, issue)
+        except HTTPException as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=run, args=(index, *request)) for index, request in enumerate(requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    assert not any(thread.is_alive() for thread in threads)
+    return outcomes
+
+def issue_count(engine):
+    with Session(engine) as session:
+        return session.exec(select(func.count()).select_from(Issue)).one()
+
+def test_full_batches_hand_leftovers_to_the_next_leader(engine, pm_and_project):
+    pm_id, project_id = pm_and_project
+    batcher = RecordingBatcher(engine, max_batch=4, max_wait_ms=1000)
+
+    outcomes = create_concurrently(batcher, [(pm_id, payload(project_id, f"Issue {i}")) for i in range(10)])
+
+    assert sorted(batcher.batches) == [2, 4, 4]
+    assert sorted(outcome.title for outcome in outcomes) == sorted(f"Issue {i}" for i in range(10))
+    assert len({outcome.id for outcome in outcomes}) == 10
+    assert issue_count(engine) == 10
+
+def test_unknown_project_only_fails_its_own_request(engine, pm_and_project):
+    pm_id, project_id = pm_and_project
+    batcher = RecordingBatcher(engine, max_batch=3, max_wait_ms=1000)
+
+    outcomes = create_concurrently(batcher, [
+        (pm_id, payload(project_id, "First")),
+        (pm_id, payload(uuid.uuid4(), "Lost")),
+        (pm_id, payload(project_id, "Second")),
+    ])
+
+    assert batcher.batches == [3]
+    assert outcomes[1].status_code == 404
+    assert {outcomes[0].title, outcomes[2].title} == {"First", "Second"}
+    assert issue_count(engine) == 2
+
+def test_request_left_without_a_leader_takes_over(engine, pm_and_project):
+    pm_id, project_id = pm_and_project
+    batcher = RecordingBatcher(engine, max_batch=10, max_wait_ms=10, write_timeout=0.2)
+    # A leader that queued its request and then never ran
+    orphan = PendingCreate(pm_id, payload(project_id, "Orphan"))
+    batcher._pending.append(orphan)
+
+    created = batcher.create(pm_id, payload(project_id, "Rescuer"))
+
+    assert created.title == "Rescuer"
+    assert orphan.finished and orphan.result.title == "Orphan"
+    assert batcher.batches == [2]
+
+def test_request_whose_batch_hangs_gets_a_503(engine, pm_and_project):
+    pm_id, project_id = pm_and_project
+    release = threading.Event()
+
+    class StuckBatcher(IssueCreateBatcher):
+        def _write(self, batch):
+            release.wait(10)
+            super()._write(batch)
+
+    batcher = StuckBatcher(engine, max_batch=2, max_wait_ms=1000, write_timeout=0.2)
+    outcomes = []
+    leader = threading.Thread(target=lambda: outcomes.append(batcher.create(pm_id, payload(project_id, "Leader"))))
+    leader.start()
+    # Fills the batch, which then blocks in _write
+    with pytest.raises(HTTPException) as excinfo:
+        batcher.create(pm_id, payload(project_id, "Follower"))
+    assert excinfo.value.status_code == 503
+
+    release.set()
+    leader.join(timeout=10)
+    assert outcomes[0].title == "Leader"
@@ -0,0 +1,40 @@
+import time
+import pytest
+from sqlalchemy import create_engine
+from project_sync_backend.app.db.health import health_probe
+
+@pytest.fixture
+def fresh_probe():
+    """Forget earlier tests' probes; request it before ``client`` so the app's startup probe is counted"""
+    health_probe.__init__(health_probe.engine)
+
+def wait_for_first_probe():
+    deadline = time.monotonic() + 5
+    while health_probe.snapshot()["total_checks"] == 0:
+        assert time.monotonic() < deadline, "the startup probe never ran"
+        time.sleep(0.01)
+
+def test_health_endpoints_serve_the_cached_probe(fresh_probe, client):
+    wait_for_first_probe()
+    checks = health_probe.snapshot()["total_checks"]
+
+    for path in ("/health", "/db-status", "/health", "/db-status"):
+        assert client.get(path).status_code == 200
+    health = client.get("/health").json()
+    assert health["status"] == "healthy" and health["probe"]["healthy"] is True
+    assert health_probe.snapshot()["total_checks"] == checks
+
+    # ?deep=1 runs a live probe
+    assert client.get("/db-status", params={"deep": 1}).json()["probe"]["total_checks"] == checks + 1
+
+def test_failed_probe_degrades_health_and_readiness(fresh_probe, client, tmp_path, monkeypatch):
+    wait_for_first_probe()
+    monkeypatch.setattr(health_probe, "engine", create_engine(f"sqlite:///{tmp_path}/missing/dir/db.sqlite3"))
+
+    health = client.get("/health", params={"deep": 1}).json()
+    assert health["status"] == "degraded" and health["database"] == "disconnected"
+    assert health["probe"]["failure_streak"] == 1 and health["probe"]["last_error"]
+    assert client.get("/db-status").json()["database_connected"] is False
+    assert client.get("/ready").status_code == 503
+    # Liveness does not depend on the database
+    assert client.get("/live").status_code == 200
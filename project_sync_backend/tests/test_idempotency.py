@@ -0,0 +1,51 @@
+from sqlmodel import Session, func, select
+from project_sync_backend.app.models.issue import Issue
+from project_sync_backend.app.models.projects import Project
+from project_sync_backend.app.models.user import UserRole
+from project_sync_backend.app.services.idempotency import response_cache
+
+def count(engine, model):
+    with Session(engine) as session:
+        return session.exec(select(func.count()).select_from(model)).one()
+
+def test_retried_project_creation_replays_the_first_response(client, engine, make_user):
+    _, headers = make_user("lead", UserRole.PM)
+    headers = {**headers, "Idempotency-Key": "create-1"}
+    body = {"title": "Roadmap", "description": "Q3"}
+
+    first = client.post("/api/v1/projects/", headers=headers, json=body)
+    assert first.status_code == 200 and "Idempotent-Replayed" not in first.headers
+
+    # Once from the in-process cache, once from the stored row
+    for _ in range(2):
+        retry = client.post("/api/v1/projects/", headers=headers, json=body)
+        assert retry.status_code == 200
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert retry.json() == first.json()
+        response_cache.clear()
+    assert count(engine, Project) == 1
+
+def test_key_reused_with_a_different_body_is_rejected(client, engine, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("dev")
+    headers = {**headers, "Idempotency-Key": "issue-1"}
+    body = {"title": "Crash", "description": "", "priority": "HIGH", "issue_type": "BUG", "project_id": str(project_id)}
+
+    assert client.post("/api/v1/issues/", headers=headers, json=body).status_code == 200
+    response = client.post("/api/v1/issues/", headers=headers, json={**body, "title": "Another crash"})
+    assert response.status_code == 422
+    assert count(engine, Issue) == 1
+
+def test_keys_are_scoped_per_user_and_endpoint(client, engine, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, first_headers = make_user("first", UserRole.PM)
+    _, second_headers = make_user("second", UserRole.PM)
+    issue = {"title": "Crash", "description": "", "priority": "HIGH", "issue_type": "BUG", "project_id": str(project_id)}
+
+    for headers in (first_headers, second_headers):
+        headers = {**headers, "Idempotency-Key": "same"}
+        assert client.post("/api/v1/issues/", headers=headers, json=issue).status_code == 200
+        assert client.post("/api/v1/projects/", headers=headers, json={"title": "Other"}).status_code == 200
+    assert count(engine, Issue) == 2
+    # pm_and_project's project plus one per user
+    assert count(engine, Project) == 3
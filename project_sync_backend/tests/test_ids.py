@@ -0,0 +1,28 @@
+import time
+from uuid import UUID
+from project_sync_backend.app.core.ids import uuid7
+from project_sync_backend.app.models.user import UserRole
+
+def test_uuid7_layout_and_ordering():
+    before_ms = time.time_ns() // 1_000_000
+    ids = [uuid7() for _ in range(10000)]
+    after_ms = time.time_ns() // 1_000_000
+
+    assert ids == sorted(ids) and len(set(ids)) == len(ids)
+    first = ids[0]
+    assert first.version == 7 and first.variant == "specified in RFC 4122"
+    assert before_ms <= first.int >> 80 <= after_ms
+
+def test_created_issues_and_projects_get_time_ordered_ids(client, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    projects = [client.post("/api/v1/projects/", headers=headers, json={"title": f"P{i}"}).json()["id"] for i in range(3)]
+    issues = [
+        client.post("/api/v1/issues/", headers=headers, json={
+            "title": f"I{i}", "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+        }).json()["id"]
+        for i in range(3)
+    ]
+    for ids in (projects, issues):
+        assert all(UUID(value).version == 7 for value in ids)
+        assert [UUID(value) for value in ids] == sorted(UUID(value) for value in ids)
@@ -0,0 +1,241 @@
+import random
+import threading
+import uuid
+from argparse import Namespace
+from pathlib import Path
+import pytest
+from alembic.config import Config
+from alembic.runtime.environment import EnvironmentContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlmodel import Session, SQLModel
+from project_sync_backend.app.models.issue import Issue, IssueStatus
+from project_sync_backend.app.services import partitioning
+from project_sync_backend.app.services.read_model import backfill_issue_list_view
+from project_sync_backend.app.services.search import ensure_search_schema
+
+PARTITIONS = 4
+ALEMBIC_DIR = Path(__file__).parents[1] / "alembic"
+MIGRATION = "f4c2a8d61e93"
+PREVIOUS_REVISION = "e1b49c7a3d65"
+
+@pytest.fixture
+def pg_engine(postgres_url):
+    engine = create_engine(make_url(postgres_url).set(drivername="postgresql+psycopg2"))
+    with engine.begin() as connection:
+        for table in ("issues", partitioning.SHADOW_TABLE, partitioning.OLD_TABLE):
+            connection.execute(text(f"DROP TABLE IF EXISTS {table} CASCADE"))
+        connection.execute(text(f"DROP FUNCTION IF EXISTS {partitioning.SYNC_FUNCTION}() CASCADE"))
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        ensure_search_schema(connection)
+        # Added outside the models, to check that prepare copies indexes from the catalog
+        connection.execute(text("CREATE INDEX ix_issues_title ON issues (title)"))
+    yield engine
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE IF EXISTS {partitioning.OLD_TABLE}, {partitioning.SHADOW_TABLE} CASCADE"))
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    SQLModel.metadata.drop_all(engine)
+    engine.dispose()
+
+def seed(engine, projects=20, issues_per_project=100):
+    with engine.begin() as connection:
+        user_id = connection.execute(text(
+            "INSERT INTO users (id, email, username, password_hash, role, is_active, created_at) "
+            "VALUES (gen_random_uuid(), 'pm@example.com', 'pm', 'x', 'PM', true, now()) RETURNING id"
+        )).scalar()
+        project_ids = connection.execute(text(
+            "INSERT INTO projects (id, title, description, is_active, pm_id, created_at, updated_at) "
+            "SELECT gen_random_uuid(), 'Project ' || n, '', true, :user_id, now(), now() "
+            "FROM generate_series(1, :projects) n RETURNING id"
+        ), {"user_id": user_id, "projects": projects}).scalars().all()
+        connection.execute(text(
+            "INSERT INTO issues (id, title, description, priority, issue_type, status, project_id, created_by_id, created_at, updated_at) "
+            "SELECT gen_random_uuid(), 'Issue ' || n, 'seeded', 'LOW', 'BUG', 'OPEN', p.id, :user_id, now(), now() "
+            "FROM unnest(CAST(:project_ids AS uuid[])) p(id), generate_series(1, :per_project) n"
+        ), {"user_id": user_id, "project_ids": [str(project_id) for project_id in project_ids], "per_project": issues_per_project})
+        backfill_issue_list_view(connection)
+    return user_id, project_ids
+
+def write_concurrently(engine, user_id, project_ids, stop, counts):
+    """Insert, update and delete issues one transaction at a time until ``stop`` is set"""
+    rng = random.Random(7)
+    while not stop.is_set():
+        with engine.begin() as connection:
+            operation = rng.choice(("insert", "update", "delete"))
+            if operation == "insert":
+                connection.execute(text(
+                    "INSERT INTO issues (id, title, description, priority, issue_type, status, project_id, created_by_id, created_at, updated_at) "
+                    "VALUES (:id, 'Concurrent', '', 'HIGH', 'BUG', 'OPEN', :project_id, :user_id, now(), now())"
+                ), {"id": uuid.uuid4(), "project_id": rng.choice(project_ids), "user_id": user_id})
+            else:
+                issue_id = connection.execute(text("SELECT id FROM issues ORDER BY random() LIMIT 1")).scalar()
+                if operation == "update":
+                    connection.execute(text(
+                        "UPDATE issues SET status = 'IN_PROGRESS', title = title || '!', updated_at = now() WHERE id = :id"
+                    ), {"id": issue_id})
+                else:
+                    connection.execute(text("DELETE FROM issues WHERE id = :id"), {"id": issue_id})
+        counts[operation] += 1
+
+def index_names(engine, table):
+    with engine.connect() as connection:
+        return set(partitioning._index_names(connection, table))
+
+def unpartition(engine):
+    with engine.begin() as connection:
+        return partitioning.unpartition_issues(connection)
+
+def run_migration(engine, upgrade, x_arguments=()):
+    """Run the partitioning revision up (from PREVIOUS_REVISION) or down, as ``alembic -x ...`` would"""
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.cmd_opts = Namespace(x=list(x_arguments))
+    script = ScriptDirectory.from_config(config)
+
+    def steps(revision, context):
+        if upgrade:
+            return script._upgrade_revs(MIGRATION, revision)
+        return script._downgrade_revs(PREVIOUS_REVISION, revision)
+
+    with engine.connect() as connection:
+        with EnvironmentContext(config, script, fn=steps) as environment:
+            environment.configure(connection=connection)
+            with environment.begin_transaction():
+                environment.run_migrations()
+        connection.commit()
+
+def test_prepare_backfill_swap_under_concurrent_writes_then_downgrade(pg_engine):
+    user_id, project_ids = seed(pg_engine)
+    original_indexes = index_names(pg_engine, "issues")
+    assert {"issues_pkey", "ix_issues_search_vector", "ix_issues_completed_updated_at", "ix_issues_title"} <= original_indexes
+
+    with pg_engine.begin() as connection:
+        assert partitioning.prepare_partitioned_issues(connection, PARTITIONS)
+
+    stop = threading.Event()
+    counts = {"insert": 0, "update": 0, "delete": 0}
+    writer = threading.Thread(target=write_concurrently, args=(pg_engine, user_id, project_ids, stop, counts))
+    writer.start()
+    try:
+        batches = partitioning.backfill_partitioned_issues(pg_engine, batch_size=50, pause_seconds=0.01)
+    finally:
+        stop.set()
+        writer.join()
+    assert batches >= 2000 // 50
+    assert all(count > 0 for count in counts.values()), counts
+
+    with pg_engine.begin() as connection:
+        assert partitioning.swap_partitioned_issues(connection)
+
+    with pg_engine.connect() as connection:
+        status = partitioning.partitioning_status(connection)
+        assert status == {"state": "partitioned", "partitions": PARTITIONS, "old_table_kept": True}
+        # The trigger kept every concurrent write; both tables hold the same rows
+        for left, right in (("issues", partitioning.OLD_TABLE), (partitioning.OLD_TABLE, "issues")):
+            differing = connection.execute(text(
+                f"SELECT count(*) FROM (SELECT id, project_id, title, status, updated_at FROM {left} "
+                f"EXCEPT SELECT id, project_id, title, status, updated_at FROM {right}) d"
+            )).scalar()
+            assert differing == 0
+        assert connection.execute(text("SELECT count(*) FROM issues WHERE search_vector IS NULL")).scalar() == 0
+    assert index_names(pg_engine, "issues") == original_indexes
+    assert index_names(pg_engine, partitioning.OLD_TABLE) == {
+        partitioning._renamed_index(name, partitioning.OLD_TABLE) for name in original_indexes
+    }
+
+    # Lookups prune to one partition, and ORM writes of loaded issues work
+    with Session(pg_engine) as session:
+        issue_id = session.exec(text("SELECT id FROM issue_list_view WHERE title = 'Issue 1' LIMIT 1")).scalar()
+        assert partitioning.partition_pruning_enabled(session)
+        statement = partitioning.issue_by_id(session, issue_id)
+        compiled = statement.compile(pg_engine, compile_kwargs={"literal_binds": True})
+        plan = "\n".join(session.exec(text(f"EXPLAIN (ANALYZE, COSTS OFF) {compiled}")).scalars())
+        assert plan.count("(never executed)") == PARTITIONS - 1, plan
+        issue = partitioning.load_issue(session, issue_id)
+        issue.status = IssueStatus.COMPLETED
+        session.commit()
+        # A lagging read model only costs the pruning
+        lagging_id = session.exec(text("SELECT id FROM issue_list_view WHERE title = 'Issue 2' LIMIT 1")).scalar()
+        session.exec(text("DELETE FROM issue_list_view WHERE id = :id"), params={"id": lagging_id})
+        assert session.exec(partitioning.issue_by_id(session, lagging_id)).first() is None
+        assert partitioning.load_issue(session, lagging_id).id == lagging_id
+        assert session.get(Issue, lagging_id).title == "Issue 2"
+        session.rollback()
+    with pg_engine.begin() as connection:
+        assert connection.execute(text("SELECT status FROM issues WHERE id = :id"), {"id": issue_id}).scalar() == "COMPLETED"
+        connection.execute(text(
+            "INSERT INTO issues (id, title, description, priority, issue_type, status, project_id, created_by_id, created_at, updated_at) "
+            "VALUES (gen_random_uuid(), 'After swap', '', 'LOW', 'BUG', 'OPEN', :project_id, :user_id, now(), now())"
+        ), {"project_id": project_ids[0], "user_id": user_id})
+        expected_rows = connection.execute(text("SELECT count(*) FROM issues")).scalar()
+
+    assert unpartition(pg_engine)
+
+    with pg_engine.connect() as connection:
+        assert partitioning.partitioning_status(connection) == {"state": "unpartitioned"}
+        assert connection.execute(text("SELECT count(*) FROM issues")).scalar() == expected_rows
+        assert connection.execute(text("SELECT status FROM issues WHERE id = :id"), {"id": issue_id}).scalar() == "COMPLETED"
+        assert connection.execute(text("SELECT to_regclass(:name)"), {"name": partitioning.OLD_TABLE}).scalar() is None
+    assert index_names(pg_engine, "issues") == original_indexes
+
+def test_unpartition_before_swap_drops_the_shadow_table(pg_engine):
+    seed(pg_engine, projects=2, issues_per_project=5)
+    with pg_engine.begin() as connection:
+        partitioning.prepare_partitioned_issues(connection, PARTITIONS)
+
+    assert not unpartition(pg_engine)
+
+    with pg_engine.begin() as connection:
+        assert partitioning.partitioning_status(connection) == {"state": "unpartitioned"}
+        # The sync trigger is gone too, so writes to issues work as before
+        connection.execute(text("UPDATE issues SET title = 'Renamed'"))
+
+def test_migration_partitions_only_when_asked_and_downgrades_symmetrically(pg_engine):
+    seed(pg_engine, projects=5, issues_per_project=20)
+    with pg_engine.begin() as connection:
+        # The migration recreates the indexes issues had at its revision
+        connection.execute(text("DROP INDEX ix_issues_title"))
+        connection.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL PRIMARY KEY)"))
+        connection.execute(text("INSERT INTO alembic_version VALUES (:revision)"), {"revision": PREVIOUS_REVISION})
+    original_indexes = index_names(pg_engine, "issues")
+
+    def schema():
+        with pg_engine.connect() as connection:
+            return (
+                partitioning.partitioning_status(connection),
+                connection.execute(text("SELECT count(*) FROM issues")).scalar(),
+                connection.execute(text(
+                    "SELECT array_agg(a.attname ORDER BY a.attname) FROM pg_constraint c "
+                    "JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = ANY(c.conkey) "
+                    "WHERE c.conrelid = 'issues'::regclass AND c.contype = 'p'"
+                )).scalar(),
+                connection.execute(text(
+                    "SELECT count(*) FROM pg_constraint WHERE conrelid = 'issues'::regclass AND contype = 'f'"
+                )).scalar(),
+                connection.execute(text("SELECT version_num FROM alembic_version")).scalar(),
+            )
+
+    run_migration(pg_engine, upgrade=True)
+    assert schema() == ({"state": "unpartitioned"}, 100, ["id"], 3, MIGRATION)
+    run_migration(pg_engine, upgrade=False)
+
+    run_migration(pg_engine, upgrade=True, x_arguments=[f"issue_partitions={PARTITIONS}"])
+    assert schema() == (
+        {"state": "partitioned", "partitions": PARTITIONS, "old_table_kept": False}, 100, ["id", "project_id"], 3, MIGRATION
+    )
+    assert index_names(pg_engine, "issues") == original_indexes
+    with Session(pg_engine) as session:
+        assert session.exec(text("SELECT count(*) FROM issues WHERE search_vector @@ to_tsquery('issue')")).scalar() == 100
+
+    # Without the option the downgrade leaves the partitioned table alone
+    run_migration(pg_engine, upgrade=False)
+    assert schema()[0]["state"] == "partitioned"
+    with pg_engine.begin() as connection:
+        connection.execute(text("UPDATE alembic_version SET version_num = :revision"), {"revision": MIGRATION})
+
+    run_migration(pg_engine, upgrade=False, x_arguments=[f"issue_partitions={PARTITIONS}"])
+    assert schema() == ({"state": "unpartitioned"}, 100, ["id"], 3, PREVIOUS_REVISION)
+    assert index_names(pg_engine, "issues") == original_indexes
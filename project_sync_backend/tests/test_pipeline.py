@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import create_engine, event, func, literal, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session
+from project_sync_backend.app.db.pipeline import run_pipelined
+from project_sync_backend.app.db.timeouts import is_query_timeout
+
+STATEMENTS = [
+    select(literal(1).label("one")),
+    select(func.now().label("now")),
+    select(literal("text").label("word")),
+]
+
+@pytest.fixture(params=["psycopg2", "psycopg"])
+def pg_engine(request, postgres_url):
+    engine = create_engine(make_url(postgres_url).set(drivername=f"postgresql+{request.param}"))
+    yield engine
+    engine.dispose()
+
+def test_pipelined_rows_match_sequential_execution(pg_engine):
+    executed = []
+    event.listen(pg_engine, "before_cursor_execute", lambda *args: executed.append(args[2]))
+    with Session(pg_engine) as session:
+        expected = [[tuple(row) for row in session.execute(statement)] for statement in STATEMENTS]
+        executed.clear()
+        rows = run_pipelined(session, STATEMENTS)
+    assert rows[0] == expected[0] and rows[2] == expected[2]
+    assert rows[1] == expected[1]  # now() is fixed within the transaction
+    assert len(executed) == len(STATEMENTS)
+
+def test_statement_timeout_is_reported_as_query_timeout(pg_engine):
+    with Session(pg_engine) as session:
+        session.execute(text("SET LOCAL statement_timeout = 50"))
+        with pytest.raises(OperationalError) as excinfo:
+            run_pipelined(session, [select(literal(1)), select(func.pg_sleep(1))])
+    assert is_query_timeout(excinfo.value)
+
+def test_sqlite_runs_statements_one_by_one(engine):
+    with Session(engine) as session:
+        assert run_pipelined(session, [select(literal(1)), select(literal("a"))]) == [[(1,)], [("a",)]]
@@ -0,0 +1,72 @@
+import threading
+import time
+from sqlalchemy import insert, text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session
+from project_sync_backend.app.core import query_budget
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.metrics import metrics
+from project_sync_backend.app.db.timeouts import QueryBudget, current_budget, is_query_timeout
+from project_sync_backend.app.models.issue import Issue
+from project_sync_backend.app.models.user import UserRole
+from project_sync_backend.app.services.read_model import rebuild_issue_list_view
+
+def seed_issues(engine, pm_id, project_id, count):
+    with engine.begin() as connection:
+        connection.execute(insert(Issue.__table__), [
+            {"id": Issue().id, "title": f"Issue {index}", "description": "", "priority": "LOW", "issue_type": "BUG",
+             "status": "OPEN", "project_id": project_id, "created_by_id": pm_id}
+            for index in range(count)
+        ])
+        rebuild_issue_list_view(connection)
+
+def statement_timeouts(route):
+    counters = metrics.snapshot()["counters"]
+    return sum(c["value"] for c in counters if c["name"] == "statement_timeouts_total" and c["labels"]["route"] == route)
+
+def test_queries_over_the_route_budget_answer_504(client, engine, make_user, pm_and_project, monkeypatch):
+    pm_id, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    seed_issues(engine, pm_id, project_id, 2000)
+    assert len(client.get("/api/v1/issues/", headers=headers).json()) == 2000
+
+    # Leave the issue list no time at all; other routes keep their budget
+    monkeypatch.setattr(query_budget, "QueryBudget",
+                        lambda route, timeout_ms: QueryBudget(route, 0 if route == "issues_list" else timeout_ms))
+    timeouts = statement_timeouts("issues_list")
+
+    response = client.get("/api/v1/issues/", headers=headers)
+    assert response.status_code == 504
+    assert statement_timeouts("issues_list") == timeouts + 1
+    assert client.get(f"/api/v1/projects/{project_id}", headers=headers).status_code == 200
+
+def test_cancelling_a_budget_interrupts_its_running_query(engine):
+    budget = QueryBudget("test", 60000)
+    errors = []
+
+    def run_long_query():
+        token = current_budget.set(budget)
+        try:
+            with Session(engine) as session:
+                session.exec(text(
+                    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 100000000) SELECT count(*) FROM n"
+                )).one()
+        except OperationalError as e:
+            errors.append(e)
+        finally:
+            current_budget.reset(token)
+
+    worker = threading.Thread(target=run_long_query)
+    worker.start()
+    time.sleep(0.2)
+    # What the middleware does when the client disconnects
+    assert budget.cancel() == 1
+    worker.join(5)
+    assert not worker.is_alive()
+    assert len(errors) == 1 and is_query_timeout(errors[0])
+
+def test_requests_outside_the_api_have_no_budget():
+    middleware = query_budget.QueryBudgetMiddleware(None)
+    assert middleware._budget_for("GET", "/health") is None
+    assert middleware._budget_for("GET", "/api/v1/issues/").timeout_ms == settings.STATEMENT_TIMEOUT_EXPENSIVE_MS
+    assert middleware._budget_for("POST", "/api/v1/issues/").timeout_ms == settings.STATEMENT_TIMEOUT_MS
@@ -0,0 +1,39 @@
+import pytest
+from sqlmodel import Session, select
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.models.issue import IssueListView
+from project_sync_backend.app.models.user import UserRole
+from project_sync_backend.app.services.read_model import DENORMALIZED_COLUMNS, rebuild_issue_list_view
+
+def list_rows(engine):
+    with Session(engine) as session:
+        rows = session.exec(select(IssueListView).order_by(IssueListView.id)).all()
+        return [tuple(getattr(row, name) for name in DENORMALIZED_COLUMNS) for row in rows]
+
+@pytest.mark.parametrize("group_commit", [False, True])
+def test_writes_keep_the_read_model_in_step_with_issues(client, engine, make_user, monkeypatch, group_commit):
+    monkeypatch.setattr(settings, "GROUP_COMMIT_ENABLED", group_commit)
+    _, pm_headers = make_user("lead", UserRole.PM)
+    developer_id, developer_headers = make_user("dev")
+    project_id = client.post("/api/v1/projects/", headers=pm_headers, json={"title": "Roadmap"}).json()["id"]
+    issue_ids = [
+        client.post("/api/v1/issues/", headers=pm_headers, json={
+            "title": title, "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": project_id,
+        }).json()["id"]
+        for title in ("First", "Second")
+    ]
+    client.put(f"/api/v1/issues/{issue_ids[0]}/assign", headers=pm_headers, json={"assigned_to_id": str(developer_id)})
+    client.put(f"/api/v1/issues/{issue_ids[0]}/status", headers=developer_headers, json={"status": "IN_PROGRESS"})
+    client.put(f"/api/v1/projects/{project_id}", headers=pm_headers, json={"title": "Renamed"})
+
+    mine = client.get("/api/v1/issues/", headers=developer_headers).json()
+    assert [(issue["title"], issue["status"], issue["project_title"], issue["assignee_name"], issue["creator_name"])
+            for issue in mine] == [("First", "IN_PROGRESS", "Renamed", "dev", "lead")]
+    listed = {issue["title"]: issue for issue in client.get("/api/v1/issues/", headers=pm_headers).json()}
+    assert listed["Second"]["project_title"] == "Renamed" and listed["Second"]["assignee_name"] is None
+
+    # What the writes maintained incrementally equals a rebuild from the normalized tables
+    live = list_rows(engine)
+    with engine.begin() as connection:
+        assert rebuild_issue_list_view(connection) == 2
+    assert list_rows(engine) == live
@@ -0,0 +1,54 @@
+import time
+import pytest
+from sqlalchemy import insert, select
+from sqlmodel import SQLModel
+from project_sync_backend.app.db.database import create_database_engine, session_router
+from project_sync_backend.app.models.user import User, UserRole
+
+@pytest.fixture
+def replica(engine, tmp_path, monkeypatch):
+    """A second SQLite database standing in for a replica that has not caught up"""
+    replica = create_database_engine(f"sqlite:///{tmp_path}/replica.db")
+    SQLModel.metadata.create_all(replica)
+    monkeypatch.setattr(session_router, "replica", replica)
+    monkeypatch.setattr(session_router, "window_seconds", 0.5)
+    monkeypatch.setattr(session_router, "_recent_writes", {})
+    yield replica
+    replica.dispose()
+
+def copy_users(engine, replica):
+    with engine.connect() as source, replica.begin() as target:
+        target.execute(insert(User.__table__), [dict(row) for row in source.execute(select(User.__table__)).mappings()])
+
+def issue_titles(client, headers):
+    response = client.get("/api/v1/issues/", headers=headers)
+    assert response.status_code == 200, response.text
+    return [issue["title"] for issue in response.json()]
+
+def test_reads_go_to_the_replica_except_right_after_a_write(client, engine, replica, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, writer_headers = make_user("writer", UserRole.PM)
+    _, reader_headers = make_user("reader", UserRole.PM)
+    copy_users(engine, replica)
+
+    response = client.post("/api/v1/issues/", headers=writer_headers, json={
+        "title": "Fresh", "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+    })
+    assert response.status_code == 200, response.text
+
+    # The writer reads its own write from the primary; others read the lagging replica
+    assert issue_titles(client, writer_headers) == ["Fresh"]
+    assert issue_titles(client, reader_headers) == []
+
+    time.sleep(0.6)
+    assert issue_titles(client, writer_headers) == []
+
+def test_without_a_replica_every_read_uses_the_primary(client, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, headers = make_user("writer", UserRole.PM)
+    assert not session_router.has_replica
+    client.post("/api/v1/issues/", headers=headers, json={
+        "title": "Fresh", "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+    })
+    assert issue_titles(client, headers) == ["Fresh"]
+    assert session_router.read_bind("writer@example.com") is session_router.primary
@@ -0,0 +1,96 @@
+import threading
+import time
+from datetime import datetime, timedelta
+import pytest
+from sqlmodel import Session
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.core.lru import LRUCache
+from project_sync_backend.app.models.issue import Issue, IssueStatus
+from project_sync_backend.app.models.user import UserRole
+from project_sync_backend.app.services.archive import archive_completed_issues
+from project_sync_backend.app.services.response_cache import MemoryCacheBackend, ProjectResponseCache, SQLiteCacheBackend
+
+def test_lru_evicts_least_recently_used_and_expires_entries():
+    cache = LRUCache(2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    assert cache.put("c", 3) == 1
+    assert cache.get("b") is None and cache.get("a") == 1
+    cache.put("d", 4, ttl=0)
+    assert cache.get("d") is None
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteCacheBackend(str(tmp_path / "cache.sqlite3"), 10, 60)
+    return MemoryCacheBackend(10, 60)
+
+def test_concurrent_misses_load_once_and_bumps_invalidate(backend):
+    cache = ProjectResponseCache(backend)
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"calls": len(calls)}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load(("projects",), ("projects",), load)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1 and results == [{"calls": 1}] * 8
+    assert cache.get_or_load(("projects",), ("projects",), load) == {"calls": 1}
+
+    cache.bump("issues")
+    assert cache.get_or_load(("projects",), ("projects",), load) == {"calls": 1}
+    cache.bump("projects")
+    assert cache.get_or_load(("projects",), ("projects",), load) == {"calls": 2}
+
+def test_loader_errors_reach_every_waiting_caller(backend):
+    cache = ProjectResponseCache(backend)
+
+    def fail():
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        cache.get_or_load(("project", 1), ("projects",), fail)
+    assert cache.get_or_load(("project", 1), ("projects",), lambda: {"found": True}) == {"found": True}
+
+def test_waiting_callers_load_themselves_after_the_statement_timeout(backend, monkeypatch):
+    monkeypatch.setattr(settings, "STATEMENT_TIMEOUT_MS", 50)
+    cache = ProjectResponseCache(backend)
+    release = threading.Event()
+
+    def stuck():
+        release.wait(5)
+        return {"loaded_by": "leader"}
+
+    leader = threading.Thread(target=lambda: cache.get_or_load(("projects",), ("projects",), stuck))
+    leader.start()
+    time.sleep(0.05)
+    try:
+        assert cache.get_or_load(("projects",), ("projects",), lambda: {"loaded_by": "waiter"}) == {"loaded_by": "waiter"}
+    finally:
+        release.set()
+        leader.join()
+
+def test_archiving_invalidates_cached_project_lists(client, engine, pm_and_project, make_user):
+    pm_id, project_id = pm_and_project
+    _, headers = make_user("lead", UserRole.PM)
+    with Session(engine) as session:
+        session.add(Issue(title="Done", description="", priority="LOW", issue_type="BUG", status=IssueStatus.COMPLETED,
+                          project_id=project_id, created_by_id=pm_id, updated_at=datetime.utcnow() - timedelta(days=30)))
+        session.commit()
+    before = client.get("/api/v1/projects/", headers=headers)
+
+    assert archive_completed_issues(engine, older_than_days=7) == 1
+
+    after = client.get("/api/v1/projects/", headers=headers)
+    # Same totals (archived issues still count), but the cached entry is not served again
+    assert after.json()[0]["issues_count"] == before.json()[0]["issues_count"] == 1
+    assert after.headers["etag"] != before.headers["etag"]
+    assert client.get("/api/v1/projects/", headers={**headers, "If-None-Match": before.headers["etag"]}).status_code == 200
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlmodel import Session, func, select
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.models.analytics import IssueDailyRollup, StatusDurationRollup
+from project_sync_backend.app.models.issue import IssueEvent
+from project_sync_backend.app.models.user import UserRole
+from project_sync_backend.app.services.events import issue_event_writer
+from project_sync_backend.app.services.rollups import rebuild_rollups
+
+def rollup_rows(engine):
+    with Session(engine) as session:
+        daily = {
+            (row.project_id, row.day): (row.opened, row.assigned, row.completed)
+            for row in session.exec(select(IssueDailyRollup))
+        }
+        durations = {
+            (row.project_id, row.day, row.status): (round(row.total_seconds, 3), row.transitions)
+            for row in session.exec(select(StatusDurationRollup))
+        }
+    return daily, durations
+
+def flush_events():
+    issue_event_writer.stop()
+    issue_event_writer.start()
+
+def walk_issue_through_statuses(client, make_user, project_id):
+    """Create an issue, assign it, start it and complete it; returns the PM's headers"""
+    _, pm_headers = make_user("lead", UserRole.PM)
+    developer_id, developer_headers = make_user("dev")
+    issue_id = client.post("/api/v1/issues/", headers=pm_headers, json={
+        "title": "Rollup", "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+    }).json()["id"]
+    steps = [
+        (f"/api/v1/issues/{issue_id}/assign", pm_headers, {"assigned_to_id": str(developer_id)}),
+        # Reassigning keeps the issue ASSIGNED; the clock for that status keeps running
+        (f"/api/v1/issues/{issue_id}/assign", pm_headers, {"assigned_to_id": str(developer_id)}),
+        (f"/api/v1/issues/{issue_id}/status", developer_headers, {"status": "IN_PROGRESS"}),
+        (f"/api/v1/issues/{issue_id}/status", pm_headers, {"status": "COMPLETED"}),
+    ]
+    for path, headers, body in steps:
+        response = client.put(path, headers=headers, json=body)
+        assert response.status_code == 200, response.text
+    return pm_headers
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_live_rollups_match_a_rebuild_from_the_event_log(client, engine, make_user, pm_and_project, monkeypatch, strict):
+    monkeypatch.setattr(settings, "ISSUE_EVENTS_STRICT", strict)
+    _, project_id = pm_and_project
+    pm_headers = walk_issue_through_statuses(client, make_user, project_id)
+    flush_events()
+
+    with Session(engine) as session:
+        assert session.exec(select(func.count()).select_from(IssueEvent)).one() == 5
+    today = datetime.utcnow().date()
+    params = {"start": str(today - timedelta(days=1)), "end": str(today + timedelta(days=1)), "project_id": str(project_id)}
+    series = client.get("/api/v1/dashboard/trends", headers=pm_headers, params=params).json()["series"]
+    assert sum(period["opened"] for period in series) == 1
+    assert sum(period["assigned"] for period in series) == 2
+    assert sum(period["completed"] for period in series) == 1
+    statuses = client.get("/api/v1/dashboard/time-in-status", headers=pm_headers, params=params).json()["statuses"]
+    assert {entry["status"]: entry["transitions"] for entry in statuses} == {"OPEN": 1, "ASSIGNED": 1, "IN_PROGRESS": 1}
+
+    live = rollup_rows(engine)
+    with engine.begin() as connection:
+        rebuild_rollups(connection)
+    assert rollup_rows(engine) == live
@@ -0,0 +1,44 @@
+from sqlalchemy import text
+from project_sync_backend.app.models.user import UserRole
+
+def create_issue(client, headers, project_id, title, description=""):
+    response = client.post("/api/v1/issues/", headers=headers, json={
+        "title": title, "description": description, "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+def search_titles(client, headers, q):
+    response = client.get("/api/v1/issues/search", headers=headers, params={"q": q})
+    assert response.status_code == 200, response.text
+    return [item["title"] for item in response.json()["items"]]
+
+def test_search_ranks_title_matches_and_matches_prefixes(client, make_user, pm_and_project):
+    _, headers = make_user("lead", UserRole.PM)
+    _, project_id = pm_and_project
+    create_issue(client, headers, project_id, "Crash on login", "")
+    create_issue(client, headers, project_id, "Slow dashboard", "crashes sometimes")
+    create_issue(client, headers, project_id, "Typo in footer", "")
+
+    assert search_titles(client, headers, "crash") == ["Crash on login", "Slow dashboard"]
+    assert search_titles(client, headers, "foot") == ["Typo in footer"]
+    assert search_titles(client, headers, "nothing") == []
+
+def test_search_follows_updates_and_deletes_across_vacuum(client, engine, make_user, pm_and_project):
+    _, headers = make_user("lead", UserRole.PM)
+    _, project_id = pm_and_project
+    ids = [create_issue(client, headers, project_id, f"Issue {word}", "") for word in ("alpha", "beta", "gamma")]
+
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM issue_list_view WHERE id = :id"), {"id": ids[0].replace("-", "")})
+        connection.execute(text("DELETE FROM issues WHERE id = :id"), {"id": ids[0].replace("-", "")})
+        connection.execute(text("UPDATE issues SET title = 'Issue delta' WHERE id = :id"), {"id": ids[1].replace("-", "")})
+        # What VACUUM is allowed to do to the implicit rowids of issues
+        connection.execute(text("UPDATE issues SET rowid = rowid + 100"))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM"))
+
+    assert search_titles(client, headers, "alpha") == []
+    assert search_titles(client, headers, "beta") == []
+    assert search_titles(client, headers, "delta") == ["Issue delta"]
+    assert search_titles(client, headers, "gamma") == ["Issue gamma"]
@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, func, select
+from project_sync_backend.app.api.v1.endpoints import sync
+from project_sync_backend.app.core.config import settings
+from project_sync_backend.app.models.issue import Issue
+from project_sync_backend.app.models.user import UserRole
+
+def create_issue_mutation(client_mutation_id, project_id, title="Offline issue"):
+    return {
+        "client_mutation_id": client_mutation_id,
+        "type": "create_issue",
+        "payload": {"title": title, "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id)},
+    }
+
+def push(client, headers, *mutations):
+    response = client.post("/api/v1/sync/push", headers=headers, json={"mutations": list(mutations)})
+    assert response.status_code == 200, response.text
+    return [(result["client_mutation_id"], result["status"], result["status_code"]) for result in response.json()["results"]]
+
+def issue_titles(engine):
+    with Session(engine) as session:
+        return sorted(session.exec(select(Issue.title)).all())
+
+@pytest.fixture
+def pm_headers(make_user):
+    return make_user("lead", UserRole.PM)[1]
+
+def test_push_applies_rejects_and_reports_duplicates_per_mutation(client, engine, pm_headers, pm_and_project):
+    _, project_id = pm_and_project
+    missing_issue = "00000000-0000-0000-0000-000000000000"
+
+    results = push(client, pm_headers,
+                   create_issue_mutation("m1", project_id, "First"),
+                   {"client_mutation_id": "m2", "type": "update_issue_status", "issue_id": missing_issue, "payload": {"status": "COMPLETED"}},
+                   create_issue_mutation("m3", project_id, "Second"))
+    assert results == [("m1", "applied", 200), ("m2", "rejected", 404), ("m3", "applied", 200)]
+
+    # A retried push gets the original results back without applying anything twice
+    results = push(client, pm_headers, create_issue_mutation("m1", project_id, "First"), create_issue_mutation("m4", project_id, "Third"))
+    assert results == [("m1", "duplicate", 200), ("m4", "applied", 200)]
+    assert issue_titles(engine) == ["First", "Second", "Third"]
+
+    # Reusing a mutation id for a different change is rejected, not replayed
+    results = push(client, pm_headers, create_issue_mutation("m1", project_id, "Changed"))
+    assert results == [("m1", "rejected", 422)]
+
+def test_constraint_violation_rejects_only_its_mutation(client, engine, pm_headers, pm_and_project):
+    _, project_id = pm_and_project
+    with engine.begin() as connection:
+        connection.execute(text("CREATE UNIQUE INDEX ix_test_issues_title ON issues (title)"))
+
+    results = push(client, pm_headers,
+                   create_issue_mutation("m1", project_id, "Same"),
+                   create_issue_mutation("m2", project_id, "Same"),
+                   create_issue_mutation("m3", project_id, "Other"))
+    assert results == [("m1", "applied", 200), ("m2", "rejected", 409), ("m3", "applied", 200)]
+    assert issue_titles(engine) == ["Other", "Same"]
+
+def test_mutation_applied_by_a_concurrent_push_is_a_duplicate(client, engine, pm_headers, pm_and_project, monkeypatch):
+    _, project_id = pm_and_project
+    assert push(client, pm_headers, create_issue_mutation("m1", project_id)) == [("m1", "applied", 200)]
+
+    # Miss the first lookup, as if the other push committed right after it
+    load_stored_response = sync.load_stored_response
+    lookups = []
+    def racing_lookup(session, key_hash):
+        lookups.append(key_hash)
+        return None if len(lookups) == 1 else load_stored_response(session, key_hash)
+    monkeypatch.setattr(sync, "load_stored_response", racing_lookup)
+
+    assert push(client, pm_headers, create_issue_mutation("m1", project_id)) == [("m1", "duplicate", 200)]
+    assert len(lookups) == 2
+    assert issue_titles(engine) == ["Offline issue"]
+
+def test_push_limits_the_batch_size(client, engine, pm_headers, pm_and_project, monkeypatch):
+    _, project_id = pm_and_project
+    monkeypatch.setattr(settings, "SYNC_PUSH_MAX_MUTATIONS", 2)
+
+    response = client.post("/api/v1/sync/push", headers=pm_headers, json={
+        "mutations": [create_issue_mutation(f"m{index}", project_id) for index in range(3)]
+    })
+
+    assert response.status_code == 413
+    with Session(engine) as session:
+        assert session.exec(select(func.count()).select_from(Issue)).one() == 0
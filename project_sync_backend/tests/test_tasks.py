@@ -0,0 +1,60 @@
+import threading
+from project_sync_backend.app.core.tasks import BackgroundTaskRunner, task_runner
+from project_sync_backend.app.models.user import UserRole
+from project_sync_backend.app.services import mutations
+
+def test_notifications_run_after_the_commit_only(client, make_user, pm_and_project, monkeypatch):
+    _, project_id = pm_and_project
+    _, pm_headers = make_user("lead", UserRole.PM)
+    developer_id, developer_headers = make_user("dev")
+    sent = []
+    monkeypatch.setattr(mutations, "notify_issue_assigned", lambda issue_id, title, assignee_id, actor_id: sent.append(("assigned", title)))
+    monkeypatch.setattr(mutations, "notify_issue_status_changed",
+                        lambda issue_id, title, from_status, to_status, recipient_ids, actor_id: sent.append(("status", to_status)))
+
+    issue_id = client.post("/api/v1/issues/", headers=pm_headers, json={
+        "title": "Crash", "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+    }).json()["id"]
+    client.put(f"/api/v1/issues/{issue_id}/assign", headers=pm_headers, json={"assigned_to_id": str(developer_id)})
+    refused = client.put(f"/api/v1/issues/{issue_id}/status", headers=developer_headers, json={"status": "COMPLETED"})
+    assert refused.status_code == 403
+    client.put(f"/api/v1/issues/{issue_id}/status", headers=developer_headers, json={"status": "IN_PROGRESS"})
+
+    task_runner.stop()
+    assert sent == [("assigned", "Crash"), ("status", "IN_PROGRESS")]
+    task_runner.start()
+
+def test_failing_tasks_are_retried_with_backoff():
+    runner = BackgroundTaskRunner(workers=2, max_attempts=3, retry_base_seconds=0.01)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("mail server unavailable")
+
+    runner.start()
+    assert runner.submit("flaky", flaky)
+    runner.stop(timeout=5)
+    assert len(attempts) == 3
+
+def test_tasks_are_rejected_when_stopped_or_full():
+    runner = BackgroundTaskRunner(workers=1, max_queue=1)
+    assert not runner.submit("early", lambda: None)
+
+    release = threading.Event()
+    started = threading.Event()
+    def block():
+        started.set()
+        release.wait(5)
+
+    runner.start()
+    try:
+        assert runner.submit("block", block)
+        started.wait(5)
+        assert runner.submit("queued", lambda: None)
+        assert not runner.submit("overflow", lambda: None)
+    finally:
+        release.set()
+        runner.stop(timeout=5)
+    assert not runner.submit("late", lambda: None)
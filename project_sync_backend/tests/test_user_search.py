@@ -0,0 +1,44 @@
+from sqlmodel import Session
+from project_sync_backend.app.models.user import User, UserRole
+
+def add_user(engine, username, email, is_active=True):
+    with Session(engine) as session:
+        session.add(User(username=username, email=email, password_hash="x", role=UserRole.DEVELOPER, is_active=is_active))
+        session.commit()
+
+def search(client, headers, q, **params):
+    response = client.get("/api/v1/auth/users/search", headers=headers, params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return [user["username"] for user in response.json()]
+
+def test_search_ranks_exact_then_prefix_then_substring_matches(client, engine, make_user):
+    _, headers = make_user("lead", UserRole.PM)
+    add_user(engine, "annabel", "annabel@example.com")
+    add_user(engine, "ann", "ann@example.com")
+    add_user(engine, "joanne", "joanne@example.com")
+    add_user(engine, "bob", "anne.bob@example.com")
+    add_user(engine, "annie", "annie@example.com", is_active=False)
+
+    assert search(client, headers, "Ann") == ["ann", "annabel", "bob", "joanne"]
+    assert search(client, headers, "ann", limit=2) == ["ann", "annabel"]
+    # Below three characters only prefixes match
+    assert search(client, headers, "an") == ["ann", "annabel", "bob"]
+    assert search(client, headers, "oan") == ["joanne"]
+    # LIKE wildcards in the query are matched literally
+    assert search(client, headers, "%nn") == []
+    assert search(client, headers, "a_n") == []
+
+def test_registered_users_show_up_despite_cached_results(client, make_user):
+    _, headers = make_user("lead", UserRole.PM)
+    assert search(client, headers, "newc") == []
+    response = client.post("/api/v1/auth/register", json={
+        "email": "newcomer@example.com", "username": "newcomer", "password": "Secret!passw0rd",
+        "confirm_password": "Secret!passw0rd", "role": "Developer",
+    })
+    assert response.status_code == 200, response.text
+    assert search(client, headers, "newc") == ["newcomer"]
+
+def test_search_is_for_project_managers(client, make_user):
+    _, headers = make_user("dev")
+    response = client.get("/api/v1/auth/users/search", headers=headers, params={"q": "dev"})
+    assert response.status_code == 403
@@ -0,0 +1,42 @@
+from project_sync_backend.app.models.user import UserRole
+
+def create_issue(client, headers, project_id, title):
+    return client.post("/api/v1/issues/", headers=headers, json={
+        "title": title, "description": "", "priority": "LOW", "issue_type": "BUG", "project_id": str(project_id),
+    }).json()["id"]
+
+def assign(client, headers, issue_id, user_id):
+    response = client.put(f"/api/v1/issues/{issue_id}/assign", headers=headers, json={"assigned_to_id": str(user_id)})
+    assert response.status_code == 200, response.text
+
+def test_workload_counts_open_issues_per_user_least_loaded_first(client, make_user, pm_and_project):
+    _, project_id = pm_and_project
+    _, pm_headers = make_user("lead", UserRole.PM)
+    busy_id, busy_headers = make_user("busy")
+    light_id, _ = make_user("light")
+    other_project_id = client.post("/api/v1/projects/", headers=pm_headers, json={"title": "Other"}).json()["id"]
+
+    first = create_issue(client, pm_headers, project_id, "First")
+    second = create_issue(client, pm_headers, project_id, "Second")
+    done = create_issue(client, pm_headers, project_id, "Done")
+    elsewhere = create_issue(client, pm_headers, other_project_id, "Elsewhere")
+    for issue_id in (first, second, done):
+        assign(client, pm_headers, issue_id, busy_id)
+    assign(client, pm_headers, elsewhere, light_id)
+    client.put(f"/api/v1/issues/{second}/status", headers=busy_headers, json={"status": "IN_PROGRESS"})
+    client.put(f"/api/v1/issues/{done}/status", headers=pm_headers, json={"status": "COMPLETED"})
+
+    response = client.get("/api/v1/users/workload", headers=pm_headers)
+    assert response.status_code == 200
+    workload = {user["username"]: user for user in response.json()}
+    assert [user["username"] for user in response.json()] == ["lead", "pm", "light", "busy"]
+    busy = workload["busy"]
+    assert (busy["assigned"], busy["in_progress"], busy["review"], busy["total_open"]) == (1, 1, 0, 2)
+    assert busy["oldest_open"]["title"] == "First" and busy["oldest_open"]["status"] == "ASSIGNED"
+    assert workload["light"]["total_open"] == 1 and workload["lead"]["oldest_open"] is None
+
+    in_project = {user["username"]: user["total_open"]
+                  for user in client.get("/api/v1/users/workload", headers=pm_headers, params={"project_id": str(project_id)}).json()}
+    assert in_project == {"lead": 0, "pm": 0, "light": 0, "busy": 2}
+
+    assert client.get("/api/v1/users/workload", headers=busy_headers).status_code == 403